@@ -19,8 +19,9 @@ USAGE:
   co2mpas gui         [-v | -q | --logconf=<conf-file>]
   co2mpas ta          [-f] [-O=<output-folder>] [<input-path>]...
   co2mpas batch       [-v | -q | --logconf=<conf-file>] [-f]
-                      [--overwrite-cache] [-O=<output-folder>]
-                      [--modelconf=<yaml-file>]
+                      [--overwrite-cache] [--cache-folder=<folder>]
+                      [-O=<output-folder>]
+                      [--modelconf=<yaml-file>] [--jobs=<n>]
                       [-D=<key=value>]... [<input-path>]...
   co2mpas demo        [-v | -q | --logconf=<conf-file>] [-f]
                       [<output-folder>]
@@ -48,6 +49,10 @@ OPTIONS:
   --modelconf=<yaml-file>     Path to a model-configuration file, according to YAML:
                                 https://docs.python.org/3.5/library/logging.config.html#logging-config-dictschema
   --overwrite-cache           Overwrite the cached input file.
+  --cache-folder=<folder>     Central folder of the cache files, shared by all input-files;
+                              by default `.co2mpas_cache` next to each input-file.
+  --jobs=<n>                  Number of worker processes to simulate the input-files
+                              in parallel; 0 uses all cpus [default: 1].
   --override, -D=<key=value>  Input data overrides (e.g., `-D fuel_type=diesel`,
                               `-D prediction.nedc_h.vehicle_mass=1000`).
   -l, --list                  List available models.
@@ -61,6 +66,12 @@ Model flags (-D flag.xxx, example -D flag.engineering_mode=True):
  use_selector=<bool>         Select internally the best model to predict both NEDC H/L cycles.
  only_summary=<bool>         Do not save vehicle outputs, just the summary.
  plot_workflow=<bool>        Open workflow-plot in browser, after run finished.
+ plan_jobs=<int>             Number of worker processes to simulate the plan variations
+                             in parallel; 0 uses all cpus.
+ fast_output=<bool>          Stream the output excel-file in constant memory, and
+                             replay the cached output-template instead of cloning it.
+ output_sidecar=<format>     Write also the time-series and parameter tables as
+                             `parquet`, `feather`, or `hdf5` files.
  output_template=<xlsx-file> Clone the given excel-file and appends results into
                              it. By default, results are appended into an empty
                              excel-file. Use `output_template=-` to use
@@ -415,10 +426,21 @@ def _run_batch(opts, **kwargs):
 
     _init_defaults(opts['--modelconf'])
 
+    jobs = opts['--jobs']
+    try:
+        jobs = int(jobs)
+        if jobs < 0:
+            raise ValueError(jobs)
+    except ValueError:
+        msg = "The '--jobs' must be a non-negative integer!  Not %r."
+        raise CmdException(msg % jobs)
+
     kw = {
         'variation': parse_overrides(opts['--override']),
         'overwrite_cache': opts['--overwrite-cache'],
-        'modelconf': opts['--modelconf']
+        'cache_folder': opts['--cache-folder'],
+        'modelconf': opts['--modelconf'],
+        'jobs': jobs
     }
     kw.update(kwargs)
 
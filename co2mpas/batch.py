@@ -11,6 +11,7 @@ It contains functions to process vehicle files.
 import datetime
 import functools
 import logging
+import multiprocessing
 import re
 
 from tqdm import tqdm
@@ -93,6 +94,9 @@ def process_folder_files(input_files, output_folder,
         A callable that will receive a 2 tuple for each file as it is produced::
 
                 (<filepath>, <contents>)
+
+        When files are processed in parallel (`jobs` != 1), the `<contents>`
+        hold just the `summary` and the `output_file_name` of the solution.
     :type result_listener: function
 
     """
@@ -124,23 +128,100 @@ class _custom_tqdm(tqdm):
 
 def _yield_folder_files_results(
         start_time, input_files, output_folder, overwrite_cache=False,
-        model=None, variation=None, type_approval_mode=False, modelconf=None):
-    model = model or vehicle_processing_model()
+        model=None, variation=None, type_approval_mode=False, modelconf=None,
+        jobs=1, cache_folder=None):
     kw = {
         'output_folder': output_folder,
         'overwrite_cache': overwrite_cache,
+        'cache_folder': cache_folder,
         'modelconf': modelconf,
         'timestamp': start_time.strftime('%Y%m%d_%H%M%S'),
         'variation': variation or {},
         'type_approval_mode': type_approval_mode
     }
 
-    _process_vehicle = dsp_utl.SubDispatch(model)
+    it = _custom_tqdm(input_files, bar_format='{l_bar}{bar}{r_bar}')
+
+    if jobs != 1 and len(input_files) > 1:
+        if model is not None:
+            log.warning('A custom `model` cannot be sent to the worker '
+                        'processes, using the default one.')
+        yield from _yield_parallel_results(it, input_files, kw, jobs)
+        return
+
+    _process_vehicle = dsp_utl.SubDispatch(model or vehicle_processing_model())
 
-    for fpath in _custom_tqdm(input_files, bar_format='{l_bar}{bar}{r_bar}'):
+    for fpath in it:
         yield _process_vehicle({'input_file_name': fpath}, kw)
 
 
+#: The vehicle-processing model of a worker process (see :func:`_init_worker`).
+_worker_process_vehicle = None
+
+
+def _init_worker(modelconf=None):
+    """
+    Builds the vehicle-processing model once per worker process.
+
+    :param modelconf:
+        Path of modelconf that has modified the defaults.
+    :type modelconf: str
+    """
+    global _worker_process_vehicle
+    if modelconf:
+        from co2mpas.conf import defaults
+        defaults.load(modelconf)
+    _worker_process_vehicle = dsp_utl.SubDispatch(vehicle_processing_model())
+
+
+def _process_vehicle_in_worker(args):
+    fpath, kw = args
+    res = _worker_process_vehicle({'input_file_name': fpath}, kw)
+
+    # Solutions are not picklable, just send back what the summary needs.
+    if 'solution' not in res:
+        return {}
+    keys = ('summary', 'output_file_name')
+    sol = dsp_utl.selector(keys, res['solution'], allow_miss=True)
+    return {'solution': sol}
+
+
+def _yield_parallel_results(it, input_files, kw, jobs):
+    """
+    Processes the input files in a pool of worker processes.
+
+    The results are streamed back one at a time in the same order of the input
+    files, as in a serial run.
+
+    :param it:
+        Progress-bar iterator over the input files.
+    :type it: tqdm
+
+    :param input_files:
+        A list of input xl-files.
+    :type input_files: list
+
+    :param kw:
+        Inputs of the vehicle-processing model, shared by all files.
+    :type kw: dict
+
+    :param jobs:
+        Number of worker processes. If `None` or 0, it uses all cpus.
+    :type jobs: int
+
+    :return:
+        Reduced solutions with the `summary` and the `output_file_name`.
+    :rtype: generator
+    """
+    processes = jobs or None
+    initargs = (kw['modelconf'],)
+    with multiprocessing.Pool(processes, _init_worker, initargs) as pool:
+        args = ((fpath, kw) for fpath in input_files)
+        results = pool.imap(_process_vehicle_in_worker, args)
+        for _, res in zip(it, results):
+            yield res
+
+
 def _process_folder_files(*args, result_listener=None, **kwargs):
     """
     Process all xls-files in a folder with CO2MPAS-model.
@@ -165,6 +246,16 @@ def _process_folder_files(*args, result_listener=None, **kwargs):
           xlsx-file is created.
     :type output_folder: None,False,str
 
+    :param jobs:
+        Number of worker processes used to process the files in parallel.
+        If `None` or 0, it uses all cpus.
+    :type jobs: int, optional
+
+    :param cache_folder:
+        Central folder of the cache files. If None, caches are stored in a
+        `.co2mpas_cache` folder next to each input file.
+    :type cache_folder: str, optional
+
     """
     start_time = datetime.datetime.today()
 
@@ -349,7 +440,8 @@ def check_first_arg(first, *args):
 
 
 def prepare_data(raw_data, variation, input_file_name, overwrite_cache,
-                 output_folder, timestamp, type_approval_mode, modelconf):
+                 output_folder, timestamp, type_approval_mode, modelconf,
+                 cache_folder=None):
     """
     Prepare the data to be processed.
 
@@ -385,6 +477,10 @@ def prepare_data(raw_data, variation, input_file_name, overwrite_cache,
         Path of modelconf that has modified the defaults.
     :type modelconf: str
 
+    :param cache_folder:
+        Central folder of the cache files.
+    :type cache_folder: str, optional
+
     :return:
         Prepared data.
     :rtype: dict
@@ -445,6 +541,9 @@ def prepare_data(raw_data, variation, input_file_name, overwrite_cache,
     if modelconf:
         flag['modelconf'] = modelconf
 
+    if cache_folder:
+        flag['cache_folder'] = cache_folder
+
     if timestamp is not None:
         flag['timestamp'] = timestamp
 
@@ -509,7 +608,8 @@ def vehicle_processing_model():
         dsp=load_inputs(),
         inputs={
             'input_file_name': 'input_file_name',
-            'overwrite_cache': 'overwrite_cache'
+            'overwrite_cache': 'overwrite_cache',
+            'cache_folder': 'cache_folder'
         },
         outputs={
             'raw_data': 'raw_data',
@@ -527,6 +627,11 @@ def vehicle_processing_model():
         default_value=False
     )
 
+    d.add_data(
+        data_id='cache_folder',
+        default_value=None
+    )
+
     d.add_data(
         data_id='output_folder',
         default_value='.'
@@ -551,7 +656,7 @@ def vehicle_processing_model():
         function=prepare_data,
         inputs=['raw_data', 'variation', 'input_file_name', 'overwrite_cache',
                 'output_folder', 'timestamp', 'type_approval_mode',
-                'modelconf'],
+                'modelconf', 'cache_folder'],
         outputs=['base_data', 'plan_data']
     )
 
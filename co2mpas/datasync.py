@@ -10,8 +10,14 @@ Shift and resample excel-tables; see http://co2mpas.io/usage.html#Synchronizing-
 
 Usage:
   datasync template [-f] [--cycle <cycle>] <excel-file-path>...
+  datasync batch    [-v | -q | --logconf=<conf-file>] [--force | -f]
+                    [--interp <method>] [--no-clone] [--prefix-cols]
+                    [--chunksize <rows>] [--jobs <n>]
+                    [-O <output>] <x-label> <y-label> <jobs-path>
+                    [-i=<label=interp> ...]
   datasync          [-v | -q | --logconf=<conf-file>] [--force | -f]
                     [--interp <method>] [--no-clone] [--prefix-cols]
+                    [--chunksize <rows>]
                     [-O <output>] <x-label> <y-label> <ref-table>
                     [<sync-table> ...] [-i=<label=interp> ...]
   datasync          [-v | -q | --logconf=<conf-file>] (--version | -V)
@@ -39,6 +45,11 @@ Options:
                          If hash(`#`) symbol missing, assumed as sheet-name.
                          If none given, all non-empty sheets of <ref-table> are
                          synced against the 1st one.
+  <jobs-path>            The `batch` jobs: either a folder, where each workbook
+                         is synced against its 1st sheet, or a manifest-file
+                         with a job per line, given as
+                         `<ref-table> [<sync-table> ...]` (lines starting with
+                         hash(`#`) are skipped).
   -O=<output>            Output folder or file path to write the results
                          [default: .]:
 
@@ -52,11 +63,17 @@ Options:
 
   -f, --force            Overwrite excel-file(s) and create any missing
                          intermediate folders.
+  -j, --jobs=<n>         Number of worker processes running the `batch` jobs
+                         [default: 1]; 0 uses all cpus.
   --prefix-cols          Prefix all synced column names with their source
                          sheet-names. By default, only clashing column-names are
                          prefixed.
   --no-clone             Do not clone excel-sheets contained in <ref-table>
                          workbook into output.
+  --chunksize=<rows>     Stream the synced table into the output in chunks of
+                         <rows> rows, after estimating the shifts on a
+                         decimated grid; memory stays bounded for very long
+                         or many-channel logs. Implies --no-clone.
   --interp=<method>      Interpolation method used in the resampling for all
                          signals [default: linear]: 'linear', 'nearest', 'zero',
                          'slinear', 'quadratic', 'cubic', 'barycentric',
@@ -97,6 +114,10 @@ Miscellaneous:
 SUB-COMMANDS:
     template             Generate "empty" input-file for the `datasync` cmd as
                          <excel-file-path>.
+    batch                Sync the tables of many jobs in parallel, writing
+                         their outputs and a `<timestamp>-datasync-summary.csv`
+                         (with the shift of each synced sheet and the duration
+                         of each job) into the -O folder.
 
 
 Examples::
@@ -122,6 +143,9 @@ Examples::
     ## (the ref sheet contains the theoretical velocity profile):
     datasync template --cycle wltp.class3b template.xlsx
     datasync -O ./output times velocities template.xlsx#ref! dyno obd -i alternator_currents=integral -i battery_currents=integral
+
+    ## Sync all workbooks in the `logs` folder with 4 processes:
+    datasync batch -j 4 -O ./output times velocities logs
 """
 
 from collections import OrderedDict, Counter
@@ -129,6 +153,9 @@ import logging
 import os
 import sys
 import functools
+import glob
+import shlex
+import time
 import regex
 from boltons.setutils import IndexedSet
 import docopt
@@ -136,6 +163,7 @@ import numpy.fft as fft
 from pandalone import xleash
 import scipy.integrate as sci_itg
 import scipy.interpolate as sci_itp
+import scipy.linalg as sci_lng
 import functools as fnt
 import numpy as np
 import os.path as osp
@@ -221,6 +249,18 @@ def _get_interp_method(interpolation_method):
                          '%s', interpolation_method, ', '.join(sorted(methods)))
 
 
+def _get_re_sampling(interpolation_method, interpolation_methods=None):
+    re_sampling = collections.defaultdict(
+        lambda: _get_interp_method(interpolation_method)
+    )
+
+    if interpolation_methods:
+        re_sampling.update(
+            {k: _get_interp_method(v) for k, v in interpolation_methods.items()}
+        )
+    return re_sampling
+
+
 def _yield_synched_tables(ref, *data, x_label='times', y_label='velocities',
                           interpolation_method='linear',
                           interpolation_methods=None):
@@ -245,15 +285,7 @@ def _yield_synched_tables(ref, *data, x_label='times', y_label='velocities',
     """
     linear = _get_interp_method('linear')
 
-    re_sampling = collections.defaultdict(
-        lambda: _get_interp_method(interpolation_method)
-    )
-
-    if interpolation_methods:
-        re_sampling.update(
-            {k: _get_interp_method(v) for k, v in interpolation_methods.items()}
-        )
-
+    re_sampling = _get_re_sampling(interpolation_method, interpolation_methods)
 
     dx = float(np.median(np.diff(ref[x_label])) / 10)
     m, M = min(ref[x_label]), max(ref[x_label])
@@ -281,13 +313,168 @@ def _yield_synched_tables(ref, *data, x_label='times', y_label='velocities',
         yield shift, ref.__class__(OrderedDict(r))
 
 
+def _circular_correlations(xr, yr, xp, fp, x0, dx, n, lags, chunksize):
+    """
+    Returns the circular cross-correlations of :func:`compute_shift` on the
+    fine grid `x0 + dx * arange(n)` at the given consecutive lags, computing
+    them chunk by chunk.
+
+    :return:
+        The cross-correlation at each lag.
+    :rtype: numpy.array
+    """
+    corr = np.zeros(len(lags))
+    for i in range(0, n, chunksize):
+        t = np.arange(i, min(i + chunksize, n))
+        Yt = np.interp(x0 + t * dx, xr, yr, left=0, right=0)
+        t = np.arange(i + lags[0], t[-1] + lags[-1] + 1) % n
+        yt = np.interp(x0 + t * dx, xp, fp, left=0, right=0)
+        for j in range(len(lags)):
+            corr[j] += Yt.dot(yt[j:j + len(Yt)])
+    return corr
+
+
+def _yield_shifts(ref, *data, x_label='times', y_label='velocities',
+                  decimation=10, chunksize=2 ** 16):
+    """
+    Yields the shifts of the data respect to the reference signal `y_id`,
+    without building the fine x axes of :func:`_yield_synched_tables`.
+
+    The signals are cross-correlated on the fine grid decimated by
+    `decimation`, then the shift is refined on the fine lags around it with
+    the circular cross-correlation of :func:`compute_shift`, computed chunk by
+    chunk. The window of fine lags is re-centred until its best lag is not
+    on its edges.
+
+    :param dict ref:
+        Reference data.
+    :param data:
+        Data to compute the shifts from.
+    :type data: list[dict]
+    :param str x_label:
+        X label of the reference signal.
+    :param str y_label:
+        Y label of the reference signal.
+    :param int decimation:
+        Decimation factor of the fine grid.
+    :param int chunksize:
+        Number of fine grid points correlated at once.
+
+    :return:
+        The shifts of the data.
+    :rtype: generator
+    """
+    xr, yr = np.asarray(ref[x_label], float), np.asarray(ref[y_label], float)
+    dx = float(np.median(np.diff(xr)) / 10)
+    m, M = xr.min(), xr.max()
+
+    for d in data:
+        m, M = min(min(d[x_label]), m), max(max(d[x_label]), M)
+
+    n, q = int(np.ceil((M + dx - m) / dx)), decimation
+    X = m + np.arange(0, n, q) * dx
+    Y = np.interp(X, xr, yr, left=0, right=0)
+    lo, hi = n // 2 - n, n // 2 - 1  # Lags of `compute_shift`.
+
+    for d in data:
+        xp, fp = np.asarray(d[x_label], float), np.asarray(d[y_label], float)
+        best = compute_shift(Y, np.interp(X, xp, fp, left=0, right=0)) * q
+        corr = {}
+        while True:
+            lags = range(max(best - q, lo), min(best + q, hi) + 1)
+            new = [l for l in lags if l not in corr]
+            if new:
+                new = np.arange(new[0], new[-1] + 1)
+                corr.update(zip(new, _circular_correlations(
+                    xr, yr, xp, fp, m, dx, n, new, chunksize
+                )))
+            # Like `compute_shift`, the greatest lag wins on ties.
+            s = max(lags, key=lambda l: (corr[l], l))
+            if s == best or lags[0] < s < lags[-1]:
+                break
+            best = s
+        yield s * dx
+
+
+def _yield_synched_chunks(headers, tables, shifts, x_label, prefix_cols,
+                          interpolation_method='linear',
+                          interpolation_methods=None, chunksize=2 ** 16,
+                          overlap=64):
+    """
+    Yields the synchronized table in chunks of rows, starting from its headers.
+
+    :param list headers:
+        Headers of the tables.
+    :param list tables:
+        Tables to be synchronized (the first is the reference).
+    :param list shifts:
+        Shifts of the tables respect to the reference (see
+        :func:`_yield_shifts`).
+    :param str x_label:
+        X label of the reference signal.
+    :param bool prefix_cols:
+        Prefix all synced column names with their source sheet-names.
+    :param int chunksize:
+        Number of rows of each chunk.
+    :param int overlap:
+        Number of rows and data points added on both sides of each chunk
+        when re-sampling.
+
+    :return:
+        The headers and the chunks of the synchronized table.
+    :rtype: generator
+    """
+    re_sampling = _get_re_sampling(interpolation_method, interpolation_methods)
+    ref, data = tables[0], tables[1:]
+    cols = [list(ref.columns)]
+    cols.extend([k for k in d.columns if k != x_label] for d in data)
+
+    _prefix_headers(headers, prefix_cols)
+    yield pd.concat([h[c].reset_index(drop=True)
+                     for c, (sn, i, h) in zip(cols, headers)], axis=1)
+
+    x = np.asarray(ref[x_label], float)
+    n = len(x)
+    for i in range(0, n, chunksize):
+        j, k = max(i - overlap, 0), min(i + chunksize + overlap, n)
+        r = slice(i - j, i - j + chunksize)
+        frames = [ref.iloc[i:i + chunksize].reset_index(drop=True)]
+        for shift, d, c in zip(shifts, data, cols[1:]):
+            x_shift, xp = x[j:k] + shift, np.asarray(d[x_label], float)
+            a, b = np.searchsorted(xp, (x_shift[0], x_shift[-1]))
+            w = slice(max(a - overlap, 0), b + overlap)
+            frames.append(pd.DataFrame(OrderedDict(
+                (l, re_sampling[l](x_shift, xp=xp[w], fp=d[l].values[w])[r])
+                for l in c
+            )))
+        yield pd.concat(frames, axis=1)
+
+
 def _cum_integral(x, xp, fp):
     X = np.unique(np.concatenate((x, xp)))
     Y = np.interp(X, xp, fp, left=0.0, right=0.0)
     return sci_itg.cumtrapz(Y, X, initial=0)[np.searchsorted(X, x)]
 
 
-def integral_interpolation(x, xp, fp):
+def _integral_interpolation(x, xp, fp):
+    n = len(x)
+    X, dx = np.zeros(n + 1), np.zeros(n + 1)
+    dx[1:-1] = np.diff(x)
+    X[0], X[1:-1], X[-1] = x[0], x[:-1] + dx[1:-1] / 2, x[-1]
+    I = np.diff(_cum_integral(X, xp, fp))
+
+    # The system is tridiagonal, hence it is solved in banded form.
+    dx /= 8.0
+    A = np.empty((3, n))
+    A[0, 1:] = A[2, :-1] = dx[1:-1]
+    A[1] = (dx[:-1] + dx[1:]) * 3.0
+    A[0, 0] = A[2, -1] = 0
+
+    return sci_lng.solve_banded((1, 1), A, I, overwrite_ab=True,
+                                overwrite_b=True)
+
+
+def integral_interpolation(x, xp, fp, block=2 ** 16, overlap=64):
     """
     Re-samples data maintaining the signal integral.
 
@@ -303,6 +490,17 @@ def integral_interpolation(x, xp, fp):
         The y-coordinates of the data points, same length as xp.
     :type fp: numpy.array
 
+    :param block:
+        Number of re-sampled values computed at once. Longer signals are
+        processed block-wise, in linear time and constant memory.
+    :type block: int, optional
+
+    :param overlap:
+        Number of values added on both sides of each block. The coupling
+        between the values decays geometrically (at least 6 times per value),
+        hence the block-wise solution matches the global one.
+    :type overlap: int, optional
+
     :return:
         Re-sampled y-values.
     :rtype: numpy.array
@@ -311,27 +509,21 @@ def integral_interpolation(x, xp, fp):
     x, fp = np.asarray(x, dtype=float), np.asarray(fp, dtype=float)
     xp = np.asarray(xp, dtype=float)
     n = len(x)
-    X, dx = np.zeros(n + 1), np.zeros(n + 1)
-    dx[1:-1] = np.diff(x)
-    X[0], X[1:-1], X[-1] = x[0], x[:-1] + dx[1:-1] / 2, x[-1]
-    I = np.diff(_cum_integral(X, xp, fp))
-
-    dx /= 8.0
-    # noinspection PyTypeChecker
-    A = np.diag((dx[:-1] + dx[1:]) * 3.0)
-    i, j = np.indices(A.shape)
-    A[i == j - 1] = A[i - 1 == j] = dx[1:-1]
-
-    return np.linalg.solve(A, I)
+    if n <= block:
+        return _integral_interpolation(x, xp, fp)
 
+    res = np.empty(n)
+    for i in range(0, n, block):
+        j, k = max(i - overlap, 0), min(i + block + overlap, n)
+        b = x[j:k]
+        a, c = np.searchsorted(xp, (b[0], b[-1]))
+        a, c = max(a - 1, 0), c + 1
+        y = _integral_interpolation(b, xp[a:c], fp[a:c])
+        res[i:i + block] = y[i - j:i - j + block]
+    return res
 
-def synchronize(headers, tables, x_label, y_label, prefix_cols,
-                interpolation_method='linear', interpolation_methods=None):
-    res = _yield_synched_tables(*tables, x_label=x_label, y_label=y_label,
-                                interpolation_method=interpolation_method,
-                                interpolation_methods=interpolation_methods)
-    res =list(res)
 
+def _prefix_headers(headers, prefix_cols):
     if prefix_cols:
         ix = set()
         for sn, i, h in headers:
@@ -346,11 +538,81 @@ def synchronize(headers, tables, x_label, y_label, prefix_cols,
         for j in ix.intersection(h.columns):
             h[j].iloc[i] = '%s.%s' % (sn, h[j].iloc[i])
 
+
+def _synchronize(headers, tables, x_label, y_label, prefix_cols,
+                 interpolation_method='linear', interpolation_methods=None):
+    res = _yield_synched_tables(*tables, x_label=x_label, y_label=y_label,
+                                interpolation_method=interpolation_method,
+                                interpolation_methods=interpolation_methods)
+    res =list(res)
+
+    _prefix_headers(headers, prefix_cols)
+
     frames = [h[df.columns].append(df)
               for (_, df), (sn, i, h) in zip(res, headers)]
     df = pd.concat(frames, axis=1)
 
-    return df
+    return df, [shift for shift, _ in res[1:]]
+
+
+def synchronize(headers, tables, x_label, y_label, prefix_cols,
+                interpolation_method='linear', interpolation_methods=None):
+    return _synchronize(headers, tables, x_label, y_label, prefix_cols,
+                        interpolation_method=interpolation_method,
+                        interpolation_methods=interpolation_methods)[0]
+
+
+def stream_synched_table(out_file, sheet_name, headers, tables, x_label,
+                         y_label, prefix_cols, interpolation_method='linear',
+                         interpolation_methods=None, chunksize=2 ** 16):
+    """
+    Writes the synchronized table into a new workbook in bounded memory.
+
+    The shifts are estimated on a decimated grid (see :func:`_yield_shifts`),
+    then the columns are re-sampled and streamed into the excel-file in chunks
+    of rows.
+
+    :param str out_file:
+        Output excel-file path.
+    :param str sheet_name:
+        Sheet name of the synchronized table.
+    :param list headers:
+        Headers of the tables.
+    :param list tables:
+        Tables to be synchronized (the first is the reference).
+    :param str x_label:
+        `x` column label.
+    :param str y_label:
+        `y` column label.
+    :param bool prefix_cols:
+        Prefix all synced column names with their source sheet-names.
+    :param str interpolation_method:
+        Interpolation method.
+    :param dict interpolation_methods:
+        Interpolation methods specified for specific signals.
+    :param int chunksize:
+        Number of rows written at once.
+    :return:
+        The shifts of the synced tables in relation to the reference.
+    :rtype: list
+    """
+    from co2mpas.io.excel import StreamWriter
+    shifts = list(_yield_shifts(*tables, x_label=x_label, y_label=y_label,
+                                chunksize=chunksize))
+    chunks = _yield_synched_chunks(
+        headers, tables, shifts, x_label, prefix_cols, chunksize=chunksize,
+        interpolation_method=interpolation_method,
+        interpolation_methods=interpolation_methods
+    )
+
+    writer, row = StreamWriter(out_file), 0
+    for df in chunks:
+        df.to_excel(writer, sheet_name, header=False, index=False,
+                    startrow=row)
+        row += df.shape[0]
+    writer.save()
+    log.info('Streamed %d rows into datasync-file: %r', row, out_file)
+    return shifts
 
 
 def _guess_xlref_without_hash(xlref, bias_on_fragment):
@@ -504,7 +766,8 @@ def _ensure_out_file(out_path, inp_path, force, out_frmt):
 def do_datasync(x_label, y_label, ref_xlref, *sync_xlrefs,
                 out_path=None, prefix_cols=False, force=False,
                 sheets_factory=None, no_clone=False,
-                interpolation_method='linear', interpolation_methods=None):
+                interpolation_method='linear', interpolation_methods=None,
+                chunksize=None):
     """
 
     :param str x_label:
@@ -544,12 +807,50 @@ def do_datasync(x_label, y_label, ref_xlref, *sync_xlrefs,
             Interpolation method.
     :param dict interpolation_methods:
             Interpolation methods specified for specific signals.
+    :param int chunksize:
+            When given, the shifts are estimated on a decimated grid and the
+            synced table is streamed into a new workbook in chunks of rows
+            (see :func:`stream_synched_table`).
+    """
+    return _do_datasync(
+        x_label, y_label, ref_xlref, *sync_xlrefs, out_path=out_path,
+        prefix_cols=prefix_cols, force=force, sheets_factory=sheets_factory,
+        no_clone=no_clone, interpolation_method=interpolation_method,
+        interpolation_methods=interpolation_methods, chunksize=chunksize
+    )[0]
+
+
+def _do_datasync(x_label, y_label, ref_xlref, *sync_xlrefs,
+                 out_path=None, prefix_cols=False, force=False,
+                 sheets_factory=None, no_clone=False,
+                 interpolation_method='linear', interpolation_methods=None,
+                 chunksize=None):
+    """
+    Like :func:`do_datasync`, but returns also the shifts of the synced sheets.
+
+    :return:
+        The output file, and the (sheet-name, shift) of each synced table.
+    :rtype: str, list[(str, float)]
     """
     tables = Tables((x_label, y_label), sheets_factory)
     tables.collect_tables(ref_xlref, *sync_xlrefs)
-    df = synchronize(tables.headers, tables.tables, x_label, y_label,
-                     prefix_cols, interpolation_method=interpolation_method,
-                     interpolation_methods=interpolation_methods)
+    sheet_names = [sn for sn, i, h in tables.headers[1:]]
+    if chunksize:
+        out_file = _ensure_out_file(out_path, tables.ref_fpath, force,
+                                    synced_file_frmt)
+        shifts = stream_synched_table(
+            out_file, tables.ref_sh_name, tables.headers, tables.tables,
+            x_label, y_label, prefix_cols, chunksize=chunksize,
+            interpolation_method=interpolation_method,
+            interpolation_methods=interpolation_methods
+        )
+        return out_file, list(zip(sheet_names, shifts))
+
+    df, shifts = _synchronize(
+        tables.headers, tables.tables, x_label, y_label, prefix_cols,
+        interpolation_method=interpolation_method,
+        interpolation_methods=interpolation_methods
+    )
 
     if no_clone:
         writer_fact = pd.ExcelWriter
@@ -564,7 +865,210 @@ def do_datasync(x_label, y_label, ref_xlref, *sync_xlrefs,
         df.to_excel(writer, tables.ref_sh_name, header=False, index=False)
         writer.save()
 
-    return out_file
+    return out_file, list(zip(sheet_names, shifts))
+
+
+class _BatchSheetsFactory(xleash.SheetsFactory):
+    """
+    A sheets-factory shared by the jobs of a `batch` worker.
+
+    After each job, only the `max_sheets` most recently used sheets are kept
+    (e.g., the reference template used by all jobs), so the common workbooks
+    are read once while the memory stays bounded.
+    """
+
+    def __init__(self, backends=None, max_sheets=8):
+        super(_BatchSheetsFactory, self).__init__(backends)
+        self.max_sheets = max_sheets
+        self._used_sheets = OrderedDict()
+
+    def _use_sheet(self, sheet):
+        if sheet:
+            self._used_sheets.pop(id(sheet), None)
+            self._used_sheets[id(sheet)] = sheet
+        return sheet
+
+    def _cache_get(self, key):
+        return self._use_sheet(super(_BatchSheetsFactory, self)._cache_get(key))
+
+    def _cache_put(self, key, sheet):
+        super(_BatchSheetsFactory, self)._cache_put(key, self._use_sheet(sheet))
+
+    def release(self):
+        """
+        Closes and drops from the cache the least recently used sheets, and
+        closes their workbooks when none of their sheets is cached anymore.
+        """
+        while len(self._used_sheets) > self.max_sheets:
+            sheet = next(iter(self._used_sheets.values()))
+            keys = [(wb, sh_id) for wb, sh_dict in self._cached_sheets.items()
+                    for sh_id, sh in sh_dict.items() if sh is sheet]
+            if keys:
+                # It drops all the keys of the sheet, but marks it as used.
+                self._close_sheet(keys[0])
+            self._used_sheets.pop(id(sheet))
+
+            wbs = {wb for wb, _ in keys}
+            if wbs and not any(self._cached_sheets[wb] for wb in wbs):
+                sheet._close_all()  # No other sheet of its workbook is cached.
+            for wb in wbs:
+                if not self._cached_sheets[wb]:
+                    del self._cached_sheets[wb]
+
+
+def _yield_batch_jobs(jobs_path):
+    """
+    Yields the xlrefs of each `batch` job.
+
+    :param str jobs_path:
+        A folder, where each workbook is a job synced against its 1st sheet,
+        or a manifest-file, where each line is a job given as
+        `<ref-table> [<sync-table> ...]` (`#` starts a comment line).
+    """
+    if osp.isdir(jobs_path):
+        for fpath in sorted(glob.glob(osp.join(jobs_path, '*.xlsx'))):
+            fname = osp.basename(fpath)
+            if not (fname.startswith('~$') or fname.endswith('.sync.xlsx')):
+                yield (fpath,)
+    else:
+        with open(jobs_path) as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    yield tuple(shlex.split(line))
+
+
+def _batch_out_files(jobs, out_folder):
+    """
+    Returns the output file of each job, numbering the outputs of the jobs
+    with the same <ref-file> name.
+    """
+    def _file(xlrefs):
+        url = _guess_xlref_without_hash(xlrefs[0], False).split('#', 1)[0]
+        return osp.splitext(osp.basename(url))
+
+    files = [_file(xlrefs) for xlrefs in jobs]
+    counts = Counter(files)
+    return [osp.join(out_folder, synced_file_frmt % (
+        '%s.%d' % (stem, i) if counts[(stem, ext)] > 1 else stem, ext
+    )) for i, (stem, ext) in enumerate(files)]
+
+
+def _run_batch_job(job, sheets_factory, x_label, y_label, **kw):
+    i, xlrefs, out_file = job
+    res, start = [], time.time()
+    log.info('Datasync job(%i: %s)...', i, ' '.join(xlrefs))
+    try:
+        out_file, shifts = _do_datasync(
+            x_label, y_label, *xlrefs, out_path=out_file,
+            sheets_factory=sheets_factory, **kw
+        )
+        res.extend((sn, shift, None) for sn, shift in shifts)
+    except Exception as ex:
+        log.error('Failed datasync job(%i: %s) due to: %s',
+                  i, ' '.join(xlrefs), ex)
+        res.append((None, None, str(ex)))
+    finally:
+        sheets_factory.release()
+    seconds = time.time() - start
+    return [(i, xlrefs[0], out_file, sn, shift, seconds, error)
+            for sn, shift, error in res]
+
+
+_worker = None
+
+
+def _init_batch_worker(kw):
+    global _worker
+    _worker = _BatchSheetsFactory(), kw
+
+
+def _run_batch_worker_job(job):
+    sheets_factory, kw = _worker
+    return _run_batch_job(job, sheets_factory, **kw)
+
+
+def do_datasync_batch(x_label, y_label, jobs_path, out_path='.', force=False,
+                      jobs=1, **kw):
+    """
+    Runs a batch of datasync jobs in a pool of processes.
+
+    Each worker reuses its workbook-sheets across the jobs (e.g., the `ref`
+    sheet of a common template), and a summary with the shift of each synced
+    sheet and the duration of each job is written as
+    `<timestamp>-datasync-summary.csv` in the output folder.
+
+    :param str x_label:
+            `x` column label.
+    :param str y_label:
+            `y` column label.
+    :param str jobs_path:
+            A folder, where each workbook is a job synced against its 1st
+            sheet, or a manifest-file, where each line is a job given as
+            `<ref-table> [<sync-table> ...]` (`#` starts a comment line).
+    :param str out_path:
+            Output folder.
+    :param bool force:
+            When true, overwrites excel-file(s) and/or create the output
+            folder.
+    :param int jobs:
+            Number of worker processes; 0 uses all cpus.
+    :param kw:
+            Options of :func:`do_datasync` (e.g., `prefix_cols`, `no_clone`,
+            `interpolation_method`, `interpolation_methods`, `chunksize`).
+    :return:
+            The summary file.
+    :rtype: str
+    """
+    from co2mpas.batch import default_timestamp
+    import datetime
+    import multiprocessing
+
+    if not osp.isdir(out_path):
+        if force and not osp.exists(out_path):
+            log.info('Creating output folder: %r...', out_path)
+            os.makedirs(out_path)
+        else:
+            raise CmdException("Output folder %r does not exist! \n"
+                               "Tip: specify --force to create it." % out_path)
+
+    timestamp = default_timestamp(datetime.datetime.today())
+    xlrefs = list(_yield_batch_jobs(jobs_path))
+    if not xlrefs:
+        raise CmdException('No datasync jobs found in %r!' % jobs_path)
+    batch = list(zip(range(len(xlrefs)), xlrefs,
+                     _batch_out_files(xlrefs, out_path)))
+    kw = dict(kw, x_label=x_label, y_label=y_label, force=force)
+
+    if jobs != 1 and len(batch) > 1:
+        if multiprocessing.current_process().daemon:
+            log.warning('Datasync batch cannot run in parallel from a worker '
+                        'process, running it serially.')
+            jobs = 1
+    else:
+        jobs = 1
+
+    if jobs == 1:
+        _init_batch_worker(kw)
+        res = list(map(_run_batch_worker_job, batch))
+    else:
+        with multiprocessing.Pool(jobs or None, _init_batch_worker,
+                                  (kw,)) as pool:
+            res = list(pool.imap(_run_batch_worker_job, batch))
+
+    columns = ['job', 'ref_table', 'output_file', 'sheet', 'shift', 'seconds',
+               'error']
+    summary = pd.DataFrame([r for rows in res for r in rows], columns=columns)
+    summary_file = osp.join(out_path, '%s-datasync-summary.csv' % timestamp)
+    summary.to_csv(summary_file, index=False)
+    log.info('Written datasync summary: %r', summary_file)
+
+    failed = summary['job'][summary['error'].notnull()].unique()
+    if len(failed):
+        raise CmdException('Failed %d of %d datasync jobs %s! \n'
+                           'See the summary: %r' % (len(failed), len(batch),
+                                                    list(failed), summary_file))
+    return summary_file
 
 
 def _get_input_template_fpath():
@@ -683,6 +1187,17 @@ def main(*args):
             print(msg)
     elif opts['template']:
         _cmd_template(opts)
+    elif opts['batch']:
+        do_datasync_batch(
+            opts['<x-label>'], opts['<y-label>'], opts['<jobs-path>'],
+            out_path=opts['-O'],
+            force=opts['--force'],
+            jobs=int(opts['--jobs']),
+            prefix_cols=opts['--prefix-cols'],
+            no_clone=opts['--no-clone'],
+            interpolation_method=opts['--interp'],
+            interpolation_methods=parse_overrides(opts['-i'], option_name='-i'),
+            chunksize=int(opts['--chunksize'] or 0))
     else:
         do_datasync(
             opts['<x-label>'], opts['<y-label>'],
@@ -692,7 +1207,8 @@ def main(*args):
             force=opts['--force'],
             no_clone=opts['--no-clone'],
             interpolation_method=opts['--interp'],
-            interpolation_methods=parse_overrides(opts['-i'], option_name='-i'))
+            interpolation_methods=parse_overrides(opts['-i'], option_name='-i'),
+            chunksize=int(opts['--chunksize'] or 0))
 
 
 if __name__ == '__main__':
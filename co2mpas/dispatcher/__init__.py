@@ -1693,7 +1693,7 @@ class Dispatcher(object):
     def dispatch(self, inputs=None, outputs=None, cutoff=None, inputs_dist=None,
                  wildcard=False, no_call=False, shrink=False,
                  rm_unused_nds=False, select_output_kw=None, _wait_in=None,
-                 stopper=None):
+                 stopper=None, executor=None):
         """
         Evaluates the minimum workflow and data outputs of the dispatcher
         model from given inputs.
@@ -1748,6 +1748,18 @@ class Dispatcher(object):
             A semaphore to abort the dispatching.
         :type stopper: threading.Event, optional
 
+        :param executor:
+            A pool to run concurrently the function nodes that are ready to be
+            evaluated (i.e., all inputs estimated and sole estimators of their
+            outputs). The nodes are still visited in the same order of the
+            serial dispatch, hence distances, tie-breaking, and outputs do not
+            change. The functions may be evaluated even if the dispatch ends
+            before visiting them, so only the function nodes added with
+            `no_side_effects=True` are submitted. A sub-dispatch function is
+            submitted as a copy with its own solution, and it shares the
+            executor with its dispatch.
+        :type executor: concurrent.futures.Executor, optional
+
         :return:
             Dictionary of estimated data node outputs.
         :rtype: Result[str, T]
@@ -1836,7 +1848,7 @@ class Dispatcher(object):
         # Initialize.
         self.solution = sol = Solution(
             dsp, inputs, outputs, wildcard, cutoff, inputs_dist, no_call,
-            rm_unused_nds, _wait_in, stopper=stopper
+            rm_unused_nds, _wait_in, stopper=stopper, executor=executor
         )
 
         # Dispatch.
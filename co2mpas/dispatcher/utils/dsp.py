@@ -608,7 +608,7 @@ class SubDispatch(object):
     """
     def __init__(self, dsp, outputs=None, cutoff=None, inputs_dist=None,
                  wildcard=False, no_call=False, shrink=False,
-                 rm_unused_nds=False, output_type='all'):
+                 rm_unused_nds=False, output_type='all', executor=None):
         """
         Initializes the Sub-dispatch.
 
@@ -654,6 +654,12 @@ class SubDispatch(object):
                 + 'list': a list with all outputs listed in `outputs`.
                 + 'dict': a dictionary with any outputs listed in `outputs`.
         :type output_type: str, optional
+
+        :param executor:
+            A pool to run concurrently the independent function nodes.
+
+            .. seealso:: :func:`~dispatcher.Dispatcher.dispatch`
+        :type executor: concurrent.futures.Executor, optional
         """
 
         self.dsp = dsp
@@ -665,6 +671,7 @@ class SubDispatch(object):
         self.output_type = output_type
         self.inputs_dist = inputs_dist
         self.rm_unused_nds = rm_unused_nds
+        self.executor = executor
         self.__module__ = caller_name()
         self.name = self.__name__ = dsp.name
         self.__doc__ = dsp.__doc__
@@ -672,18 +679,19 @@ class SubDispatch(object):
         self.solution = Solution(dsp)
 
     def __call__(self, *input_dicts, copy_input_dicts=False, _sol_output=None,
-                 _sol_stopper=None):
+                 _sol_stopper=None, _sol_executor=None):
 
         # Combine input dictionaries.
         i = combine_dicts(*input_dicts, copy=copy_input_dicts)
 
         # Dispatch the function calls.
-        self.solution = self.dsp.dispatch(
+        self.solution = sol = self.dsp.dispatch(
             i, self.outputs, self.cutoff, self.inputs_dist, self.wildcard,
-            self.no_call, self.shrink, self.rm_unused_nds, stopper=_sol_stopper
+            self.no_call, self.shrink, self.rm_unused_nds, stopper=_sol_stopper,
+            executor=_sol_executor or self.executor
         )
 
-        return self._return(self.solution, _sol_output)
+        return self._return(sol, _sol_output)
 
     def _return(self, solution, _sol_output):
         outs = self.outputs
@@ -1003,7 +1011,8 @@ class SubDispatchFunction(SubDispatch):
         elif len(outputs) == 1:
             self.output_type = 'values'
 
-    def __call__(self, *args, _sol_output=None, _sol_stopper=None, **kwargs):
+    def __call__(self, *args, _sol_output=None, _sol_stopper=None,
+                 _sol_executor=None, **kwargs):
         # Namespace shortcuts.
         dsp, inputs = self.dsp, map_list(self.inputs, *args)
         self.solution = sol = self._sol.copy_structure()
@@ -1037,12 +1046,30 @@ class SubDispatchFunction(SubDispatch):
         return self._return(sol, _sol_output)
 
 
+class _PlanDiverged(Exception):
+    """
+    The execution plan of a :class:`SubDispatchPipe` cannot be replayed.
+
+    Its arguments are the list of results of the nodes executed by the plan and
+    the failure of the diverged node (i.e., node id, message, exception, and if
+    the pipe has to stop), or None.
+    """
+
+
 class SubDispatchPipe(SubDispatchFunction):
     """
     It converts a :func:`~dispatcher.Dispatcher` into a function.
 
     That function takes a sequence of arguments as input of the dispatch.
 
+    The dispatch pipe is computed once for the given inputs and outputs. When
+    it contains just data and function nodes, it is compiled in an execution
+    plan that is replayed directly, without running the ArciDispatch algorithm.
+    If a node of the plan cannot be evaluated (i.e., an `input_domain` rejects
+    it or it misses some estimation), the dispatch pipe is resumed from that
+    node, hence no function is evaluated twice. The failures of the functions,
+    filters, and callbacks of the plan are handled as in the dispatch pipe.
+
     :return:
         A function that executes the pipe of the given `dsp`, updating .
     :rtype: function
@@ -1092,6 +1119,26 @@ class SubDispatchPipe(SubDispatchFunction):
        :opt: workflow=True, graph_attr={'ratio': '1'}
 
         >>> dsp = fun.dsp
+
+    When an `input_domain` rejects a node of the pipe, the outputs are not
+    reached::
+
+        >>> dsp = Dispatcher(name='Dispatcher')
+        >>> dsp.add_function('x + 1', lambda x: x + 1, inputs=['a'],
+        ...                  outputs=['b'], input_domain=lambda x: x > 0)
+        'x + 1'
+        >>> dsp.add_function('x - 1', lambda x: x - 1, inputs=['a'],
+        ...                  outputs=['b'], weight=10)
+        'x - 1'
+        >>> fun = SubDispatchPipe(dsp, 'myF', ['a'], ['b'])
+        >>> fun(1)
+        2
+        >>> fun(-1)  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        DispatcherError:
+          Unreachable output-targets: ...
+          Available outputs: ...
     """
 
     def __init__(self, dsp, function_id, inputs, outputs=None, cutoff=None,
@@ -1154,7 +1201,203 @@ class SubDispatchPipe(SubDispatchFunction):
 
         self.pipe = [_make_tks(*v['task'][-1]) for v in self._sol.pipe.values()]
 
-    def __call__(self, *args, _sol_output=None, _sol_stopper=None):
+        self._plan = self._compile_plan()
+
+    def _compile_plan(self):
+        """
+        Compiles the pipe in a list of data and function nodes to be executed.
+
+        :return:
+            Execution plan (node id, node attributes, estimations or outputs).
+            None if the pipe contains sub-dispatchers or remote links.
+        :rtype: list[(str, dict, list | set)]
+        """
+
+        from .cst import START, PLOT
+        from .des import parent_func
+        sol, plan = self._sol, []
+
+        if self.output_type == 'all' or sol._wait_in:
+            return None
+
+        for v, s, nxt_nds, nxt_dsp in self.pipe:
+            node = s.nodes[v]
+            if s is not sol or nxt_dsp or v is PLOT or 'remote_links' in node:
+                return None
+
+            if node['type'] == 'data':
+                est = list(s.workflow.pred[v])
+
+                if len(est) > 1 and not node['wait_inputs']:
+                    # The estimation with minimum distance from the start.
+                    dist, edg, edg_length = s.dist, s.dmap.edge, s._edge_length
+
+                    def _dist(k):
+                        return dist[k] + edg_length(edg[k][v], node), k
+
+                    est = [min((k for k in est if k is not START), key=_dist)]
+
+                plan.append((v, node, est))
+
+            elif node['type'] == 'function' and nxt_nds:
+                if isinstance(parent_func(node['function']), SubDispatch):
+                    return None
+                plan.append((v, node, set(nxt_nds)))
+
+            else:
+                return None
+
+        return plan
+
+    def _run_plan(self, args, stopper):
+        """
+        Executes the execution plan.
+
+        Before evaluating a node, it checks that its estimations or arguments
+        are available and that they respect its `input_domain`. Otherwise, it
+        raises :class:`_PlanDiverged` with the results of the executed nodes.
+        Errors of node functions, filters, and callbacks raise it as well, with
+        the failure to be handled as the dispatch pipe does.
+
+        :param args:
+            Inputs of the dispatch.
+        :type args: tuple
+
+        :param stopper:
+            A semaphore to abort the dispatching.
+        :type stopper: multiprocess.Event
+
+        :return:
+            Outputs of the dispatch.
+        :rtype: T
+        """
+
+        from .cst import START, NONE
+
+        inputs = combine_dicts(self._sol.inputs, map_list(self.inputs, *args))
+
+        # Data node values and estimations of the data nodes.
+        values = {k: inputs[k] for k in self._sol._wildcards}
+        est = {(START, k): v for k, v in inputs.items()}
+        outputs, check_domain, done = {}, not self._sol.no_domain, []
+
+        for node_id, node, nds in self._plan:
+            if stopper.is_set():
+                raise DispatcherAbort(self._sol, "Stop requested.")
+
+            if node['type'] == 'data':
+                kw = {k: est[k, node_id] for k in nds if (k, node_id) in est}
+                if not kw or ('function' not in node and node['wait_inputs']):
+                    raise _PlanDiverged(done, None)
+
+                try:
+                    if 'function' in node:
+                        value = node['function'](kw)
+                    else:
+                        value = kw[nds[0]]
+
+                    for f in node.get('filters', ()):
+                        value = f(value)
+                except Exception as ex:
+                    msg = "Failed DISPATCHING '%s' due to:\n  %r"
+                    raise _PlanDiverged(done, (node_id, msg, ex, True))
+
+                values[node_id] = value
+                if value is not NONE:
+                    outputs[node_id] = value
+                done.append(value)
+
+                if 'callback' in node:
+                    try:
+                        node['callback'](value)
+                    except Exception as ex:
+                        msg = "Failed CALLBACKING '%s' due to:\n  %s"
+                        raise _PlanDiverged(done, (node_id, msg, ex, False))
+                continue
+
+            try:
+                a = [values[k] for k in node['inputs']]
+            except KeyError:
+                raise _PlanDiverged(done, None)
+            a = [v for v in a if v is not NONE]
+
+            if check_domain and 'input_domain' in node:
+                # noinspection PyBroadException
+                try:
+                    if not node['input_domain'](*a):
+                        raise _PlanDiverged(done, None)
+                except _PlanDiverged:
+                    raise
+                except Exception:
+                    raise _PlanDiverged(done, None)
+
+            try:
+                res = node['function'](*a)
+
+                for f in node.get('filters', ()):
+                    res = f(res)
+            except Exception as ex:
+                msg = "Failed DISPATCHING '%s' due to:\n  %r"
+                raise _PlanDiverged(done, (node_id, msg, ex, True))
+
+            o_nds = node['outputs']
+            res = res if len(o_nds) > 1 else [res]
+            for k, v in zip(o_nds, res):
+                if k in nds and v is not NONE:
+                    est[node_id, k] = v
+            done.append(res)
+
+        try:
+            outs, output_type = self.outputs, self.output_type
+            return selector(outs, outputs, output_type=output_type)
+        except KeyError:
+            raise _PlanDiverged(done, None)  # To raise as the dispatch pipe.
+
+    @staticmethod
+    def _set_plan_output(sol, node_id, nxt_nds, res):
+        """
+        Sets in the solution the results of a node executed by the plan.
+
+        :param sol:
+            Solution of the dispatch pipe.
+        :type sol: co2mpas.dispatcher.utils.sol.Solution
+
+        :param node_id:
+            Data or function node id.
+        :type node_id: str
+
+        :param nxt_nds:
+            Next nodes of the dispatch pipe.
+        :type nxt_nds: list[str]
+
+        :param res:
+            Data node value or function node results.
+        :type res: T
+        """
+
+        from .cst import NONE
+        node = sol.nodes[node_id]
+
+        if node['type'] == 'data':
+            if res is not NONE:
+                sol[node_id] = res
+            for u in nxt_nds:
+                sol._wf_add_edge(node_id, u, value=res)
+        else:
+            for k, v in zip(node['outputs'], res):
+                if k in nxt_nds and v is not NONE:
+                    sol._wf_add_edge(node_id, k, value=v)
+
+    def __call__(self, *args, _sol_output=None, _sol_stopper=None,
+                 _sol_executor=None):
+        # Results of the nodes executed by the plan and failure of the plan.
+        done, failure = (), None
+        if self._plan is not None and _sol_output is None:
+            try:
+                return self._run_plan(args, _sol_stopper or self._sol.stopper)
+            except _PlanDiverged as ex:
+                done, failure = ex.args  # Resume the pipe from the diverged node.
+
         dsp, inputs = self.dsp, map_list(self.inputs, *args)
         key_map, sub_dsp = {}, {}
         for k, s in self._sol.sub_dsp.items():
@@ -1165,12 +1408,24 @@ class SubDispatchPipe(SubDispatchFunction):
             sub_dsp[k] = ns
 
         sol = key_map[self._sol]
-        sol.inputs.update(inputs)
+        sol.inputs = combine_dicts(sol.inputs, inputs)  # Not shared.
 
         for s in sub_dsp.values():
             s._init_workflow(clean=False)
 
-        for v, s, nxt_nds, nxt_dsp in self.pipe:
+        for (v, s, nxt_nds, nxt_dsp), res in zip(self.pipe, done):
+            self._set_plan_output(key_map[s], v, nxt_nds, res)
+
+        if failure is not None:  # The plan runs only on the main solution.
+            node_id, msg, ex, stop = failure
+            try:
+                raise ex  # To be handled with its traceback as the dispatch.
+            except Exception:
+                sol._warning(msg, node_id, ex)
+            if stop:
+                return self._return(sol, _sol_output)
+
+        for v, s, nxt_nds, nxt_dsp in self.pipe[len(done):]:
             s = key_map[s]
 
             if s.stopper.is_set():
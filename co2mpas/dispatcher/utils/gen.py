@@ -91,6 +91,18 @@ class Token(str):
     def __deepcopy__(self, memo):
         return self
 
+    def __reduce__(self):
+        from . import cst
+        for k in cst.__all__:
+            if getattr(cst, k) is self:  # Constants are unpickled as themself.
+                return _get_constant, (k,)
+        return super(Token, self).__reduce__()
+
+
+def _get_constant(name):
+    from . import cst
+    return getattr(cst, name)
+
 
 def pairwise(iterable):
     """
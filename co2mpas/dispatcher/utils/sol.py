@@ -12,8 +12,9 @@ It contains a comprehensive list of all modules and classes within dispatcher.
 Docstrings should provide sufficient understanding for any individual function.
 """
 from collections import OrderedDict
-from copy import _reconstruct
+from copy import _reconstruct, copy
 from datetime import datetime
+from functools import partial
 from heapq import heappush, heappop
 import logging
 import threading
@@ -40,7 +41,7 @@ class Solution(OrderedDict):
     def __init__(self, dsp=None, inputs=None, outputs=None, wildcard=False,
                  cutoff=None, inputs_dist=None, no_call=False,
                  rm_unused_nds=False, wait_in=None, no_domain=False,
-                 _empty=False, index=(-1,), stopper=None):
+                 _empty=False, index=(-1,), stopper=None, executor=None):
 
         super(Solution, self).__init__()
         self.index = index
@@ -55,6 +56,7 @@ class Solution(OrderedDict):
         self._set_dsp_features(dsp or Dispatcher(caller=__name__))
 
         self.stopper = stopper or self.dsp.stopper
+        self.executor = executor
 
         if not _empty:
             self._set_inputs(inputs, inputs_dist)
@@ -152,6 +154,8 @@ class Solution(OrderedDict):
         self._wf_pred = self.workflow.pred
         self._errors = OrderedDict()
         self.sub_dsp = {self.dsp: self}
+        self._futures = {}  # Function nodes submitted to the executor.
+        self._ready = []  # Function nodes to be submitted to the executor.
         self.fringe = []  # Use heapq with (distance, wait, label).
         self.dist, self.seen, self._meet = {START: -1}, {START: -1}, {START: -1}
         self._update_methods()
@@ -203,35 +207,188 @@ class Solution(OrderedDict):
             for v in dsp.sub_dsp_nodes.values():
                 _dsp_closed_add(v['function'])
 
-        while fringe:
-            # Visit the closest available node.
-            n = (d, _, (v, sol)) = heappop(fringe)
+        # Function to submit the ready function nodes to the executor.
+        if self.executor is not None and not self.no_call:
+            submit = self._submit_ready_nodes
+        else:
+            submit = None
 
-            if sol.stopper.is_set():
-                raise DispatcherAbort(self, "Stop requested.")
-            # Skip terminated sub-dispatcher or visited nodes.
-            if sol.dsp in dsp_closed or (v is not START and v in sol.dist):
-                continue
+        try:
+            while fringe:
+                # Visit the closest available node.
+                n = (d, _, (v, sol)) = heappop(fringe)
 
-            dsp_init_add(sol.dsp)  # Update initialized dispatcher sets.
+                if sol.stopper.is_set():
+                    raise DispatcherAbort(self, "Stop requested.")
+                # Skip terminated sub-dispatcher or visited nodes.
+                if sol.dsp in dsp_closed or (v is not START and v in sol.dist):
+                    continue
 
-            pipe_append(n)  # Add node to the pipe.
+                dsp_init_add(sol.dsp)  # Update initialized dispatcher sets.
 
-            # Set and visit nodes.
-            if not sol._visit_nodes(v, d, fringe, check_cutoff, self.no_call):
-                if self is sol:
-                    break  # Reach all targets.
-                else:
-                    _dsp_closed_add(sol.dsp)  # Terminated sub-dispatcher.
+                pipe_append(n)  # Add node to the pipe.
 
-            # See remote link node.
-            sol._see_remote_link_node(v, fringe, d, check_dsp)
+                # Set and visit nodes.
+                if not sol._visit_nodes(v, d, fringe, check_cutoff,
+                                        self.no_call):
+                    if self is sol:
+                        break  # Reach all targets.
+                    else:
+                        _dsp_closed_add(sol.dsp)  # Terminated sub-dispatcher.
+
+                # See remote link node.
+                sol._see_remote_link_node(v, fringe, d, check_dsp)
+
+                if submit:  # Run concurrently the new ready function nodes.
+                    submit()
+        finally:
+            if submit:
+                self._close_executor()
 
         if self.rm_unused_nds:  # Remove unused func and sub-dsp nodes.
             self._remove_unused_nodes()
 
         return self  # Data outputs.
 
+    def _submit_ready_nodes(self):
+        """
+        Submits to the executor the function nodes that have been added to the
+        fringe since the last call.
+
+        A function node is submitted when it is flagged as `no_side_effects`,
+        its inputs are all estimated, and it is the only estimator of its
+        outputs, hence the dispatch would call it with the same arguments when
+        visiting it. The flag is required because these nodes may be evaluated
+        even if the dispatch ends before reaching them.
+        """
+
+        ready = self._ready
+        for v, sol in ready:
+            if v not in sol._futures and v not in sol.dist:
+                sol._futures[v] = sol._submit_function(v, sol.nodes[v])
+        del ready[:]
+
+    def _add_ready_node(self, node_id):
+        # Function node added to the fringe, to be submitted to the executor.
+        if self.executor is not None and not self.no_call and \
+                self.nodes[node_id]['type'] == 'function':
+            self._ready.append((node_id, self))
+
+    def _submit_function(self, node_id, node_attr):
+        """
+        Submits a function node to the executor.
+
+        A sub-dispatch function is submitted as a copy, with its own solution,
+        because :class:`~dispatcher.utils.dsp.SubDispatch` stores the last
+        solution of its dispatch.
+
+        :param node_id:
+            Function node id.
+        :type node_id: str
+
+        :param node_attr:
+            Dictionary of node attributes.
+        :type node_attr: dict[str, T]
+
+        :return:
+            Function arguments, future, and workflow attributes of the node.
+            None if the function node cannot be evaluated in advance.
+        :rtype: (list, concurrent.futures.Future, dict)
+        """
+
+        if not node_attr.get('no_side_effects') or 'function' not in node_attr:
+            return None
+
+        fun, attr = node_attr['function'], {}
+        if isinstance(fun, SubDispatch):
+            fun = partial(
+                copy(fun), _sol_output=attr, _sol_stopper=self.stopper,
+                _sol_executor=self.executor
+            )
+        elif isinstance(parent_func(fun), SubDispatch):
+            return None  # Wrapped sub-dispatch functions are not copied.
+
+        pred, succ, seen = self._pred, self._succ[node_id], self.seen
+
+        # Outputs estimated by other nodes or already given as inputs.
+        if not succ or any(len(pred[k]) != 1 for k in succ) or \
+                all(k in seen for k in succ):
+            return None
+
+        try:
+            args = self._get_function_args(node_id, node_attr)
+
+            if not self.no_domain and 'input_domain' in node_attr and \
+                    not node_attr['input_domain'](*args):
+                return None
+        except Exception:
+            return None  # It will fail also when it is visited.
+
+        return args, self.executor.submit(fun, *args), attr
+
+    def _close_executor(self):
+        # Cancels the submitted function nodes that have not been visited.
+        for sol in self.sub_dsp.values():
+            for f in sol._futures.values():
+                if f is not None:
+                    f[1].cancel()
+            sol._futures, sol._ready, sol.executor = {}, [], None
+
+    def _get_function_args(self, node_id, node_attr):
+        args = self._wf_pred[node_id]  # List of the function's arguments.
+        args = [args[k]['value'] for k in node_attr['inputs']]
+        return [v for v in args if v is not NONE]
+
+    def _evaluate_function(self, node_id, fun, args, attr):
+        """
+        Evaluates the function of a node or collects its submitted result.
+
+        :param node_id:
+            Function node id.
+        :type node_id: str
+
+        :param fun:
+            Function of the node.
+        :type fun: callable
+
+        :param args:
+            Function arguments.
+        :type args: list
+
+        :param attr:
+            Workflow attributes of the function node.
+        :type attr: dict
+
+        :return:
+            Function results.
+        :rtype: T
+        """
+
+        submitted = self._futures.pop(node_id, None)
+
+        if submitted is not None:
+            s_args, future, s_attr = submitted
+
+            # Not started yet or evaluated with other arguments.
+            same_args = len(s_args) == len(args) and \
+                all(a is b for a, b in zip(s_args, args))
+
+            if not future.cancel() and same_args:
+                try:
+                    res = future.result()
+                except Exception:
+                    pass  # Evaluate it again, to raise as a serial dispatch.
+                else:
+                    attr.update(s_attr)
+                    if 'solution' in s_attr:  # Last solution, as if called.
+                        fun.solution = s_attr['solution']
+                    return res
+
+        if isinstance(parent_func(fun), SubDispatch):
+            return fun(*args, _sol_output=attr, _sol_stopper=self.stopper,
+                       _sol_executor=self.executor)
+        return fun(*args)
+
     def get_sub_dsp_from_workflow(self, sources, reverse=False,
                                   add_missing=False, check_inputs=True):
         sub_dsp = self.dsp.get_sub_dsp_from_workflow(
@@ -249,7 +406,7 @@ class Solution(OrderedDict):
         sol = self.__class__(
             self.dsp, self.inputs, self.outputs, False, self.cutoff,
             self.inputs_dist, self.no_call, self.rm_unused_nds, self._wait_in,
-            self.no_domain, True, self.index, self.stopper
+            self.no_domain, True, self.index, self.stopper, self.executor
         )
         sol._clean_set()
         it = ['_wildcards', 'inputs', 'inputs_dist']
@@ -640,9 +797,8 @@ class Solution(OrderedDict):
                 wf_add_edge(node_id, u)
             return True
 
-        args = self._wf_pred[node_id]  # List of the function's arguments.
-        args = [args[k]['value'] for k in node_attr['inputs']]
-        args = [v for v in args if v is not NONE]
+        # List of the function's arguments.
+        args = self._get_function_args(node_id, node_attr)
 
         attr = {'started': datetime.today()}
         try:
@@ -652,12 +808,7 @@ class Solution(OrderedDict):
                 return False  # Args are not respecting the domain.
             else:  # Use the estimation function of node.
                 fun = node_attr['function']
-
-                if isinstance(parent_func(fun), SubDispatch):
-                    res = fun(*args, _sol_output=attr,
-                              _sol_stopper=self.stopper)
-                else:
-                    res = fun(*args)
+                res = self._evaluate_function(node_id, fun, args, attr)
 
                 # Apply filters to results.
                 for f in node_attr.get('filters', ()):
@@ -776,6 +927,8 @@ class Solution(OrderedDict):
 
                 heappush(fringe, (vw_dist, vd, (w, self)))  # Add to heapq.
 
+                self._add_ready_node(w)
+
             return True
 
         update_view(data_id, initial_dist)  # Update view distance.
@@ -922,6 +1075,8 @@ class Solution(OrderedDict):
             # Add to heapq.
             heappush(fringe, (dist, vd, (node_id, self)))
 
+            self._add_ready_node(node_id)
+
             return True  # The node is visible.
         return False  # The node is not visible.
 
@@ -969,11 +1124,14 @@ class Solution(OrderedDict):
         sol = self.__class__(
             dsp, {}, outputs, False, None, None, no_call, False,
             wait_in=self._wait_in.get(dsp, None), index=self.index + index,
-            stopper=self.stopper
+            stopper=self.stopper, executor=self.executor
         )
 
         sol.sub_dsp = self.sub_dsp
 
+        self._ready.extend(sol._ready)  # Share the nodes to be submitted.
+        sol._ready = self._ready
+
         for f in sol.fringe:  # Update the fringe.
             heappush(fringe, (initial_dist + f[0], (2,) + f[1][1:], f[-1]))
 
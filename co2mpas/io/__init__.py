@@ -17,22 +17,28 @@ Modules:
     :nosignatures:
     :toctree: io/
 
+    cache
+    columnar
     dill
     excel
+    npy
     schema
     validations
+    xlsx
     constants
 """
 
 import datetime
 import logging
+import os.path as osp
 import pathlib
 import regex
 import pandas as pd
 import co2mpas.dispatcher.utils as dsp_utl
-from co2mpas._version import version
+from co2mpas._version import version, __file_version__ as file_version
 import co2mpas.dispatcher as dsp
-from . import schema, excel, dill
+from . import schema, excel, dill, cache, npy, columnar
+from .constants import con_vals
 import functools
 import itertools
 import pandalone.xleash as xleash
@@ -41,29 +47,121 @@ import collections
 log = logging.getLogger(__name__)
 
 
-def get_cache_fpath(fpath, ext=('dill',)):
-    fpath = pathlib.Path(fpath)
-    cache_folder = fpath.parent.joinpath('.co2mpas_cache')
+def get_cache_folder(fpath, cache_folder=None):
+    """
+    Returns the cache folder, creating it if missing.
+
+    :param fpath:
+        Input file path.
+    :type fpath: str
+
+    :param cache_folder:
+        Central cache folder. If None, it is the `.co2mpas_cache` next to the
+        input file.
+    :type cache_folder: str, optional
+
+    :return:
+        Cache folder.
+    :rtype: str
+    """
+    if cache_folder is None:
+        cache_folder = pathlib.Path(fpath).parent.joinpath('.co2mpas_cache')
+    cache_folder = pathlib.Path(cache_folder)
     # noinspection PyBroadException
     try:
         # noinspection PyUnresolvedReferences
-        cache_folder.mkdir()
+        cache_folder.mkdir(parents=True)
     except:  # dir exist
         pass
-    return str(cache_folder.joinpath('.'.join((fpath.name, version) + ext)))
+    return str(cache_folder)
+
+
+def get_cache_fpath(fpath, cache_folder=None):
+    """
+    Returns the cache file path of the parsed input file.
+
+    The file name is the hash of the input content and of the co2mpas and
+    input-file versions, so the same workbook is parsed once whatever its path.
+    The extension is the cache format (see `con_vals.INPUT_CACHE_FORMAT`).
+
+    :param fpath:
+        Input file path.
+    :type fpath: str
+
+    :param cache_folder:
+        Central cache folder. If None, it is the `.co2mpas_cache` next to the
+        input file.
+    :type cache_folder: str, optional
+
+    :return:
+        Cache file path.
+    :rtype: str
+    """
+    fmt = con_vals.INPUT_CACHE_FORMAT
+    if fmt not in _cache_formats:
+        raise ValueError('Invalid input cache format %r! Use one of %s.'
+                         % (fmt, sorted(_cache_formats)))
+    store = cache.SolutionStore(get_cache_folder(fpath, cache_folder))
+    key = store.key(cache.file_hash(fpath), file_version)
+    return osp.join(store.folder, '%s.%s' % (key, fmt))
+
+
+#: Load and save functions of the input cache formats.
+_cache_formats = {
+    'dill': (dill.load_from_dill, cache.save_dill),
+    'npy': (npy.load_from_npy, npy.save_npy)
+}
+
+
+def load_cache_file(cache_fpath):
+    """
+    Loads the parsed input data from a cache file of any format.
+
+    :param cache_fpath:
+        Cache file path.
+    :type cache_fpath: str
+
+    :return:
+        Input data.
+    :rtype: dict
+    """
+    fmt = osp.splitext(cache_fpath)[1][1:]
+    return _cache_formats[fmt][0](cache_fpath)
+
+
+# noinspection PyUnusedLocal
+def save_cache_file(data, cache_fpath, *args):
+    """
+    Saves the parsed input data on a cache file according to its format.
+
+    :param data:
+        Input data.
+    :type data: dict
+
+    :param cache_fpath:
+        Cache file path.
+    :type cache_fpath: str
+    """
+    fmt = osp.splitext(cache_fpath)[1][1:]
+    _cache_formats[fmt][1](data, cache_fpath)
 
 
 def check_cache_fpath_exists(overwrite_cache, fpath, cache_fpath):
     if overwrite_cache:
         return False
-    cache_fpath = pathlib.Path(cache_fpath)
-    if cache_fpath.exists():
-        # Will scream if INPUT does not exist.
-        inp_stats = pathlib.Path(fpath).stat()
-        cache_stats = cache_fpath.stat()
-        if inp_stats.st_mtime <= cache_stats.st_mtime:
-            return True
-    return False
+    # Content-addressed, hence it cannot be stale.
+    return pathlib.Path(cache_fpath).exists()
+
+
+# noinspection PyUnusedLocal
+def check_cache_fpath_missing(data, cache_fpath, overwrite_cache):
+    # Data loaded from the cache is not written again.
+    return not check_cache_fpath_exists(overwrite_cache, None, cache_fpath)
+
+
+# noinspection PyUnusedLocal
+def check_file_exists(fpath, *args):
+    return pathlib.Path(fpath).is_file()
 
 
 # noinspection PyUnusedLocal
@@ -554,10 +652,16 @@ def load_inputs():
         description='Loads from files the inputs for the CO2MPAS model.'
     )
 
+    d.add_data(
+        data_id='cache_folder',
+        default_value=None
+    )
+
     d.add_function(
         function=get_cache_fpath,
-        inputs=['input_file_name'],
-        outputs=['cache_file_name']
+        inputs=['input_file_name', 'cache_folder'],
+        outputs=['cache_file_name'],
+        input_domain=check_file_exists
     )
 
     d.add_data(
@@ -567,7 +671,7 @@ def load_inputs():
 
     d.add_function(
         function_id='load_data_from_cache',
-        function=dsp_utl.add_args(dill.load_from_dill, n=2),
+        function=dsp_utl.add_args(load_cache_file, n=2),
         inputs=['overwrite_cache', 'input_file_name', 'cache_file_name'],
         outputs=['raw_data'],
         input_domain=check_cache_fpath_exists
@@ -602,13 +706,38 @@ def load_inputs():
 
     d.add_function(
         function_id='cache_parsed_data',
-        function=dill.save_dill,
-        inputs=['raw_data', 'cache_file_name']
+        function=save_cache_file,
+        inputs=['raw_data', 'cache_file_name', 'overwrite_cache'],
+        input_domain=check_cache_fpath_missing
     )
 
     return d
 
 
+def get_output_flags(main_flags):
+    """
+    Returns the flags of the output writers.
+
+    :param main_flags:
+        Command line flags.
+    :type main_flags: dict
+
+    :return:
+        If the excel-file is streamed, the format of the columnar output, and
+        the central cache folder.
+    :rtype: bool, str, str
+    """
+    main_flags = main_flags or {}
+    return main_flags.get('fast_output', False), \
+           main_flags.get('output_sidecar', None), \
+           main_flags.get('cache_folder', None)
+
+
+# noinspection PyUnusedLocal
+def check_output_sidecar(dfs, output_file_name, output_sidecar):
+    return bool(output_sidecar)
+
+
 def write_outputs():
     """
     Defines a module to write on files the outputs of the CO2MPAS model.
@@ -633,9 +762,22 @@ def write_outputs():
         outputs=['dfs']
     )
 
+    d.add_function(
+        function=get_output_flags,
+        inputs=['main_flags'],
+        outputs=['fast_output', 'output_sidecar', 'cache_folder']
+    )
+
     d.add_function(
         function=excel.write_to_excel,
-        inputs=['dfs', 'output_file_name', 'template_file_name']
+        inputs=['dfs', 'output_file_name', 'template_file_name', 'fast_output',
+                'cache_folder']
+    )
+
+    d.add_function(
+        function=columnar.write_columnar,
+        inputs=['dfs', 'output_file_name', 'output_sidecar'],
+        input_domain=check_output_sidecar
     )
 
     inp = ['output_file_name', 'template_file_name', 'output_data',
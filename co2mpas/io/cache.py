@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It contains functions and classes to cache data on disk by content.
+"""
+
+import functools
+import glob
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import pickle
+import tempfile
+
+import dill
+
+from co2mpas._version import version
+
+log = logging.getLogger(__name__)
+
+__all__ = ['file_hash', 'save_dill', 'SolutionStore']
+
+
+def file_hash(fpath):
+    """
+    Returns the content hash of a file.
+
+    The hash is computed once per file-version (path, size and modification
+    time) within the process.
+
+    :param fpath:
+        File path.
+    :type fpath: str
+
+    :return:
+        Hexadecimal SHA1 digest of the file content.
+    :rtype: str
+    """
+    fpath = osp.abspath(fpath)
+    st = os.stat(fpath)
+    return _file_hash(fpath, st.st_size, st.st_mtime_ns)
+
+
+# noinspection PyUnusedLocal
+@functools.lru_cache(1024)
+def _file_hash(fpath, size, mtime_ns, block_size=2 ** 20):
+    h = hashlib.sha1()
+    with open(fpath, 'rb') as f:
+        for b in iter(functools.partial(f.read, block_size), b''):
+            h.update(b)
+    return h.hexdigest()
+
+
+def save_dill(data, fpath):
+    """
+    Writes atomically a dill-file (temp-file + rename).
+
+    Concurrent readers see either the previous or the new complete file.
+
+    :param data:
+        Data to be saved.
+    :type data: object
+
+    :param fpath:
+        File path.
+    :type fpath: str
+    """
+    fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=osp.dirname(fpath) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            dill.dump(data, f)
+        os.chmod(tmp, 0o644)  # Readable by other users sharing the cache.
+        os.replace(tmp, fpath)
+    except:
+        os.remove(tmp)
+        raise
+    log.debug('Written cache-file(%s).', fpath)
+
+
+class SolutionStore(object):
+    """
+    Content-addressed store of dill-files with least-recently-used eviction.
+
+    Files are written atomically (temp-file + rename), hence many processes
+    can read and write the same store concurrently.
+
+    Example::
+
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as folder:
+        ...     store = SolutionStore(folder)
+        ...     key = store.key('file-hash', {'a': 1})
+        ...     store.save(key, {'b': 2})
+        ...     store.load(key)
+        {'b': 2}
+    """
+
+    def __init__(self, folder, max_size=None):
+        """
+        :param folder:
+            Folder of the store.
+        :type folder: str
+
+        :param max_size:
+            Maximum size of the store [bytes]. If None, it is unbounded.
+        :type max_size: int, optional
+        """
+        self.folder = folder
+        self.max_size = max_size
+
+    @staticmethod
+    def key(*parts):
+        """
+        Returns the key of a stored item, including the co2mpas version.
+
+        :param parts:
+            JSON serializable objects that identify the item.
+        :type parts: object
+
+        :return:
+            Key of the item.
+        :rtype: str
+        """
+        s = json.dumps((version,) + parts, sort_keys=True, default=str)
+        return hashlib.sha1(s.encode('utf-8')).hexdigest()
+
+    def get_fpath(self, key):
+        return osp.join(self.folder, '%s.dill' % key)
+
+    def load(self, key, default=None):
+        """
+        Loads an item and marks it as recently used.
+
+        :param key:
+            Key of the item.
+        :type key: str
+
+        :param default:
+            Value returned when the item is missing or unreadable.
+        :type default: object, optional
+
+        :return:
+            Stored item.
+        :rtype: object
+        """
+        fpath = self.get_fpath(key)
+        try:
+            with open(fpath, 'rb') as f:
+                data = dill.load(f)
+        except FileNotFoundError:
+            return default
+        except (EOFError, pickle.UnpicklingError) as ex:
+            log.warning('Skipped corrupted cache-file(%s) due to: %s', fpath, ex)
+            return default
+
+        try:
+            os.utime(fpath)
+        except OSError:  # Evicted meanwhile by another process.
+            pass
+        log.debug('Loaded cache-file(%s).', fpath)
+        return data
+
+    def save(self, key, data):
+        """
+        Saves an item and evicts the least recently used when store is full.
+
+        :param key:
+            Key of the item.
+        :type key: str
+
+        :param data:
+            Item to be stored.
+        :type data: object
+        """
+        os.makedirs(self.folder, exist_ok=True)
+        save_dill(data, self.get_fpath(key))
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used items until the store fits its size.
+        """
+        if self.max_size is None:
+            return
+        files = []
+        for fpath in glob.glob(osp.join(self.folder, '*.dill')):
+            try:
+                st = os.stat(fpath)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, fpath))
+
+        size = sum(f[1] for f in files)
+        for _, s, fpath in sorted(files):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(fpath)
+                log.debug('Evicted cache-file(%s).', fpath)
+            except OSError:  # Removed by another process or still open.
+                continue
+            size -= s
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It contains functions to write the output tables on columnar files.
+
+The time-series (`*.ts`) and parameter (`*.pa`) sheets of the output excel-file
+are written also as flat tables, so that downstream tools can skip the xlsx:
+
+    - `parquet`/`feather`: a folder with one file for each sheet,
+    - `hdf5`: one `.h5` file with one key for each sheet.
+
+The time-series columns are named by their model name (e.g., `velocities`),
+while the parameters are stored as strings in the `Value` column.
+
+.. note:: The formats need `pyarrow` (`parquet`, `feather`) or `tables`
+   (`hdf5`) to be installed.
+"""
+
+import logging
+import os
+import os.path as osp
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+__all__ = ['write_columnar', 'FORMATS']
+
+#: Columnar formats with their file extension.
+FORMATS = {'parquet': '.parquet', 'feather': '.feather', 'hdf5': '.h5'}
+
+
+def _flat_table(sheet_name, df):
+    if sheet_name.endswith('.ts'):
+        df = df.copy()
+        df.columns = [c[-1] if isinstance(c, tuple) else c for c in df.columns]
+    else:
+        df = df.reset_index()
+        df.columns = [c[0] if isinstance(c, tuple) else c for c in df.columns]
+        df = df.astype(str)
+    return df
+
+
+def _output_tables(data):
+    for k, v in sorted(data.items()):
+        if k.endswith(('.ts', '.pa')) and isinstance(v, pd.DataFrame):
+            if not v.empty:
+                yield k, _flat_table(k, v)
+
+
+def _write_hdf5(tables, fpath):
+    with pd.HDFStore(fpath, mode='w') as store:
+        for k, df in tables:
+            store.put(k.replace('.', '/'), df)
+
+
+def _write_arrow(tables, fpath, fmt):
+    import pyarrow as pa
+    if fmt == 'parquet':
+        from pyarrow.parquet import write_table
+    else:
+        from pyarrow.feather import write_feather as write_table
+
+    os.makedirs(fpath, exist_ok=True)
+    for k, df in tables:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        write_table(table, osp.join(fpath, k + FORMATS[fmt]))
+
+
+def write_columnar(data, output_file_name, output_format):
+    """
+    Writes the time-series and parameter tables on columnar files.
+
+    :param data:
+        Data-frames to be written, keyed by sheet name.
+    :type data: dict
+
+    :param output_file_name:
+        Output excel-file name. The columnar output is saved beside it with
+        the same name (i.e., a folder for parquet and feather, or a `.h5` file
+        for hdf5).
+    :type output_file_name: str
+
+    :param output_format:
+        Columnar format (i.e., parquet, feather, or hdf5).
+    :type output_format: str
+
+    :return:
+        Columnar file or folder name.
+    :rtype: str
+    """
+    fpath = osp.splitext(output_file_name)[0]
+    tables = _output_tables(data)
+    if output_format == 'hdf5':
+        fpath += FORMATS[output_format]
+        _write_hdf5(tables, fpath)
+    else:
+        _write_arrow(tables, fpath, output_format)
+    log.info('Written into %s-file(%s)...', output_format, fpath)
+    return fpath
@@ -162,6 +162,13 @@ class Constants(utl.Constants):
     #: Maximum allowed positive current for the alternator currents check [A].
     MAX_VALIDATE_POS_CURR = 1.0
 
+    #: Maximum size of the cache of the base solutions of the plan [bytes].
+    MAX_SOLUTION_CACHE_SIZE = 2 * 1024 ** 3
+
+    #: Format of the cache of the parsed input files ('dill' or 'npy').
+    #: The 'npy' format loads the time series as memory-maps.
+    INPUT_CACHE_FORMAT = 'dill'
+
     #: Data to be parsed from the input when declaration mode is enabled.
     DECLARATION_DATA = {
         'target': True,
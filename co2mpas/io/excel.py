@@ -12,18 +12,22 @@ It contains functions to read/write inputs/outputs from/on excel.
 
 import logging
 import math
+import numpy as np
 import pandas as pd
 import collections
 import pandalone.xleash as xleash
 import pandalone.xleash.io._xlrd as pnd_xlrd
 import shutil
 import openpyxl
+import xlsxwriter
 import xlsxwriter.utility as xl_utl
 import inspect
 import itertools
 import regex
 import co2mpas.dispatcher.utils as dsp_utl
+from . import xlsx
 import json
+import os
 import os.path as osp
 import functools
 
@@ -275,34 +279,36 @@ def parse_excel_file(file_path):
     """
 
     try:
-        excel_file = pd.ExcelFile(file_path)
+        book = xlsx.open_workbook(file_path)
     except FileNotFoundError:
         log.error("No such file or directory: '%s'", file_path)
         return dsp_utl.NONE
 
     res, plans = {}, []
 
-    book = excel_file.book
-
-    for sheet_name in excel_file.sheet_names:
-        match = _re_input_sheet_name.match(sheet_name)
-        if not match:
-            log.debug("Sheet name '%s' cannot be parsed!", sheet_name)
-            continue
-        match = {k: v.lower() for k, v in match.groupdict().items() if v}
-
-        sheet = pnd_xlrd._open_sheet_by_name_or_index(book, 'book', sheet_name)
-        is_plan = match.get('scope', None) == 'plan'
-        if is_plan:
-            r = {'plan': pd.DataFrame()}
-        else:
-            r = {}
-        r = _parse_sheet(match, sheet, sheet_name, res=r)
-        if is_plan:
-            plans.append(r['plan'])
-        else:
-            _add_times_base(r, **match)
-            dsp_utl.combine_nested_dicts(r, depth=5, base=res)
+    with book:  # Closes the file when the sheets are parsed.
+        # Sheets are parsed on demand, hence the unmatched ones are never read.
+        for sheet_name in book.sheet_names():
+            match = _re_input_sheet_name.match(sheet_name)
+            if not match:
+                log.debug("Sheet name '%s' cannot be parsed!", sheet_name)
+                continue
+            match = {k: v.lower() for k, v in match.groupdict().items() if v}
+
+            sheet = pnd_xlrd._open_sheet_by_name_or_index(
+                book, 'book', sheet_name
+            )
+            is_plan = match.get('scope', None) == 'plan'
+            if is_plan:
+                r = {'plan': pd.DataFrame()}
+            else:
+                r = {}
+            r = _parse_sheet(match, sheet, sheet_name, res=r)
+            if is_plan:
+                plans.append(r['plan'])
+            else:
+                _add_times_base(r, **match)
+                dsp_utl.combine_nested_dicts(r, depth=5, base=res)
 
     for k, v in dsp_utl.stack_nested_keys(res.get('base', {}), depth=3):
         if k[0] != 'target':
@@ -384,9 +390,45 @@ def _write_sheets(writer, sheet_name, data, down=True, **kw):
         return refs
 
 
-def write_to_excel(data, output_file_name, template_file_name):
+def write_to_excel(data, output_file_name, template_file_name, fast=False,
+                   cache_folder=None):
+    """
+    Writes the output data-frames into an excel file.
+
+    :param data:
+        Data-frames to be written, keyed by sheet name.
+    :type data: dict
+
+    :param output_file_name:
+        Output file name.
+    :type output_file_name: str
+
+    :param template_file_name:
+        Template file name. If empty, results are written into an empty file.
+    :type template_file_name: str
+
+    :param fast:
+        If True, the sheets are streamed row by row into the file (see
+        :class:`StreamWriter`) and the template is replayed from a cached
+        snapshot instead of being cloned (charts, images, data validations,
+        print settings, and some conditional formats of the template are
+        dropped, see :meth:`StreamWriter.add_template`).
+    :type fast: bool, optional
+
+    :param cache_folder:
+        Central cache folder of the template snapshot of the fast mode. If
+        None, it is the `.co2mpas_cache` next to the output file.
+    :type cache_folder: str, optional
+    """
 
-    if template_file_name:
+    if fast:
+        log.debug('Streaming into xl-file(%s)...', output_file_name)
+        writer = StreamWriter(output_file_name)
+        if template_file_name:
+            from . import get_cache_folder
+            cache_folder = get_cache_folder(output_file_name, cache_folder)
+            writer.add_template(template_file_name, cache_folder)
+    elif template_file_name:
         log.debug('Writing into xl-file(%s) based on template(%s)...',
                   output_file_name, template_file_name)
         writer = clone_excel(template_file_name, output_file_name)
@@ -405,6 +447,8 @@ def write_to_excel(data, output_file_name, template_file_name):
             elif k.endswith('proc_info'):
                 down = False
                 kw = {'named_ranges': ()}
+                if fast:  # Its tables are written side by side.
+                    writer.add_sheet(k, constant_memory=False)
             else:
                 kw = {}
 
@@ -441,6 +485,363 @@ def clone_excel(file_name, output_file_name):
     return writer
 
 
+class StreamWriter(object):
+    """
+    Excel writer that streams the sheets row by row in constant memory.
+
+    The cells of each :meth:`pandas.DataFrame.to_excel` call (i.e., a chunk)
+    are sorted by row and written at once through :mod:`xlsxwriter` in
+    `constant_memory` mode, hence just the current row of a sheet is kept in
+    memory. It is passed to :meth:`pandas.DataFrame.to_excel` as writer, hence
+    it implements `write_cells`.
+
+    Rows cannot be written backwards in a streamed sheet: a :class:`ValueError`
+    is raised instead of dropping them. Sheets written in other orders (e.g.,
+    side by side tables or templates) have to be added with
+    `constant_memory=False` (see :meth:`add_sheet`).
+
+    .. note:: In streamed sheets, cells merged over several rows (e.g.,
+       multi-index rows) are written only in their first cell.
+    """
+
+    def __init__(self, output_file_name):
+        self.book = xlsxwriter.Workbook(
+            output_file_name, {'constant_memory': True}
+        )
+        self.sheets, self._last_rows, self._formats = {}, {}, {}
+
+    def add_sheet(self, sheet_name, constant_memory=True):
+        """
+        Adds a sheet to the workbook.
+
+        :param sheet_name:
+            Sheet name.
+        :type sheet_name: str
+
+        :param constant_memory:
+            If True, the sheet is streamed and it has to be written by row,
+            otherwise it is kept in memory until the workbook is saved.
+        :type constant_memory: bool, optional
+
+        :return:
+            The sheet.
+        :rtype: xlsxwriter.worksheet.Worksheet
+        """
+        book = self.book
+        # A sheet takes the memory mode of the workbook when it is added.
+        book.constant_memory = constant_memory
+        try:
+            self.sheets[sheet_name] = sheet = book.add_worksheet(sheet_name)
+        finally:
+            book.constant_memory = True
+        if constant_memory:
+            self._last_rows[sheet_name] = 0
+        return sheet
+
+    def write_cells(self, cells, sheet_name=None, startrow=0, startcol=0):
+        try:
+            sheet = self.sheets[sheet_name]
+        except KeyError:
+            sheet = self.add_sheet(sheet_name)
+
+        streamed = sheet_name in self._last_rows
+        cells = sorted(self._move_cells(cells, startrow, startcol, streamed),
+                       key=lambda c: (c.row, c.col))
+        if not cells:
+            return
+
+        if streamed:
+            row = self._last_rows[sheet_name]
+            if cells[0].row < row:
+                msg = 'Cannot write row %d of the streamed sheet %r after ' \
+                      'row %d!'
+                raise ValueError(msg % (cells[0].row, sheet_name, row))
+            self._last_rows[sheet_name] = cells[-1].row
+
+        conv = _xl_value
+        for c in cells:
+            fmt = c.style and self._get_style(c.style)
+            if c.mergestart is None:
+                sheet.write(c.row, c.col, conv(c.val), fmt)
+            else:
+                sheet.merge_range(c.row, c.col, c.mergestart, c.mergeend,
+                                  conv(c.val), fmt)
+
+    @staticmethod
+    def _move_cells(cells, startrow, startcol, streamed):
+        for cell in cells:
+            if cell.mergestart is None or cell.mergeend is None:
+                pass
+            elif not streamed or cell.mergestart == cell.row:
+                cell.mergestart += startrow
+                cell.mergeend += startcol
+            else:
+                cell.mergestart = cell.mergeend = None
+            cell.row += startrow
+            cell.col += startcol
+            if isinstance(cell.val, bytes):
+                cell.val = cell.val.decode()
+            yield cell
+
+    def add_template(self, file_name, cache_folder=None):
+        """
+        Writes the sheets of the template into the workbook.
+
+        The template sheets are kept in memory, so the outputs can be written
+        into them in any order. Their values, formulas, formats, merged cells,
+        column widths, row heights, and color-scale, formula, and cell
+        conditional formats, and the defined names of the template are
+        replayed from a snapshot (see
+        :func:`_template_snapshot`). Data validations, print settings, and
+        other conditional formats are dropped with a warning, while charts and
+        images are not read from templates, as in :func:`clone_excel`.
+
+        :param file_name:
+            Template file name.
+        :type file_name: str
+
+        :param cache_folder:
+            Folder where the template snapshot is stored. If None, the snapshot
+            is cached only in the current process.
+        :type cache_folder: str, optional
+        """
+        sheets, names, dropped = _template_snapshot(file_name, cache_folder)
+        if dropped:
+            log.warning('Fast output drops the %s of template(%s).',
+                        ', '.join(dropped), file_name)
+
+        for name, columns, rows, merged, conditional, cells in sheets:
+            sheet = self.add_sheet(name, constant_memory=False)
+            for (first, last), width in columns:
+                sheet.set_column(first, last, width)
+            for row, height in rows:
+                sheet.set_row(row, height)
+            for rng in merged:
+                sheet.merge_range(*rng, data=None)
+            for rng, opt in conditional:
+                if 'format' in opt:
+                    opt = dict(opt, format=self._get_format(opt['format']))
+                sheet.conditional_format(rng, opt)
+            for row, col, value, fmt in cells:
+                fmt = self._get_format(fmt)
+                if isinstance(value, str) and value.startswith('='):
+                    sheet.write_formula(row, col, value, fmt, '')
+                else:
+                    sheet.write(row, col, value, fmt)
+
+        for name, sheet_name, formula in names:
+            if sheet_name is not None:
+                name = '%s!%s' % (sheet_name, name)
+            self.book.define_name(name, '=%s' % formula)
+
+    def _get_style(self, style):
+        # Same format of the pandas `xlsxwriter` engine.
+        font, align = style.get('font') or {}, style.get('alignment') or {}
+        fmt = {
+            'bold': font.get('bold'),
+            'align': {'center': 'center'}.get(align.get('horizontal')),
+            'valign': {'top': 'top'}.get(align.get('vertical')),
+            'border': 1 if style.get('borders') else None
+        }
+        return self._get_format(
+            tuple(sorted((k, v) for k, v in fmt.items() if v))
+        )
+
+    def _get_format(self, fmt):
+        if not fmt:
+            return None
+        try:
+            return self._formats[fmt]
+        except KeyError:
+            self._formats[fmt] = f = self.book.add_format(dict(fmt))
+            return f
+
+    def save(self):
+        book = self.book
+        book.constant_memory = False  # In-memory sheets have no temp files.
+        try:
+            book.close()
+        finally:
+            for sheet in book.worksheets():
+                if sheet.constant_memory:
+                    sheet._opt_close()
+
+
+def _xl_value(value):
+    # Converts numpy types to Python types and sequences to strings.
+    if isinstance(value, np.generic):
+        return value.item()
+    elif isinstance(value, pd.Period) or (
+            hasattr(value, '__iter__') and not isinstance(value, str)):
+        return str(value)
+    return value
+
+
+_border_styles = (
+    None, 'thin', 'medium', 'dashed', 'dotted', 'thick', 'double', 'hair',
+    'mediumDashed', 'dashDot', 'mediumDashDot', 'dashDotDot',
+    'mediumDashDotDot', 'slantDashDot'
+)
+
+
+def _rgb(color):
+    rgb = getattr(color, 'rgb', None)
+    if getattr(color, 'type', None) == 'rgb' and isinstance(rgb, str):
+        return '#%s' % rgb[-6:]
+
+
+def _cell_format(cell):
+    font, fill, align, border = cell.font, cell.fill, cell.alignment, cell.border
+    fmt = {
+        'bold': font.b, 'italic': font.i, 'font_name': font.name,
+        'font_size': font.sz, 'font_color': _rgb(font.color),
+        'text_wrap': align.wrap_text,
+        'align': {'general': None}.get(align.horizontal, align.horizontal),
+        'valign': {'center': 'vcenter'}.get(align.vertical, align.vertical)
+    }
+    if fill.fill_type == 'solid':
+        fmt['bg_color'] = _rgb(fill.fgColor)
+    if cell.number_format != 'General':
+        fmt['num_format'] = cell.number_format
+    for k in ('left', 'right', 'top', 'bottom'):
+        style = getattr(border, k).style
+        if style in _border_styles:
+            fmt[k] = _border_styles.index(style)
+    return tuple(sorted((k, v) for k, v in fmt.items() if v))
+
+
+_cf_operators = {
+    'equal': 'equal to', 'notEqual': 'not equal to',
+    'greaterThan': 'greater than', 'lessThan': 'less than',
+    'greaterThanOrEqual': 'greater than or equal to',
+    'lessThanOrEqual': 'less than or equal to',
+    'between': 'between', 'notBetween': 'not between'
+}
+
+
+def _cf_options(rule):
+    # Options of `xlsxwriter` conditional formats (None if not supported).
+    if rule.type == 'colorScale':
+        scale = rule.colorScale
+        keys = ('min', 'max')
+        if len(scale.cfvo) == 3:
+            keys = ('min', 'mid', 'max')
+        opt = {'type': '%d_color_scale' % len(keys)}
+        for k, v, c in zip(keys, scale.cfvo, scale.color):
+            opt.update({'%s_type' % k: v.type, '%s_color' % k: _rgb(c)})
+            if v.val is not None:
+                opt['%s_value' % k] = v.val
+    elif rule.type == 'expression':
+        opt = {'type': 'formula', 'criteria': '=%s' % rule.formula[0]}
+    elif rule.type == 'cellIs' and rule.operator in _cf_operators:
+        opt = {'type': 'cell', 'criteria': _cf_operators[rule.operator]}
+        opt.update(zip(('value', 'maximum'), rule.formula))
+        if 'maximum' in opt:
+            opt['minimum'] = opt.pop('value')
+    else:
+        return None
+
+    if rule.stopIfTrue:
+        opt['stop_if_true'] = True
+    dxf = rule.dxf
+    if dxf:
+        font, fill = dxf.font, dxf.fill
+        fmt = {
+            'bold': font and font.b, 'italic': font and font.i,
+            'font_color': font and _rgb(font.color),
+            'bg_color': fill and _rgb(fill.bgColor)
+        }
+        opt['format'] = tuple(sorted((k, v) for k, v in fmt.items() if v))
+    return opt
+
+
+def _template_snapshot(file_name, cache_folder=None):
+    """
+    Returns the snapshot of a template to be replayed by
+    :meth:`StreamWriter.add_template`.
+
+    The snapshot is keyed by the template content. It is cached in the current
+    process and, if `cache_folder` is given, on disk, hence the template is
+    read once until it changes.
+
+    :param file_name:
+        Template file name.
+    :type file_name: str
+
+    :param cache_folder:
+        Folder where the snapshot is stored.
+    :type cache_folder: str, optional
+
+    :return:
+        Sheets (i.e., name, column widths, row heights, merged cells,
+        conditional formats, and cells), defined names, and dropped features
+        of the template.
+    :rtype: tuple
+    """
+    from . import cache
+    return _cached_template_snapshot(
+        osp.abspath(file_name), cache.file_hash(file_name), cache_folder
+    )
+
+
+@functools.lru_cache(8)
+def _cached_template_snapshot(file_name, file_hash, cache_folder):
+    from . import cache
+    store = key = None
+    if cache_folder:
+        store = cache.SolutionStore(cache_folder)
+        key = store.key(file_hash, 'output-template')
+        snapshot = store.load(key)
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = _read_template(file_name)
+    if store:
+        try:
+            store.save(key, snapshot)
+        except OSError as ex:
+            log.debug('Template snapshot not stored due to: %s', ex)
+    return snapshot
+
+
+def _read_template(file_name):
+    log.debug('Loading template(%s)...', file_name)
+    book, sheets, dropped = openpyxl.load_workbook(file_name), [], set()
+    for ws in book.worksheets:
+        columns = [((d.min - 1, d.max - 1), d.width)
+                   for d in ws.column_dimensions.values() if d.width]
+        rows = [(i - 1, d.ht) for i, d in ws.row_dimensions.items() if d.ht]
+        merged = [xl_utl.xl_cell_to_rowcol(c) + xl_utl.xl_cell_to_rowcol(e)
+                  for c, _, e in (r.partition(':')
+                                  for r in ws.merged_cell_ranges)]
+        conditional = []
+        for rng, rules in ws.conditional_formatting.cf_rules.items():
+            for rule in rules:
+                opt = _cf_options(rule)
+                if opt is None:
+                    dropped.add('%s conditional formats' % rule.type)
+                else:
+                    conditional.append((rule.priority, rng, opt))
+        conditional = [v[1:] for v in sorted(conditional, key=lambda x: x[0])]
+        cells = [(c.row - 1, c.col_idx - 1, c.value, _cell_format(c))
+                 for r in ws.iter_rows() for c in r
+                 if c.value is not None or c.has_style]
+        sheets.append((ws.title, columns, rows, merged, conditional, cells))
+
+        if ws.data_validations.dataValidation:
+            dropped.add('data validations')
+
+    titles, names = [ws.title for ws in book.worksheets], []
+    for n in book.defined_names.definedName:
+        if n.name.startswith('_xlnm.'):
+            dropped.add('print settings')
+        else:
+            i = n.localSheetId
+            names.append((n.name, None if i is None else titles[int(i)],
+                          n.attr_text))
+    return sheets, names, tuple(sorted(dropped))
+
+
 def _sort_sheets(x):
     x = x[0]
     imp = ['summary', 'graphs', 'plan', 'nedc_h', 'nedc_l', 'wltp_h', 'wltp_l',
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It contains functions to read/write inputs from/on a .npy cache folder.
+
+The folder contains one `.npy` file for each numeric array (or pandas Series)
+of the data and a `meta.dill` file with the rest of the data tree. Arrays are
+loaded as copy-on-write memory-maps, hence loading is almost instantaneous and
+the operating system shares the pages among the processes reading the same
+cache.
+
+.. note:: On Windows, a folder cannot be renamed while its files are mapped by
+   a reader, hence an overwritten cache that is in use is kept as it is.
+"""
+
+import logging
+import os
+import os.path as osp
+import shutil
+import tempfile
+
+import dill
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+__all__ = ['load_from_npy', 'save_npy']
+
+
+class _Array(object):
+    """
+    Placeholder of an array stored in a `.npy` file of the cache folder.
+    """
+
+    def __init__(self, i, series=False, name=None, index=None):
+        self.i = i
+        self.series = series
+        self.name = name
+        self.index = index
+
+    def load(self, fpath):
+        a = np.load(osp.join(fpath, '%d.npy' % self.i), mmap_mode='c')
+        if self.series:
+            return pd.Series(a, index=self.index, name=self.name, copy=False)
+        return a
+
+
+def _is_numeric(a):
+    return a.dtype.kind in 'biufc' and a.ndim > 0
+
+
+def _split(data, arrays):
+    if isinstance(data, dict):
+        return data.__class__((k, _split(v, arrays)) for k, v in data.items())
+
+    if isinstance(data, pd.Series) and _is_numeric(data.values):
+        index = data.index
+        if index.equals(pd.RangeIndex(len(data))):
+            index = None  # Default index is rebuilt on loading.
+        arrays.append(data.values)
+        return _Array(len(arrays) - 1, True, data.name, index)
+
+    if isinstance(data, np.ndarray) and _is_numeric(data):
+        arrays.append(data)
+        return _Array(len(arrays) - 1)
+
+    return data
+
+
+def _join(meta, fpath):
+    if isinstance(meta, dict):
+        return meta.__class__((k, _join(v, fpath)) for k, v in meta.items())
+    if isinstance(meta, _Array):
+        return meta.load(fpath)
+    return meta
+
+
+def load_from_npy(fpath):
+    """
+    Load inputs from a .npy cache folder.
+
+    :param fpath:
+        Folder path.
+    :type fpath: str
+
+    :return:
+        Input data.
+    :rtype: dict
+    """
+    log.debug('Reading npy-folder: %s', fpath)
+    with open(osp.join(fpath, 'meta.dill'), 'rb') as f:
+        meta = dill.load(f)
+    return _join(meta, fpath)
+
+
+def save_npy(data, fpath):
+    """
+    Writes atomically a .npy cache folder (temp-folder + rename).
+
+    :param data:
+        Data to be saved.
+    :type data: dict
+
+    :param fpath:
+        Folder path.
+    :type fpath: str
+    """
+    log.debug('Writing npy-folder: %s', fpath)
+    arrays = []
+    meta = _split(data, arrays)
+
+    tmp = tempfile.mkdtemp(suffix='.tmp', dir=osp.dirname(fpath) or '.')
+    try:
+        for i, a in enumerate(arrays):
+            np.save(osp.join(tmp, '%d.npy' % i), np.ascontiguousarray(a))
+        with open(osp.join(tmp, 'meta.dill'), 'wb') as f:
+            dill.dump(meta, f)
+        os.chmod(tmp, 0o755)  # Readable by other users sharing the cache.
+
+        old = None
+        if osp.isdir(fpath):  # Overwritten cache.
+            old = '%s.old' % tmp
+            try:
+                os.rename(fpath, old)
+            except PermissionError:  # Memory-mapped by a reader on Windows.
+                log.warning('Cannot overwrite the npy-folder in use: %s', fpath)
+                shutil.rmtree(tmp, ignore_errors=True)
+                return
+
+        try:
+            os.rename(tmp, fpath)
+        except OSError:
+            if not osp.isdir(fpath):
+                raise
+            # Written meanwhile by another process with the same content.
+            shutil.rmtree(tmp, ignore_errors=True)
+    except:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    if old:
+        # Memory-maps already opened by other readers stay valid.
+        shutil.rmtree(old, ignore_errors=True)
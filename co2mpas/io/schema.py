@@ -729,6 +729,7 @@ def define_flags_schema(read=True):
     isdir = _dir(read=read)
     _bool = _type(type=bool, read=read)
     _datetime = _type(type=datetime.datetime, read=read)
+    positive_int = _positive(type=int, read=read)
 
     schema = {
         _compare_str('input_version'): string,
@@ -744,12 +745,17 @@ def define_flags_schema(read=True):
         _compare_str('plot_workflow'): _bool,
         _compare_str('overwrite_cache'): _bool,
         _compare_str('type_approval_mode'): _bool,
+        _compare_str('plan_jobs'): positive_int,
+        _compare_str('fast_output'): _bool,
+        _compare_str('output_sidecar'): _select(types=('parquet', 'feather',
+                                                       'hdf5'), read=read),
 
         _compare_str('vehicle_name'): string,
 
         _compare_str('output_template'): isfile,
         _compare_str('output_file_name'): string,
         _compare_str('output_folder'): isdir,
+        _compare_str('cache_folder'): isdir,
 
         _compare_str('start_time'): _datetime,
         _compare_str('timestamp'): string,
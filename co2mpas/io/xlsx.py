@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It contains a lazy and read-only reader of Excel workbooks.
+
+The workbook is an :class:`xlrd.book.Book`, hence its sheets can be captured
+with :func:`pandalone.xleash.lasso`, but the .xlsx sheets are parsed only when
+they are requested. The time series cells (i.e., numbers, shared strings, and
+booleans) are decoded straight from the sheet xml, while the sheets with any
+other cell are parsed by `xlrd`. With `xlrd>=2`, which does not read .xlsx
+files, the workbooks are opened by :func:`xlrd.open_workbook`.
+"""
+
+import functools
+import logging
+import re
+import sys
+import zipfile
+import xlrd
+import xlrd.book as xl_book
+import xlrd.sheet as xl_sheet
+
+try:
+    import xlrd.xlsx as xl_xlsx
+except ImportError:  # Removed in xlrd 2.
+    xl_xlsx = None
+
+log = logging.getLogger(__name__)
+
+__all__ = ['open_workbook']
+
+_re_cell = re.compile(
+    rb'<c r="([A-Z]+)([0-9]+)"(?: s="([0-9]+)")?(?: t="([nsb])")?>'
+    rb'(?:<f[^>]*/>|<f[^>]*>[^<]*</f>)?<v>([^<]+)</v></c>'
+)
+_re_any_cell = re.compile(rb'<c[\s>/]')
+_re_empty_cell = re.compile(rb'<c(?:\s[^>]*)?/>')
+_re_dimension = re.compile(rb'<dimension ref="([^"]*)"')
+_re_merge_cell = re.compile(rb'<mergeCell ref="([^"]*)"')
+
+
+@functools.lru_cache(None)
+def _column_index(letters):
+    i = 0
+    for c in letters:
+        i = i * 26 + c - 64
+    return i - 1
+
+
+def _parse_sheet_xml(sheet, data):
+    """
+    Parses the cells of a .xlsx sheet from its xml.
+
+    :param sheet:
+        Sheet to be filled.
+    :type sheet: xlrd.sheet.Sheet
+
+    :param data:
+        Sheet xml.
+    :type data: bytes
+
+    :return:
+        If the sheet has been parsed. It is False when the sheet contains
+        cells that are not numbers, shared strings, or booleans.
+    :rtype: bool
+    """
+    cells = _re_cell.findall(data)
+    n = len(_re_any_cell.findall(data)) - len(_re_empty_cell.findall(data))
+    if len(cells) != n:
+        return False
+
+    put, sst, col = sheet.put_cell, sheet.book._sharedstrings, _column_index
+    text, boolean = xlrd.XL_CELL_TEXT, xlrd.XL_CELL_BOOLEAN
+    for c, r, s, t, v in cells:
+        i, j, xf = int(r) - 1, col(c), int(s or 0)
+        if t == b's':
+            put(i, j, text, sst[int(v)], xf)
+        elif t == b'b':
+            put(i, j, boolean, int(v), xf)
+        else:  # The cell type depends on its format (e.g., number or date).
+            put(i, j, None, float(v), xf)
+
+    for ref in _re_dimension.findall(data)[:1]:
+        i, j = xl_xlsx.cell_name_to_rowx_colx(
+            ref.decode().split(':')[-1], allow_no_col=True
+        )
+        sheet._dimnrows = i + 1
+        if j is not None:
+            sheet._dimncols = j + 1
+
+    for ref in _re_merge_cell.findall(data):
+        (i, j), (k, l) = map(xl_xlsx.cell_name_to_rowx_colx,
+                             ref.decode().split(':'))
+        sheet.merged_cells.append((i, k + 1, j, l + 1))
+
+    return True
+
+
+class _Book(xl_book.Book):
+    """
+    A .xlsx workbook that parses its sheets on demand.
+    """
+
+    def get_sheet(self, sh_number, update_pos=True):
+        sheet = xl_sheet.Sheet(self, None, self._sheet_names[sh_number],
+                               sh_number)
+        sheet.utter_max_rows = xl_xlsx.X12_MAX_ROWS
+        sheet.utter_max_cols = xl_xlsx.X12_MAX_COLS
+
+        zf, fname = self._zf, self._sheet_targets[sh_number]
+        fname = self._component_names[fname]
+        with zf.open(fname) as f:
+            data = f.read()
+
+        if not _parse_sheet_xml(sheet, data):
+            x12sheet = xl_xlsx.X12Sheet(sheet, self.logfile, self.verbosity)
+            with zf.open(fname) as f:
+                x12sheet.process_stream(f, sheet.name)
+
+        sheet.tidy_dimensions()
+        self._sheet_list[sh_number] = sheet
+        return sheet
+
+    def release_resources(self):
+        # Called by `lasso` after each sheet, but the sheets not parsed yet
+        # need the shared strings and the file, hence see `close`.
+        pass
+
+    def close(self):
+        """
+        Closes the workbook file and releases the shared strings, hence the
+        sheets not parsed yet cannot be parsed anymore.
+        """
+        self._zf.close()
+        super(_Book, self).release_resources()
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+
+def _open_xlsx_workbook(zf):
+    names = {xl_xlsx.X12Book.convert_filename(n): n for n in zf.namelist()}
+    if 'xl/workbook.xml' not in names:
+        return None
+
+    xl_xlsx.ensure_elementtree_imported(0, None)
+    bk = _Book()
+    bk.logfile, bk.verbosity, bk.formatting_info = sys.stdout, 0, 0
+    bk.use_mmap = bk.on_demand = bk.ragged_rows = False
+    bk._zf, bk._component_names = zf, names
+
+    x12book = xl_xlsx.X12Book(bk, bk.logfile, bk.verbosity)
+    with zf.open(names['xl/_rels/workbook.xml.rels']) as f:
+        x12book.process_rels(f)
+    with zf.open(names['xl/workbook.xml']) as f:
+        x12book.process_stream(f, 'Workbook')
+    if 'docprops/core.xml' in names:
+        with zf.open(names['docprops/core.xml']) as f:
+            x12book.process_coreprops(f)
+    if 'xl/styles.xml' in names:
+        with zf.open(names['xl/styles.xml']) as f:
+            xl_xlsx.X12Styles(bk, bk.logfile).process_stream(f, 'styles')
+    if 'xl/sharedstrings.xml' in names:
+        with zf.open(names['xl/sharedstrings.xml']) as f:
+            xl_xlsx.X12SST(bk, bk.logfile).process_stream(f, 'SST')
+
+    # Sheets are parsed on demand.
+    bk._sheet_targets = x12book.sheet_targets
+    bk._sheet_list = [None] * bk.nsheets
+    return bk
+
+
+def open_workbook(fpath):
+    """
+    Opens an Excel workbook, parsing the sheets of .xlsx files on demand.
+
+    :param fpath:
+        Excel file path.
+    :type fpath: str
+
+    :return:
+        Excel workbook. Use it as context manager to close the file.
+    :rtype: xlrd.book.Book
+    """
+    if xl_xlsx is not None and zipfile.is_zipfile(fpath):
+        bk = _open_xlsx_workbook(zipfile.ZipFile(fpath))
+        if bk is not None:
+            log.debug('Opened lazily the workbook: %s', fpath)
+            return bk
+    return xlrd.open_workbook(fpath)
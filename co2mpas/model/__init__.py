@@ -19,9 +19,14 @@ It contains a comprehensive list of all CO2MPAS software models and sub-models:
     selector
 """
 
+import logging
+import multiprocessing
+import dill
 import co2mpas.dispatcher.utils as dsp_utl
 import co2mpas.dispatcher as dsp
 
+log = logging.getLogger(__name__)
+
 
 def select_prediction_data(data, new_data=(), theoretical=True):
     """
@@ -113,6 +118,101 @@ def select_calibration_data(cycle_inputs, precondition_outputs):
     return cycle_inputs
 
 
+def _prediction_model(outputs=None):
+    from .physical import physical
+    if outputs is None:
+        return dsp_utl.SubDispatch(physical())
+    return dsp_utl.SubDispatch(physical(), outputs, output_type='dict')
+
+
+def _predict_cycle(func, models, base, cycle_inputs):
+    return dict(func(models, base, cycle_inputs))
+
+
+#: The prediction model, calibrated models, and base inputs of a worker process.
+_worker = None
+
+
+def _init_predict_worker(data, outputs=None, constants=None):
+    """
+    Builds the prediction model and loads the calibrated models once per worker
+    process.
+
+    :param data:
+        Calibrated models and base inputs serialized with `dill`.
+    :type data: bytes
+
+    :param outputs:
+        Outputs to be returned.
+    :type outputs: list[str], optional
+
+    :param constants:
+        Model constants of the parent process.
+    :type constants: dict, optional
+    """
+    global _worker
+    if constants:
+        from .physical.defaults import dfl
+        dfl.from_dict(constants)
+    _worker = (_prediction_model(outputs),) + dill.loads(data)
+
+
+def _predict_cycle_in_worker(cycle_inputs):
+    # Calibrated models are not picklable, hence the outputs are dilled.
+    return dill.dumps(_predict_cycle(*(_worker + (cycle_inputs,))))
+
+
+def predict_cycles(models, cycles_inputs, base=None, outputs=None, jobs=1):
+    """
+    Predicts many cycles with the same calibrated models.
+
+    The prediction model is built once and the calibrated models are shared by
+    all cycles. When `jobs` != 1, the cycles are predicted in a pool of worker
+    processes that receive the calibrated models only once.
+
+    :param models:
+        Calibrated models (e.g., `data.prediction.models_nedc_h` of the CO2MPAS
+        model solution).
+    :type models: dict
+
+    :param cycles_inputs:
+        Inputs of each cycle to predict (e.g., `times` and `velocities`).
+    :type cycles_inputs: list[dict]
+
+    :param base:
+        Inputs shared by all cycles, overridden by the cycle inputs (e.g., the
+        vehicle data from :func:`select_prediction_data`).
+    :type base: dict, optional
+
+    :param outputs:
+        Outputs to be returned. If None, it returns all outputs.
+    :type outputs: list[str], optional
+
+    :param jobs:
+        Number of worker processes. If 0, it uses all cpus.
+    :type jobs: int, optional
+
+    :return:
+        Outputs of each cycle, in the same order of `cycles_inputs`.
+    :rtype: list[dict]
+    """
+
+    base, cycles_inputs = base or {}, list(cycles_inputs)
+    if jobs != 1 and len(cycles_inputs) > 1:
+        if not multiprocessing.current_process().daemon:
+            from .physical.defaults import dfl
+            data = dill.dumps((models, base))
+            init = _init_predict_worker, (data, outputs, dfl.to_dict())
+            with multiprocessing.Pool(jobs or None, *init) as pool:
+                res = pool.imap(_predict_cycle_in_worker, cycles_inputs)
+                return [dill.loads(r) for r in res]
+        log.warning('Cycles cannot be predicted in parallel from a worker '
+                    'process, predicting them serially.')
+
+    func = _prediction_model(outputs)
+    return [_predict_cycle(func, models, base, c) for c in cycles_inputs]
+
+
 def model():
     """
     Defines the CO2MPAS model.
@@ -149,7 +249,8 @@ def model():
         inputs=['input.precondition.wltp_p'],
         outputs=['output.precondition.wltp_p'],
         description='Wraps all functions needed to calculate the precondition '
-                    'outputs.'
+                    'outputs.',
+        no_side_effects=True
     )
 
     ############################################################################
@@ -165,6 +266,7 @@ def model():
         function=select_calibration_data,
         inputs=['input.calibration.wltp_h', 'output.precondition.wltp_p'],
         outputs=['data.calibration.wltp_h'],
+        no_side_effects=True
     )
 
     d.add_function(
@@ -173,7 +275,8 @@ def model():
         inputs=['data.calibration.wltp_h'],
         outputs=['output.calibration.wltp_h'],
         description='Wraps all functions needed to calibrate the models to '
-                    'predict light-vehicles\' CO2 emissions.'
+                    'predict light-vehicles\' CO2 emissions.',
+        no_side_effects=True
     )
 
     d.add_data(
@@ -184,7 +287,8 @@ def model():
     d.add_function(
         function=select_prediction_data,
         inputs=['output.calibration.wltp_h', 'input.prediction.wltp_h'],
-        outputs=['data.prediction.wltp_h']
+        outputs=['data.prediction.wltp_h'],
+        no_side_effects=True
     )
 
     d.add_function(
@@ -192,7 +296,8 @@ def model():
         function=dsp_utl.SubDispatch(physical()),
         inputs=['data.prediction.models_wltp_h', 'data.prediction.wltp_h'],
         outputs=['output.prediction.wltp_h'],
-        description='Wraps all functions needed to predict CO2 emissions.'
+        description='Wraps all functions needed to predict CO2 emissions.',
+        no_side_effects=True
     )
 
     ############################################################################
@@ -208,6 +313,7 @@ def model():
         function=select_calibration_data,
         inputs=['input.calibration.wltp_l', 'output.precondition.wltp_p'],
         outputs=['data.calibration.wltp_l'],
+        no_side_effects=True
     )
 
     d.add_function(
@@ -216,7 +322,8 @@ def model():
         inputs=['data.calibration.wltp_l'],
         outputs=['output.calibration.wltp_l'],
         description='Wraps all functions needed to calibrate the models to '
-                    'predict light-vehicles\' CO2 emissions.'
+                    'predict light-vehicles\' CO2 emissions.',
+        no_side_effects=True
     )
 
     d.add_data(
@@ -227,7 +334,8 @@ def model():
     d.add_function(
         function=select_prediction_data,
         inputs=['output.calibration.wltp_l', 'input.prediction.wltp_l'],
-        outputs=['data.prediction.wltp_l']
+        outputs=['data.prediction.wltp_l'],
+        no_side_effects=True
     )
 
     d.add_function(
@@ -235,8 +343,8 @@ def model():
         function=dsp_utl.SubDispatch(physical()),
         inputs=['data.prediction.models_wltp_l', 'data.prediction.wltp_l'],
         outputs=['output.prediction.wltp_l'],
-        description='Wraps all functions needed to predict CO2 emissions.'
-
+        description='Wraps all functions needed to predict CO2 emissions.',
+        no_side_effects=True
     )
 
     ############################################################################
@@ -277,6 +385,7 @@ def model():
         function=dsp_utl.SubDispatch(physical()),
         inputs=['data.prediction.models_nedc_h', 'input.prediction.nedc_h'],
         outputs=['output.prediction.nedc_h'],
+        no_side_effects=True
     )
 
     ############################################################################
@@ -288,6 +397,7 @@ def model():
         function=dsp_utl.SubDispatch(physical()),
         inputs=['data.prediction.models_nedc_l', 'input.prediction.nedc_l'],
         outputs=['output.prediction.nedc_l'],
+        no_side_effects=True
     )
 
     return d
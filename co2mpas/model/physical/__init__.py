@@ -136,6 +136,22 @@ def predict_vehicle_electrics_and_engine_behavior(
     :rtype: tuple[numpy.array]
     """
 
+    from .defaults import dfl
+    d = dfl.functions.predict_vehicle_electrics_and_engine_behavior
+    if d.enable_compiled_kernel:
+        res = _predict_vehicle_electrics_and_engine_behavior_compiled(
+            electrics_model, start_stop_model,
+            engine_temperature_regression_model, initial_engine_temperature,
+            initial_state_of_charge, idle_engine_speed, times,
+            final_drive_powers_in, gear_box_speeds_in, gear_box_powers_in,
+            velocities, accelerations, gears, start_stop_activation_time,
+            correct_start_stop_with_gears, min_time_engine_on_after_start,
+            has_start_stop, use_basic_start_stop,
+            max_engine_coolant_temperature
+        )
+        if res is not None:
+            return res
+
     from .engine import calculate_engine_speeds_out_hot
 
     soc = np.zeros((len(times) + 1,), dtype=float)
@@ -187,6 +203,70 @@ def predict_vehicle_electrics_and_engine_behavior(
     return alt_c, bat_c, soc[1:], alt_sts, on, st, np.array(eng_s), temp[1:]
 
 
+def _predict_vehicle_electrics_and_engine_behavior_compiled(
+        electrics_model, start_stop_model, engine_temperature_regression_model,
+        initial_engine_temperature, initial_state_of_charge, idle_engine_speed,
+        times, final_drive_powers_in, gear_box_speeds_in, gear_box_powers_in,
+        velocities, accelerations, gears, start_stop_activation_time,
+        correct_start_stop_with_gears, min_time_engine_on_after_start,
+        has_start_stop, use_basic_start_stop, max_engine_coolant_temperature):
+    # Same as `predict_vehicle_electrics_and_engine_behavior`, but with the
+    # compiled thermal and electric models.
+    # Returns None if the models cannot be compiled.
+    from .engine.thermal import ThermalModel
+    from .engine.start_stop import StartStopModel
+    from .electrics import ElectricModel
+    if not (isinstance(engine_temperature_regression_model, ThermalModel) and
+            isinstance(start_stop_model, StartStopModel) and
+            isinstance(electrics_model, ElectricModel)):
+        return None
+
+    derivative = engine_temperature_regression_model.compile()
+    electrics = electrics_model.compile()
+    idle, max_temp = idle_engine_speed[0], max_engine_coolant_temperature
+
+    n = len(times)
+    alt_c, bat_c, eng_s = np.zeros((3, n), dtype=float)
+    alt_sts = np.zeros(n, dtype=int)
+    on_eng, eng_st = np.zeros((2, n), dtype=bool)
+
+    # The start/stop samples read lazily the feedback values.
+    temp = [initial_engine_temperature] * (n + 1)
+    soc = [initial_state_of_charge] * (n + 1)
+    gen = start_stop_model.yield_on_start(
+        times, velocities.tolist(), accelerations.tolist(), temp, soc,
+        gears=gears, start_stop_activation_time=start_stop_activation_time,
+        correct_start_stop_with_gears=correct_start_stop_with_gears,
+        min_time_engine_on_after_start=min_time_engine_on_after_start,
+        has_start_stop=has_start_stop, use_basic_start_stop=use_basic_start_stop
+    )
+
+    T, s_o_c = initial_engine_temperature, initial_state_of_charge
+    sts, b_c = 0, None
+
+    it = zip(
+        range(n), gen, np.append([0], np.diff(times)).tolist(), times.tolist(),
+        accelerations.tolist(), gear_box_powers_in.tolist(),
+        gear_box_speeds_in.tolist(), final_drive_powers_in.tolist()
+    )
+    for i, (on, start), dt, t, a, gbp, s, fdp in it:
+        on_eng[i], eng_st[i] = on, start
+
+        # Engine speed and temperature.
+        e_s = eng_s[i] = max(idle, s) if on else 0
+        delta_temp = derivative((T, fdp, e_s, a)) * dt
+        T += min(delta_temp, max_temp - T)
+        temp[i + 1] = T
+
+        # Electrics.
+        c, sts, b_c, s_o_c = electrics(dt, gbp, a, t, on, start, sts, b_c,
+                                       s_o_c)
+        alt_c[i], alt_sts[i], bat_c[i], soc[i + 1] = c, sts, b_c, s_o_c
+
+    soc, temp = np.array(soc[1:]), np.array(temp[1:])
+    return alt_c, bat_c, soc, alt_sts, on_eng, eng_st, eng_s, temp
+
+
 def physical():
     """
     Defines the CO2MPAS physical model.
@@ -12,7 +12,6 @@ It contains functions that model the basic mechanics of the clutch.
 import scipy.optimize as sci_opt
 import sklearn.linear_model as sk_lim
 import co2mpas.utils as co2_utl
-import functools
 import co2mpas.dispatcher.utils as dsp_utl
 import co2mpas.dispatcher as dsp
 import numpy as np
@@ -40,12 +39,11 @@ def calculate_clutch_phases(times, gear_shifts, clutch_window):
     """
 
     dn, up = clutch_window
-    b = np.zeros_like(times, dtype=bool)
+    ts = times[gear_shifts]
+    i = np.searchsorted(times, ts + dn, side='left')
+    j = np.searchsorted(times, ts + up, side='right')
 
-    for t in times[gear_shifts]:
-        b |= (t + dn <= times) & (times <= t + up)
-
-    return b
+    return co2_utl.intervals_mask(times.shape[0], i, j)
 
 
 def identify_clutch_speeds_delta(
@@ -145,13 +143,26 @@ def identify_clutch_window(
         random_state=0
     )
 
-    phs = functools.partial(calculate_clutch_phases, times, gear_shifts)
+    # Previous and next gear shift times, to get the candidate clutch phases
+    # (i.e., clutch windows that include the shift) with two comparisons.
+    ts = times[gear_shifts]
+    t_prev = np.append(-np.inf, ts)[np.searchsorted(ts, times, side='right')]
+    t_next = np.append(ts, np.inf)[np.searchsorted(ts, times, side='left')]
 
     delta = engine_speeds_out - engine_speeds_out_hot - cold_start_speeds_delta
     threshold = np.std(delta) * 2
+    b = (-threshold > delta) | (delta > threshold)
+    errors = {}  # Windows with the same clutch phases have the same error.
 
     def _error(v):
-        clutch_phases = phs(v) & ((-threshold > delta) | (delta > threshold))
+        dn, up = v
+        clutch_phases = ((times <= t_prev + up) | (t_next + dn <= times)) & b
+        key = np.packbits(clutch_phases).tobytes()
+        if key not in errors:
+            errors[key] = _clutch_phases_error(clutch_phases)
+        return errors[key]
+
+    def _clutch_phases_error(clutch_phases):
         if clutch_phases.any():
 
             y = delta[clutch_phases]
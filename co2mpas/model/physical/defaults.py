@@ -216,6 +216,39 @@ class Functions(co2_utl.Constants):
         #: Use co2 error function against co2_emissions on the third step? [-]
         third_step_against_emissions = False
 
+        #: Calibration method of the co2_params (see calibrate_model_params).
+        calibration_method = 'nelder'
+
+    class calibrate_model_params(co2_utl.Constants):
+        #: Number of candidates of the population-based methods [-].
+        population_size = 40
+
+        #: Relative spread of the initial candidates around the guess [-].
+        population_spread = 0.5
+
+        #: Seed of the random generator of the population-based methods [-].
+        seed = 0
+
+        #: Number of starting points (initial guess included) of the
+        #: `multistart` method [-].
+        n_starts = 3
+
+        #: Max number of generations of the `population` method [-].
+        max_generations = 200
+
+        #: Relative std of the errors to stop the `population` method [-].
+        population_tol = 1e-6
+
+        #: Differential weight of the `population` method [-].
+        mutation = 0.7
+
+        #: Crossover probability of the `population` method [-].
+        recombination = 0.9
+
+    class predict_vehicle_electrics_and_engine_behavior(co2_utl.Constants):
+        #: Simulate the coupled start/stop, thermal, and electrics models with
+        #: the compiled step kernel (models lowered to plain functions)? [-]
+        enable_compiled_kernel = True
 
     class identify_co2_emissions(co2_utl.Constants):
         #: Number of perturbations to identify the co2_emissions [-].
@@ -242,6 +275,11 @@ class Functions(co2_utl.Constants):
         #: Minimum delta soc to set the charging boundaries [%].
         min_delta_soc = 8
 
+    class AlternatorCurrentModel(co2_utl.Constants):
+        #: Max number of cells of the lookup tables of the compiled alternator
+        #: current models (see `co2mpas.utils.compile_predictor`) [-].
+        max_lookup_cells = 2 ** 15
+
     class default_ki_factor(co2_utl.Constants):
         #: Correction for vehicles with periodically regenerating systems [-].
         ki_factor = {True: 1.05, False: 1.0}
@@ -282,6 +320,11 @@ class Functions(co2_utl.Constants):
         #: Max standard deviation percentage of median value [-].
         MAX_STD_PERC = 0.3
 
+    class ThermalModel(co2_utl.Constants):
+        #: Max number of cells of the lookup tables of the compiled engine
+        #: temperature models (see `co2mpas.utils.compile_predictor`) [-].
+        max_lookup_cells = 2 ** 15
+
     class DefaultStartStopModel(co2_utl.Constants):
         #: Maximum allowed velocity to stop the engine [km/h].
         stop_velocity = 2.0
@@ -365,6 +408,14 @@ class Functions(co2_utl.Constants):
         #: Specific gear shifting model.
         SPECIFIC_GEAR_SHIFTING = 'ALL'
 
+    class at_models_selector(co2_utl.Constants):
+        #: Number of worker processes to calibrate and score the A/T gear
+        #: shifting models (1 = serially in the gear box model, 0 = all cpus).
+        #: With a pool, only the selected model is among the calibration
+        #: outputs, and the models after one that cannot be outranked are not
+        #: calibrated and get `nan` errors in the `at_scores` [-].
+        jobs = 1
+
     class default_clutch_k_factor_curve(co2_utl.Constants):
         #: Torque ratio when speed ratio==0 for clutch model.
         STAND_STILL_TORQUE_RATIO = 1.0
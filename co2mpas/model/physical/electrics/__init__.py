@@ -465,6 +465,12 @@ class AlternatorCurrentModel(object):
         self.init_model = default_model
         self.init_mask = None
         self.base_model = sk_ens.GradientBoostingRegressor
+        self._compiled = None
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d['_compiled'] = None
+        return d
 
     def predict(self, X, init_time=0.0):
         X = np.asarray(X)
@@ -527,6 +533,39 @@ class AlternatorCurrentModel(object):
             return min(0.0, self.init_model(arr[:, self.init_mask])[0])
         return min(0.0, self.model(arr[:, self.mask])[0])
 
+    def compile(self):
+        """
+        Returns the alternator current model with the fitted trees lowered to
+        flat arrays (see :func:`co2mpas.utils.compile_predictor`).
+
+        :return:
+            Alternator current model, with the same arguments and results of
+            the model call.
+        :rtype: callable
+        """
+        key = self.model, self.mask, self.init_model, self.init_mask
+        compiled = getattr(self, '_compiled', None)
+        if compiled is None or any(a is not b for a, b in zip(compiled, key)):
+            from ..defaults import dfl
+            n = dfl.functions.AlternatorCurrentModel.max_lookup_cells
+
+            def _compile(model, mask):
+                func = co2_utl.compile_predictor(model, mask, max_cells=n)
+                return func or (lambda x: model(np.array([x])[:, mask])[0])
+
+            model = _compile(self.model, self.mask)
+            if self.init_model is self.model and self.init_mask is self.mask:
+                init_model = model
+            else:
+                init_model = _compile(self.init_model, self.init_mask)
+
+            def predict(time, soc, status, *args):
+                x = (time, soc, status) + args
+                return min(0.0, (init_model if status == 3 else model)(x))
+
+            compiled = self._compiled = key + (predict,)
+        return compiled[-1]
+
 
 def calibrate_alternator_current_model(
         alternator_currents, on_engine, times, state_of_charges,
@@ -781,11 +820,17 @@ def identify_alternator_starts_windows(
     :rtype: numpy.array
     """
 
-    starts_windows = np.zeros_like(times, dtype=bool)
     dt = alternator_start_window_width / 2
-    for i, j in _starts_windows(times, engine_starts, dt):
-        b = (alternator_currents[i:j] >= alternator_current_threshold).any()
-        starts_windows[i:j] = b
+    i, j = _starts_windows(times, engine_starts, dt).T
+    c = alternator_currents >= alternator_current_threshold
+    c = np.append(0, np.cumsum(c))
+    b = c[j] > c[np.minimum(i, j)]  # Windows with an alternator start.
+
+    # The last window covering a sample defines its value.
+    n = times.shape[0]
+    k = np.searchsorted(i, np.arange(n), side='right') - 1
+    starts_windows = co2_utl.intervals_mask(n, i, j)
+    starts_windows[starts_windows] = b[k[starts_windows]]
     return starts_windows
 
 
@@ -884,20 +929,58 @@ class Alternator_status_model(object):
         return self
 
     def predict(self, has_energy_rec, init_time, time, prev, soc, power):
-        status = 0
+        return _predict_alternator_status(
+            lambda x: self.charge([x])[0], lambda x: self.bers([x])[0],
+            self.min, self.max, has_energy_rec, init_time, time, prev, soc,
+            power
+        )
+
+    def compile(self, has_energy_rec, init_time):
+        """
+        Returns the alternator status model with the fitted classifiers
+        lowered to flat lists (see :func:`co2mpas.utils.compile_predictor`).
+
+        :param has_energy_rec:
+            Does the vehicle have energy recuperation features?
+        :type has_energy_rec: bool
+
+        :param init_time:
+            Alternator initialization time [s].
+        :type init_time: float
+
+        :return:
+            Alternator status model, function of (time, prev_status, soc,
+            gear_box_power_in).
+        :rtype: callable
+        """
+        def _compile(model):
+            func = co2_utl.compile_predictor(model)
+            return func or (lambda x: model([x])[0])
+
+        return functools.partial(
+            _predict_alternator_status, _compile(self.charge),
+            _compile(self.bers), self.min, self.max, has_energy_rec, init_time
+        )
 
-        if soc < 100:
-            x = [(prev, soc)]
-            if time < init_time:
-                status = 3
 
-            elif soc < self.min or (soc <= self.max and self.charge(x)[0]):
-                status = 1
+def _predict_alternator_status(
+        charge, bers, min_soc, max_soc, has_energy_rec, init_time, time, prev,
+        soc, power):
+    # Alternator status of `Alternator_status_model`, where `charge` and `bers`
+    # predict a single sample.
+    status = 0
 
-            elif has_energy_rec and self.bers([(power,)])[0]:
-                status = 2
+    if soc < 100:
+        if time < init_time:
+            status = 3
 
-        return status
+        elif soc < min_soc or (soc <= max_soc and charge((prev, soc))):
+            status = 1
+
+        elif has_energy_rec and bers((power,)):
+            status = 2
+
+    return status
 
 
 def calibrate_alternator_status_model(
@@ -1019,18 +1102,46 @@ class ElectricModel(object):
         self.has_energy_recuperation = has_energy_recuperation
         self.alternator_initialization_time = alternator_initialization_time
 
-        from .electrics_prediction import _predict_electrics
-        self.predict = functools.partial(
-            _predict_electrics, battery_capacity,
+        self.predict = self._predictor(
             functools.partial(alternator_status_model, has_energy_recuperation,
                               alternator_initialization_time),
-            max_alternator_current, alternator_current_model,
-            max_battery_charging_current, alternator_nominal_voltage,
-            start_demand, electric_load)
+            alternator_current_model
+        )
 
     def __call__(self, *args, **kwargs):
         return self.predict(*args, **kwargs)
 
+    def _predictor(self, alternator_status_model, alternator_current_model):
+        from .electrics_prediction import _predict_electrics
+        return functools.partial(
+            _predict_electrics, self.battery_capacity, alternator_status_model,
+            self.max_alternator_current, alternator_current_model,
+            self.max_battery_charging_current, self.alternator_nominal_voltage,
+            self.start_demand, self.electric_load)
+
+    def compile(self):
+        """
+        Returns the electrics model with the alternator status and current
+        models compiled.
+
+        :return:
+            Electrics model, with the same arguments and results of `predict`.
+        :rtype: callable
+        """
+        status = self.alternator_status_model
+        has_rec = self.has_energy_recuperation
+        init_time = self.alternator_initialization_time
+        if isinstance(status, Alternator_status_model):
+            status = status.compile(has_rec, init_time)
+        else:
+            status = functools.partial(status, has_rec, init_time)
+
+        current = self.alternator_current_model
+        if isinstance(current, AlternatorCurrentModel):
+            current = current.compile()
+
+        return self._predictor(status, current)
+
 
 def define_electrics_model(
         battery_capacity, alternator_status_model, max_alternator_current,
@@ -1144,11 +1255,15 @@ def predict_vehicle_electrics(
     :rtype: (numpy.array, numpy.array, numpy.array, numpy.array)
     """
 
+    if isinstance(electrics_model, ElectricModel):
+        electrics_model = electrics_model.compile()
+
     delta_times = np.append([0], np.diff(times))
     o = (0, 0, None, initial_state_of_charge)
     res = [o]
-    for x in zip(delta_times, gear_box_powers_in, accelerations, times,
-                 on_engine, engine_starts):
+    args = (delta_times, gear_box_powers_in, accelerations, times, on_engine,
+            engine_starts)
+    for x in zip(*(np.asarray(v).tolist() for v in args)):
         o = tuple(electrics_model(*(x + o[1:])))
         res.append(o)
 
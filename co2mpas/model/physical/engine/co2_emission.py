@@ -9,6 +9,7 @@
 It contains functions to predict the CO2 emissions.
 """
 
+import collections
 import copy
 import functools
 import itertools
@@ -118,13 +119,23 @@ def calculate_normalized_engine_coolant_temperatures(
 
     :param temperature_target:
         Normalization temperature [°C].
-    :type temperature_target: float
+
+        If it is a column vector, it returns one row of normalized temperatures
+        for each target.
+    :type temperature_target: float | numpy.array
 
     :return:
         Normalized engine coolant temperature [-].
     :rtype: numpy.array
     """
 
+    if np.ndim(temperature_target):
+        trg = np.reshape(temperature_target, (-1, 1))
+        i = np.searchsorted(engine_coolant_temperatures, trg.ravel())
+        b = np.arange(len(engine_coolant_temperatures)) < i[:, None]
+        T = (engine_coolant_temperatures + 273.0) / (trg + 273.0)
+        return np.where(b, T, 1.0)
+
     i = np.searchsorted(engine_coolant_temperatures, (temperature_target,))[0]
     # Only flatten-out hot-part if `max-theta` is above `trg`.
     T = np.ones_like(engine_coolant_temperatures, dtype=float)
@@ -384,7 +395,7 @@ class FMEP(object):
                     pass
         return out
 
-    def combination(self, params, n_speeds, n_powers, n_temp):
+    def _combinations(self, params, n_speeds, n_powers, n_temp):
         a = self.acr(params, n_speeds, n_powers, n_temp)
         a = self.lb(params, n_speeds, n_powers, n_temp, a=a)
         a = self.vva(params, n_powers, a=a)
@@ -392,17 +403,11 @@ class FMEP(object):
         a = self._check_combinations(a)
 
         keys, c = zip(*sorted(a.items()))
-        p = params.copy()
-        p.update({
-            'n_speeds': n_speeds,
-            'n_powers': n_powers,
-            'n_temperatures': n_temp
-        })
         for s in itertools.product(*c):
             b, d = True, {}
 
             for k, (v, n) in zip(keys, s):
-                b &= n
+                b = b & n  # Masks may have different shapes.
                 d[k] = v
             try:
                 if b is False or not b.any():
@@ -412,6 +417,16 @@ class FMEP(object):
             except AttributeError:
                 pass
 
+            yield d, b
+
+    def combination(self, params, n_speeds, n_powers, n_temp):
+        p = params.copy()
+        p.update({
+            'n_speeds': n_speeds,
+            'n_powers': n_powers,
+            'n_temperatures': n_temp
+        })
+        for d, b in self._combinations(params, n_speeds, n_powers, n_temp):
             p.update(d)
             yield {k: self.g(v, b) for k, v in p.items()}, d, b
 
@@ -425,24 +440,87 @@ class FMEP(object):
         return data
 
     def __call__(self, params, n_speeds, n_powers, n_temp):
-        it = self.combination(params, n_speeds, n_powers, n_temp)
-        s = None
-        for p, d, n in it:
-            d['fmep'], d['v'] = _calculate_fc(*_fuel_ABC(**p))
-            if s is None:
-                s = d
-            else:
-                b = d['fmep'] < s['fmep']
-                if n is True and b is True:
-                    s = d
-                elif b is not False:
-                    n &= b
-                    if n.all():
-                        s = d
-                    elif n.any():
-                        for k, v in d.items():
-                            s[k] = np.where(n, v, s[k])
+        """
+        Evaluates all technology combinations as one stacked array and selects
+        the one with the minimum fmep.
 
+        The first combination with the minimum fmep wins, as it would if the
+        combinations were compared one after the other.
+        """
+        p = params.copy()
+        p.update({
+            'n_speeds': n_speeds,
+            'n_powers': n_powers,
+            'n_temperatures': n_temp
+        })
+        ids = set(defaults.dfl.functions._tech_mult_factors.factors)
+        combs, masks, tech = [], [], []
+        for d, b in self._combinations(params, n_speeds, n_powers, n_temp):
+            p.update(d)
+            combs.append(d)
+            masks.append(b)
+            kw = p.copy()
+            if b is not True:  # Technologies of the valid samples only.
+                for k in ids.intersection(kw):
+                    if np.ndim(kw[k]):
+                        v, m = np.broadcast_arrays(kw[k], b)
+                        kw[k] = np.where(m, v, v[m][0])
+            tech.append(_tech_mult_factors(**kw))
+
+        n = len(combs)
+        if n == 1:  # Nothing to select.
+            s = combs[0]
+            s['fmep'], s['v'] = _calculate_fc(*_ABC(**tech[0]))
+            return self._outputs(params, s)
+
+        # Tau is not used with the normalized temperatures equal to 1.
+        hot = _is_hot(n_temp)
+        shapes = {v.shape for d in tech for k, v in d.items()
+                  if isinstance(v, np.ndarray) and (k != 't' or not hot)}
+        shape = np.broadcast(*[np.empty(s, bool) for s in shapes | {()}]).shape
+
+        if shape:
+            fmep, v = np.empty((n,) + shape), np.empty((n,) + shape)
+            groups = {}  # Parameter sets with the same acr and validity.
+            for i, (d, b) in enumerate(zip(tech, masks)):
+                groups.setdefault((d.get('acr', 1), b is True), []).append(i)
+
+            for i in groups.values():
+                fmep[i], v[i] = _stacked_fc(
+                    [tech[j] for j in i], [masks[j] for j in i], shape
+                )
+        else:  # Scalar values.
+            fmep, v = zip(*[_calculate_fc(*_ABC(**d)) for d in tech])
+
+        # Invalid or nan values of the following combinations never win.
+        fmep_min = np.array(fmep)
+        b = np.isnan(fmep_min)
+        b[0] = False
+        fmep_min[b] = np.inf
+        for f, b in zip(fmep_min, masks):
+            if b is not True:
+                f[np.broadcast_to(~b, f.shape)] = np.inf
+        i = fmep_min.argmin(0)
+
+        k = np.ravel(i)[0]
+        if (i == k).all():  # The same combination for all samples.
+            s = combs[k]
+            s['fmep'], s['v'] = fmep[k], v[k]
+        else:
+            j = np.ravel(i), np.arange(np.size(i))
+
+            def _select(values):
+                if not any(np.ndim(x) for x in values):
+                    return np.array(values)[i]
+                v = _stack(values, shape, broadcast=True)
+                return v.reshape(n, -1)[j].reshape(shape)
+
+            s = {k: _select([d[k] for d in combs]) for k in combs[0]}
+            s['fmep'], s['v'] = _select(fmep), _select(v)
+
+        return self._outputs(params, s)
+
+    def _outputs(self, params, s):
         acr = s.get('acr', params.get('acr', self.base_acr))
         vva = s.get('vva', params.get('vva', 0))
         lb = s.get('lb', params.get('lb', 0))
@@ -582,6 +660,11 @@ def _fuel_ABC(n_speeds, **kw):
     return _ABC(n_speeds, **_tech_mult_factors(**kw))
 
 
+def _is_hot(n_temperatures):
+    # Normalized temperatures are all equal to 1, hence tau is not used.
+    return np.all(np.asarray(n_temperatures) == 1)
+
+
 # noinspection PyUnusedLocal
 def _ABC(
     n_speeds, n_powers=0, n_temperatures=1,
@@ -591,13 +674,60 @@ def _ABC(
     A = a2 / acr2 + (b2 / acr2) * n_speeds
     B = a / acr + (b / acr + (c / acr) * n_speeds) * n_speeds
     C = l + l2 * n_speeds ** 2
-    if n_temperatures is not 1:
+    if not _is_hot(n_temperatures):
         C *= np.power(n_temperatures, -t)
     C -= n_powers / acr
 
     return A, B, C
 
 
+def _stack(values, shape, broadcast=False):
+    # Stacks the values of each combination along a new first axis.
+    if all(isinstance(v, np.ndarray) for v in values):
+        v = np.array(values)
+        if v.shape[1:] == shape:
+            return v
+    elif not any(np.ndim(v) for v in values):
+        v = np.array(values).reshape((-1,) + (1,) * len(shape))
+        if not broadcast:
+            return v
+        return np.broadcast_to(v, (len(values),) + shape)
+    return np.array([np.broadcast_to(v, shape) for v in values])
+
+
+def _stacked_fc(params, masks, shape):
+    """
+    Evaluates `_calculate_fc(*_ABC(**p))` of parameter sets with the same acr
+    and validity in one stacked array.
+
+    Partially valid sets are evaluated as masked arrays, hence each value is
+    computed with the same floating point operations of a separate evaluation.
+    """
+    p, n = params[0].copy(), len(params)
+    for k in ('a2', 'b2', 'a', 'b', 'c', 't', 'l', 'l2'):
+        if k in p and any(d[k] is not p[k] for d in params):
+            p[k] = _stack([d[k] for d in params], shape)
+
+    # Force the output shape.
+    p['l'] = np.broadcast_to(p.get('l', 0), (n,) + shape)
+
+    if masks[0] is not True:
+        s = np.broadcast_to(p['n_speeds'], (n,) + shape)
+        b = ~_stack(masks, shape, broadcast=True)
+        p['n_speeds'] = ma.masked_array(s, mask=b, copy=False)
+
+    A, B, C = _ABC(**p)
+
+    b = np.array(np.broadcast_to(A, (n,) + shape), dtype=bool)
+    b = b.reshape(n, -1).all(1)
+    if n > 1 and b.any() and not b.all():  # Mixed formulas.
+        fc, v = zip(*map(_stacked_fc, ([d] for d in params),
+                         ([b] for b in masks), itertools.repeat(shape)))
+        return np.concatenate(fc), np.concatenate(v)
+
+    return _calculate_fc(A, B, C)
+
+
 def _calculate_fc(A, B, C):
     b = np.array(A, dtype=bool)
     if b.all():
@@ -606,6 +736,9 @@ def _calculate_fc(A, B, C):
     elif ~b.all():
         return -C / B, B
     else:
+        if not np.shape(A) == np.shape(B) == np.shape(C):
+            A, B, C = np.broadcast_arrays(A, B, C)
+            b = np.array(A, dtype=bool)
         fc, v = np.zeros_like(C), np.zeros_like(C)
         fc[b], v[b] = _calculate_fc(A[b], B[b], C[b])
         b = ~b
@@ -683,7 +816,8 @@ def calculate_co2_emissions(
         brake_mean_effective_pressures, engine_coolant_temperatures, on_engine,
         engine_fuel_lower_heating_value, idle_engine_speed, engine_stroke,
         engine_capacity, idle_fuel_consumption_model, fuel_carbon_content,
-        min_engine_on_speed, tau_function, fmep_model, params, sub_values=None):
+        min_engine_on_speed, tau_function, fmep_model, params, sub_values=None,
+        population=None):
     """
     Calculates CO2 emissions [CO2g/s].
 
@@ -757,11 +891,27 @@ def calculate_co2_emissions(
         Boolean vector.
     :type sub_values: numpy.array, optional
 
+    :param population:
+        Matrix of values of the varying `params` (one candidate for each row).
+
+        If given, the outputs are matrices with one row for each candidate.
+    :type population: numpy.array, optional
+
     :return:
         CO2 emissions vector [CO2g/s].
     :rtype: numpy.array
     """
 
+    if population is not None:
+        return _calculate_co2_emissions_population(
+            engine_speeds_out, engine_powers_out, mean_piston_speeds,
+            brake_mean_effective_pressures, engine_coolant_temperatures,
+            engine_fuel_lower_heating_value, idle_engine_speed, engine_stroke,
+            engine_capacity, idle_fuel_consumption_model, fuel_carbon_content,
+            min_engine_on_speed, tau_function, fmep_model, params, population,
+            sub_values=sub_values
+        )
+
     p = params.valuesdict()
 
     # namespace shortcuts
@@ -822,6 +972,84 @@ def calculate_co2_emissions(
     return np.nan_to_num(co2), ac, vva, lb, egr
 
 
+def _population_params(params, population):
+    if isinstance(params, lmfit.Parameters):
+        params = ArrayParameters.from_parameters(params)
+    keys = params.vary_names()
+    population = np.atleast_2d(np.asarray(population, dtype=float))
+    if population.shape[1] != len(keys):
+        raise ValueError('Population columns %d != varying params %s.'
+                         % (population.shape[1], keys))
+    p = params.valuesdict()
+    for k, x in zip(keys, population.T):
+        p[k] = x[:, None]
+    return p, len(population)
+
+
+def _calculate_co2_emissions_population(
+        engine_speeds_out, engine_powers_out, mean_piston_speeds,
+        brake_mean_effective_pressures, engine_coolant_temperatures,
+        engine_fuel_lower_heating_value, idle_engine_speed, engine_stroke,
+        engine_capacity, idle_fuel_consumption_model, fuel_carbon_content,
+        min_engine_on_speed, tau_function, fmep_model, params, population,
+        sub_values=None):
+    """
+    Calculates CO2 emissions [CO2g/s] of a population of model params.
+
+    It is :func:`calculate_co2_emissions` with the varying params as column
+    vectors, hence all candidates are evaluated together as matrices. Results
+    match the separate evaluations apart from floating point rounding.
+    """
+
+    par, m = _population_params(params, population)
+
+    # namespace shortcuts
+    n_speeds, n_powers, e_speeds, e_powers, e_temp = _get_sub_values(
+        mean_piston_speeds, brake_mean_effective_pressures, engine_speeds_out,
+        engine_powers_out, engine_coolant_temperatures, sub_values=sub_values
+    )
+    lhv = engine_fuel_lower_heating_value
+    idle_fc_model = idle_fuel_consumption_model.consumption
+    res = [np.zeros((m,) + e_powers.shape) for _ in range(5)]
+
+    n = (e_speeds < idle_engine_speed[0] + min_engine_on_speed)
+    dfl = defaults.dfl.functions.calculate_co2_emissions
+    idle_cutoff = idle_engine_speed[0] * dfl.cutoff_idle_ratio
+    hot = np.broadcast_to((par['t0'] == 0) & (par['t1'] == 0), (m, 1))
+    for is_hot in (True, False):
+        i = np.flatnonzero(hot.ravel() == is_hot)
+        if not i.size:
+            continue
+        p = {k: v[i] if np.ndim(v) else v for k, v in par.items()}
+        if is_hot:
+            ac_phases, n_temp = None, 1
+            idle = list(idle_fc_model(p))
+        else:
+            p['t'] = tau_function(p['t0'], p['t1'], e_temp)
+            func = calculate_normalized_engine_coolant_temperatures
+            n_temp = func(e_temp, p['trg'])
+            ac_phases = n_temp == 1
+            idle = list(idle_fc_model(p, ac_phases))
+            idle[0] = idle[0] * np.power(n_temp, -p['t'])
+        ec_p0 = _apply_ac_phases(
+            calculate_p0, fmep_model, p, engine_capacity, engine_stroke,
+            idle_cutoff, lhv, ac_phases=ac_phases
+        )
+        _b = (e_speeds >= min_engine_on_speed)
+        _b = _b & ~((e_powers <= ec_p0) & (e_speeds > idle_cutoff))
+
+        fc, _, *tech = fmep_model(p, n_speeds, n_powers, n_temp)
+        fc = fc * (e_speeds * (engine_capacity / (lhv * 1200)))  # [g/sec]
+
+        b_idle, b = n & _b, ~n & _b
+        for r, x, y in zip(res, idle, [fc] + tech):
+            r[i] = np.where(b_idle, x, np.where(b, y, 0))
+
+    co2 = np.maximum(res[0], 0) * fuel_carbon_content
+
+    return (np.nan_to_num(co2),) + tuple(res[1:])
+
+
 def define_co2_emissions_model(
         engine_speeds_out, engine_powers_out, mean_piston_speeds,
         brake_mean_effective_pressures, engine_coolant_temperatures, on_engine,
@@ -953,6 +1181,8 @@ def calculate_cumulative_co2(
 
     :param co2_emissions:
         CO2 instantaneous emissions vector [CO2g/s].
+
+        If it is a matrix, the results are calculated for each row.
     :type co2_emissions: numpy.array
 
     :param phases_distances:
@@ -968,9 +1198,9 @@ def calculate_cumulative_co2(
 
     for p in phases_integration_times:
         i, j = np.searchsorted(times, p)
-        co2.append(sci_itg.trapz(co2_emissions[i:j], times[i:j]))
+        co2.append(sci_itg.trapz(co2_emissions[..., i:j], times[i:j]))
 
-    return np.array(co2) / phases_distances
+    return np.array(co2).T / phases_distances
 
 
 def calculate_cumulative_co2_v1(phases_co2_emissions, phases_distances):
@@ -1255,13 +1485,21 @@ def define_co2_error_function_on_emissions(co2_emissions_model, co2_emissions):
     :return:
         Error function (according to co2 emissions time series) to calibrate the
         CO2 emission model params.
+
+        If a `population` matrix of varying params values is given, it returns
+        the errors of all candidates.
     :rtype: function
     """
 
-    def error_func(params, sub_values=None):
+    def error_func(params, sub_values=None, population=None):
         x = co2_emissions if sub_values is None else co2_emissions[sub_values]
-        y = co2_emissions_model(params, sub_values=sub_values)[0]
-        return np.mean(np.abs(x - y))
+        if population is None:
+            y = co2_emissions_model(params, sub_values=sub_values)[0]
+            return np.mean(np.abs(x - y))
+        y = co2_emissions_model(
+            params, sub_values=sub_values, population=population
+        )[0]
+        return np.mean(np.abs(x - y), axis=-1)
 
     return error_func
 
@@ -1296,13 +1534,15 @@ def define_co2_error_function_on_phases(
     :return:
         Error function (according to co2 emissions phases) to calibrate the CO2
         emission model params.
+
+        If a `population` matrix of varying params values is given, it returns
+        the errors of all candidates.
     :rtype: function
     """
 
-    def error_func(params, phases=None):
-
+    def error_func(params, phases=None, population=None):
+        kw = {} if population is None else {'population': population}
         if phases:
-            co2 = np.zeros_like(times, dtype=float)
             b = np.zeros_like(times, dtype=bool)
             w = []
             for i, p in enumerate(phases_integration_times):
@@ -1313,14 +1553,19 @@ def define_co2_error_function_on_phases(
                 else:
                     w.append(0)
 
-            co2[b] = co2_emissions_model(params, sub_values=b)[0]
+            y = co2_emissions_model(params, sub_values=b, **kw)[0]
+            co2 = np.zeros(y.shape[:-1] + times.shape)
+            co2[..., b] = y
         else:
-            co2 = co2_emissions_model(params)[0]
+            co2 = co2_emissions_model(params, **kw)[0]
             w = None  # cumulative_co2_emissions
 
         cco2 = calculate_cumulative_co2(
             times, phases_integration_times, co2, phases_distances)
-        return sk_met.mean_absolute_error(phases_co2_emissions, cco2, w)
+        if population is None:
+            return sk_met.mean_absolute_error(phases_co2_emissions, cco2, w)
+        e = np.abs(cco2 - phases_co2_emissions)
+        return np.average(e, axis=-1, weights=w)
 
     return error_func
 
@@ -1547,13 +1792,123 @@ def define_tau_function(after_treatment_temperature_threshold):
     return tau_function
 
 
+class ArrayParameters(object):
+    """
+    Array-backed model parameters, a lightweight :class:`lmfit.Parameters`.
+
+    Values, bounds, and vary flags are numpy arrays, hence copies and updates
+    are cheap. It is used internally by the calibration and it is converted
+    from/to :class:`lmfit.Parameters` only at the boundaries.
+
+    Like :attr:`lmfit.Parameter.init_value`, `init_values` are the values at
+    the start of the last fit.
+
+    .. note:: Constraint expressions are not supported.
+    """
+
+    def __init__(self, names, values, min=None, max=None, vary=None):
+        self.names = tuple(names)
+        self.index = {k: i for i, k in enumerate(self.names)}
+        n = len(self.names)
+        self.values = np.array(values, dtype=float)
+        self.min = np.full(n, -np.inf) if min is None else np.array(min, float)
+        self.max = np.full(n, np.inf) if max is None else np.array(max, float)
+        self.vary = np.ones(n, bool) if vary is None else np.array(vary, bool)
+        self.init_values = self.values.copy()
+
+    @classmethod
+    def from_parameters(cls, params):
+        """
+        Converts :class:`lmfit.Parameters` into array-backed parameters.
+
+        :param params:
+            Model parameters.
+        :type params: lmfit.Parameters
+
+        :return:
+            Array-backed model parameters.
+        :rtype: ArrayParameters
+        """
+        names, values, min, max, vary, init = [], [], [], [], [], []
+        for k, p in params.items():
+            names.append(k)
+            values.append(p.value)
+            min.append(-np.inf if p.min is None else p.min)
+            max.append(np.inf if p.max is None else p.max)
+            vary.append(p.vary and p.expr is None)
+            init.append(np.nan if p.init_value is None else p.init_value)
+        p = cls(names, values, min, max, vary)
+        p.init_values[:] = init
+        return p
+
+    def to_parameters(self, params):
+        """
+        Converts array-backed parameters into :class:`lmfit.Parameters`.
+
+        :param params:
+            Parameters template (e.g., the source of :meth:`from_parameters`).
+
+            Only the changed attributes are set on its copy.
+        :type params: lmfit.Parameters
+
+        :return:
+            Model parameters.
+        :rtype: lmfit.Parameters
+        """
+        params = copy.deepcopy(params)
+        it = zip(self.names, self.values, self.min, self.max, self.vary,
+                 self.init_values)
+        for k, v, m, n, vary, iv in it:
+            p = params[k]
+            if p.vary != vary:
+                p.vary = bool(vary)
+            if (-np.inf if p.min is None else p.min) != m:
+                p.min = m
+            if (np.inf if p.max is None else p.max) != n:
+                p.max = n
+            if p._val != v:
+                p.value = v
+            if p.init_value != iv and not np.isnan(iv):
+                p.init_value = iv
+        return params
+
+    def copy(self):
+        p = self.__class__.__new__(self.__class__)
+        p.names, p.index = self.names, self.index
+        p.values, p.vary = self.values.copy(), self.vary.copy()
+        p.min, p.max = self.min.copy(), self.max.copy()
+        p.init_values = self.init_values.copy()
+        return p
+
+    def valuesdict(self):
+        return collections.OrderedDict(zip(self.names, self.values))
+
+    def vary_names(self):
+        return [k for k, v in zip(self.names, self.vary) if v]
+
+    def value(self, name):
+        return self.values[self.index[name]]
+
+    def set(self, name, value=None, vary=None, min=None, max=None):
+        i = self.index[name]
+        for a, v in (('values', value), ('vary', vary), ('min', min),
+                     ('max', max)):
+            if v is not None:
+                getattr(self, a)[i] = v
+
+        if lmfit.parameter.isclose(self.min[i], self.max[i], atol=1e-13,
+                                   rtol=1e-13):
+            self.values[i] = np.mean((self.max[i], self.min[i]))
+            self.min[i], self.max[i], self.vary[i] = -np.inf, np.inf, False
+
+
 def _set_attr(params, data, default=False, attr='vary'):
     """
     Set attribute to CO2 emission model parameters.
 
     :param params:
         CO2 emission model parameters (a2, b2, a, b, c, l, l2, t, trg).
-    :type params: lmfit.Parameters
+    :type params: lmfit.Parameters | ArrayParameters
 
     :param data:
         Parameter ids to be set or key/value to set.
@@ -1569,11 +1924,16 @@ def _set_attr(params, data, default=False, attr='vary'):
 
     :return:
         CO2 emission model parameters.
-    :rtype: lmfit.Parameters
+    :rtype: lmfit.Parameters | ArrayParameters
     """
     if not isinstance(data, dict):
         data = dict.fromkeys(data, default)
 
+    if isinstance(params, ArrayParameters):
+        for k, v in data.items():
+            params.set(k, **{attr: v})
+        return params
+
     d = {'min', 'max', 'value', 'vary', 'expr'} - {attr}
 
     for k, v in data.items():
@@ -1625,23 +1985,26 @@ def calibrate_co2_params(
     :rtype: (lmfit.Parameters, list)
     """
 
-    p = copy.deepcopy(co2_params_initial_guess)
-    vary = {k: v.vary for k, v in p.items()}
-    values = {k: v._val for k, v in p.items()}
+    p = ArrayParameters.from_parameters(co2_params_initial_guess)
+    vary = dict(zip(p.names, p.vary))
+    values = {k: v._val for k, v in co2_params_initial_guess.items()}
 
     cold = np.zeros_like(engine_coolant_temperatures, dtype=bool)
     if not is_cycle_hot:
-        i = co2_utl.argmax(engine_coolant_temperatures >= p['trg'].value)
+        i = co2_utl.argmax(engine_coolant_temperatures >= p.value('trg'))
         cold[:i] = True
     hot = ~cold
 
-    success = [(True, copy.deepcopy(p))]
+    success = [(True, p.copy())]
+    method = defaults.dfl.functions.calibrate_co2_params.calibration_method
 
     def calibrate(id_p, p, **kws):
         _set_attr(p, id_p, default=False)
-        p, s = calibrate_model_params(co2_error_function_on_emissions, p, **kws)
+        p, s = calibrate_model_params(
+            co2_error_function_on_emissions, p, method=method, **kws
+        )
         _set_attr(p, vary)
-        success.append((s, copy.deepcopy(p)))
+        success.append((s, p.copy()))
         return p
 
     cold_p = ['t0', 't1']
@@ -1649,14 +2012,14 @@ def calibrate_co2_params(
         _set_attr(p, ['t0', 't1'], default=0.0, attr='value')
         p = calibrate(cold_p, p, sub_values=hot)
     else:
-        success.append((True, copy.deepcopy(p)))
+        success.append((True, p.copy()))
 
     if cold.any():
         _set_attr(p, {'t0': values['t0'], 't1': values['t1']}, attr='value')
         hot_p = ['a2', 'a', 'b', 'c', 'l', 'l2']
         p = calibrate(hot_p, p, sub_values=cold)
     else:
-        success.append((True, copy.deepcopy(p)))
+        success.append((True, p.copy()))
         _set_attr(p, ['t0', 't1'], default=0.0, attr='value')
         _set_attr(p, cold_p, default=False)
 
@@ -1667,15 +2030,19 @@ def calibrate_co2_params(
             err = co2_error_function_on_emissions
         else:
             err = co2_error_function_on_phases
-        p, s = calibrate_model_params(err, p)
+        p, s = calibrate_model_params(err, p, method=method)
 
     else:
         s = True
 
-    success.append((s, copy.deepcopy(p)))
+    success.append((s, p))
+    p = p.copy()
     _set_attr(p, vary)
 
-    return p, success
+    p0 = co2_params_initial_guess
+    success = [(s, q.to_parameters(p0)) for s, q in success]
+
+    return p.to_parameters(p0), success
 
 
 def restrict_bounds(co2_params):
@@ -1723,20 +2090,34 @@ def calibrate_model_params(
     :param params:
         Initial guess of model params.
 
-        If not specified a brute force is used to identify the best initial
-        guess with in the bounds.
-    :type params: dict, optional
+        The error function is evaluated with the array-backed version of
+        them, that is converted back to the input type at the end.
+    :type params: lmfit.Parameters | ArrayParameters
 
     :param method:
         Name of the fitting method to use.
+
+        Besides the lmfit ones, `'multistart'` refines with nelder the initial
+        guess and the best candidates of a random population, while
+        `'population'` is a differential evolution polished with nelder. Both
+        evaluate the candidates in batches, hence the error function has to
+        accept a `population` keyword (see
+        :func:`define_co2_error_function_on_emissions`).
     :type method: str, optional
 
     :return:
-        Calibrated model params.
-    :rtype: dict
+        Calibrated model params and if the calibration succeeded.
+    :rtype: (lmfit.Parameters | ArrayParameters, bool)
     """
 
-    if not any(p.vary for p in params.values()):
+    if isinstance(params, lmfit.Parameters):
+        p, s = calibrate_model_params(
+            error_function, ArrayParameters.from_parameters(params), *args,
+            method=method, **kws
+        )
+        return p.to_parameters(params), s
+
+    if not params.vary.any():
         return params, True
 
     if callable(error_function):
@@ -1745,13 +2126,18 @@ def calibrate_model_params(
         def error_f(p, *a, **k):
             return sum(f(p, *a, **k) for f in error_function)
 
-    min_e_and_p = [np.inf, copy.deepcopy(params)]
+    if method == 'multistart':
+        return _calibrate_multistart(error_f, params, *args, **kws)
+    elif method == 'population':
+        return _calibrate_population(error_f, params, *args, **kws)
+
+    min_e_and_p = [np.inf, params.copy()]
 
     def error_func(params, *args, **kwargs):
         res = error_f(params, *args, **kwargs)
 
         if res < min_e_and_p[0]:
-            min_e_and_p[0], min_e_and_p[1] = (res, copy.deepcopy(params))
+            min_e_and_p[0], min_e_and_p[1] = (res, params.copy())
 
         return res
 
@@ -1767,10 +2153,102 @@ def calibrate_model_params(
     # slsqp is unstable (4 runs, 4 vehicles) [average time 18s/4 vehicles].
     # differential_evolution is unstable (1 runs, 4 vehicles)
     # [average time 270s/4 vehicles].
-    res = _minimize(error_func, params, args=args, kws=kws, method=method)
+    p, success = _lmfit_minimize(error_func, params, method, args, kws)
 
+    p = p if success else min_e_and_p[1]
+    p.init_values = params.values.copy()
+    return p, success
+
+
+def _lmfit_minimize(fcn, params, method, args=(), kws=None):
+    """
+    Minimizes `fcn` with lmfit, evaluating it with array-backed params.
+
+    A single :class:`lmfit.Parameters` is built for the whole fit, while `fcn`
+    receives cheap :class:`ArrayParameters` copies of its values.
+    """
+    names, template = params.names, lmfit.Parameters()
+    it = zip(names, params.values, params.min, params.max, params.vary)
+    for k, v, lower, upper, vary in it:
+        template.add(k, value=v, min=lower, max=upper, vary=bool(vary))
+
+    def error_func(par, *a, **kw):
+        p = params.copy()
+        p.values[:] = [par[k].value for k in names]
+        return fcn(p, *a, **kw)
+
+    res = _minimize(error_func, template, args=args, kws=kws, method=method)
+    p = params.copy()
+    p.values[:] = [res.params[k].value for k in names]
     # noinspection PyUnresolvedReferences
-    return (res.params if res.success else min_e_and_p[1]), res.success
+    return p, res.success
+
+
+def _initial_population(params, rng):
+    dfl = defaults.dfl.functions.calibrate_model_params
+    i = np.flatnonzero(params.vary)
+    x0 = params.values[i]
+    s = np.where(x0, np.abs(x0), 1) * dfl.population_spread
+    x = x0 + s * rng.uniform(-1, 1, (dfl.population_size, len(i)))
+    x[0] = x0
+    bounds = params.min[i], params.max[i]
+    return np.clip(x, *bounds), bounds
+
+
+def _population_errors(error_func, params, population, *args, **kws):
+    e = np.asarray(error_func(params, *args, population=population, **kws))
+    return np.where(np.isnan(e), np.inf, e)
+
+
+def _set_values(params, values):
+    p = params.copy()
+    p.values[p.vary] = values
+    return p
+
+
+def _calibrate_multistart(error_func, params, *args, **kws):
+    dfl = defaults.dfl.functions.calibrate_model_params
+    rng = np.random.RandomState(dfl.seed)
+    x = _initial_population(params, rng)[0]
+    err = _population_errors(error_func, params, x, *args, **kws)
+
+    best = [np.inf, params, False]
+    # The initial guess is always a starting point.
+    starts = [0] + [i for i in np.argsort(err) if i][:dfl.n_starts - 1]
+    for i in starts:
+        p = _set_values(params, x[i])
+        p, s = calibrate_model_params(error_func, p, *args, **kws)
+        e = error_func(p, *args, **kws)
+        if e < best[0]:
+            best = [e, p, s]
+
+    return tuple(best[1:])
+
+
+def _calibrate_population(error_func, params, *args, **kws):
+    dfl = defaults.dfl.functions.calibrate_model_params
+    rng = np.random.RandomState(dfl.seed)
+    x, bounds = _initial_population(params, rng)
+    err = _population_errors(error_func, params, x, *args, **kws)
+    n, m = x.shape
+    for _ in range(dfl.max_generations):
+        if np.std(err) <= dfl.population_tol * np.abs(np.mean(err)):
+            break
+
+        # DE/rand/1/bin: three distinct donors different from the target.
+        r = np.argsort(rng.rand(n, n) + np.eye(n), axis=1)[:, :3].T
+        y = x[r[0]] + dfl.mutation * (x[r[1]] - x[r[2]])
+        b = rng.rand(n, m) < dfl.recombination
+        b[np.arange(n), rng.randint(m, size=n)] = True
+        y = np.clip(np.where(b, y, x), *bounds)
+
+        e = _population_errors(error_func, params, y, *args, **kws)
+        b = e <= err
+        x[b], err[b] = y[b], e[b]
+
+    # Polish the best candidate.
+    p = _set_values(params, x[err.argmin()])
+    return calibrate_model_params(error_func, p, *args, **kws)
 
 
 # correction of lmfit bug.
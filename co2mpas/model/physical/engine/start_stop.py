@@ -16,6 +16,7 @@ import sklearn.feature_selection as sk_fsel
 import numpy as np
 import co2mpas.model.physical.defaults as defaults
 import co2mpas.dispatcher as dsp
+import co2mpas.utils as co2_utl
 
 
 def identify_on_engine(
@@ -49,8 +50,9 @@ def identify_on_engine(
     mask = np.where(identify_engine_starts(on_engine))[0] + 1
     ts = np.asarray(times[mask], dtype=float)
     ts += min_time_engine_on_after_start + defaults.dfl.EPS
-    for i, j in zip(mask, np.searchsorted(times, ts)):
-        on_engine[i:j] = True
+    on_engine |= co2_utl.intervals_mask(
+        on_engine.shape[0], mask, np.searchsorted(times, ts)
+    )
 
     return on_engine
 
@@ -181,14 +183,22 @@ class StartStopModel(object):
                 min_time_engine_on_after_start=0.0, has_start_stop=True,
                 use_basic_start_stop=True):
 
-        gen = self.yield_on_start(
-            times, velocities, accelerations, *args, gears=gears,
-            correct_start_stop_with_gears=correct_start_stop_with_gears,
-            start_stop_activation_time=start_stop_activation_time,
-            min_time_engine_on_after_start=min_time_engine_on_after_start,
-            has_start_stop=has_start_stop,
-            use_basic_start_stop=use_basic_start_stop
-        )
+        if has_start_stop:
+            # Inputs are known, hence the models predict all samples at once.
+            to_predict = self.when_predict_on_engine(
+                times, start_stop_activation_time, gears,
+                correct_start_stop_with_gears
+            )
+            X = np.column_stack((velocities, accelerations) + args)
+            model = self.base if use_basic_start_stop else self.model
+            base = DefaultStartStopModel.predict(X).tolist()
+            predict = model.predict(X).tolist()
+            gen = self._on_start(
+                times, to_predict, range(len(times)), base.__getitem__,
+                predict.__getitem__, min_time_engine_on_after_start
+            )
+        else:
+            gen = self._yield_no_start_stop(times)
 
         on_eng, eng_starts = zip(*list(gen))
 
@@ -213,17 +223,59 @@ class StartStopModel(object):
             gen = self._yield_no_start_stop(times)
         return gen
 
+    def compile(self, use_basic_start_stop=True, n_features=4):
+        """
+        Returns the default and the calibrated start/stop predictors with the
+        fitted trees and feature selections lowered to flat lists (see
+        :func:`co2mpas.utils.compile_predictor`).
+
+        The predictors take a sample (velocity, acceleration, *args) and
+        return exactly the prediction of the models.
+
+        :param use_basic_start_stop:
+            If True the basic start stop model is compiled, otherwise the
+            complex one.
+        :type use_basic_start_stop: bool
+
+        :param n_features:
+            Number of values of the sample.
+        :type n_features: int
+
+        :return:
+            Default and calibrated start/stop predictors.
+        :rtype: (callable, callable)
+        """
+        VEL = defaults.dfl.functions.DefaultStartStopModel.stop_velocity
+        ACC = defaults.dfl.functions.DefaultStartStopModel.plateau_acceleration
+
+        def base(x):
+            return x[0] > VEL or x[1] > ACC
+
+        model = self.base if use_basic_start_stop else self.model
+        if isinstance(model, DefaultStartStopModel):
+            return base, base
+
+        predict = co2_utl.compile_predictor(model, range(n_features))
+        if predict is None:
+            predict = lambda x: model.predict([x])[0]
+        return base, predict
+
     def _yield_on_start(self, times, to_predict, velocities, accelerations,
                         *args, min_time_engine_on_after_start=0.0,
                         use_basic_start_stop=True):
-        base = DefaultStartStopModel().predict
-        on, prev, t_switch_on, can_off = True, True, times[0], False
-        model = self.base if use_basic_start_stop else self.model
-        predict = model.predict
         args = (velocities, accelerations) + args
-        for t, p, X in zip(times, to_predict, zip(*args)):
+        base, predict = self.compile(use_basic_start_stop, len(args))
+        # The samples are read lazily, since they can be feedback values.
+        return self._on_start(times, to_predict, zip(*args), base, predict,
+                              min_time_engine_on_after_start)
+
+    @staticmethod
+    def _on_start(times, to_predict, samples, base, predict,
+                  min_time_engine_on_after_start=0.0):
+        on, prev, t_switch_on, can_off = True, True, times[0], False
+        for t, p, X in zip(times, to_predict, samples):
             if p and can_off and t >= t_switch_on:
-                on = (prev or base([X])[0]) and predict([X])[0]
+                on = (prev or base(X)) and predict(X)
             else:
                 on = True
 
@@ -236,7 +288,7 @@ class StartStopModel(object):
                 can_off = False
 
             if not can_off:
-                can_off = base([X])[0]
+                can_off = base(X)
 
             prev = on
 
@@ -121,6 +121,52 @@ class ThermalModel(object):
         self.base_model = sk_ens.GradientBoostingRegressor
         self.thermostat = thermostat
         self.min_temp = -float('inf')
+        self._compiled = None
+
+    def __getstate__(self):
+        d = self.__dict__.copy()
+        d['_compiled'] = None
+        return d
+
+    def compile(self):
+        """
+        Returns the engine temperature derivative function with the fitted
+        trees lowered to lookup tables or flat arrays (see
+        :func:`co2mpas.utils.compile_predictor`).
+
+        The function takes the sample (previous temperature, final drive power
+        in, engine speed out hot, acceleration) and returns exactly the
+        prediction of the fitted models.
+
+        :return:
+            Engine temperature derivative function [°C/s].
+        :rtype: callable
+        """
+        key = self.model, self.mask, self.cold, self.mask_cold, self.min_temp
+        compiled = getattr(self, '_compiled', None)
+        if compiled is None or any(a is not b for a, b in zip(compiled, key)):
+            from ..defaults import dfl
+            n = dfl.functions.ThermalModel.max_lookup_cells
+            hot = self._compile_predict(self.model, self.mask, n)
+            cold = self._compile_predict(self.cold, self.mask_cold, n)
+            min_temp = self.min_temp
+
+            def derivative(x):
+                return (cold if x[0] < min_temp else hot)(x)
+
+            compiled = self._compiled = key + (derivative,)
+        return compiled[-1]
+
+    @staticmethod
+    def _compile_predict(model, mask, max_cells):
+        func = co2_utl.compile_predictor(model, mask, max_cells=max_cells)
+        if func is None:
+            predict = model.predict
+            if mask is None:
+                func = lambda x: predict(np.array([x]))[0]
+            else:
+                func = lambda x: predict(np.array([x])[:, mask])[0]
+        return func
 
     def fit(self, idle_engine_speed, on_engine, temperature_derivatives,
             temperatures, *args):
@@ -219,28 +265,21 @@ class ThermalModel(object):
         return np.median(model.predict(spl))
 
     def __call__(self, deltas_t, *args, initial_temperature=23, max_temp=100.0):
-        delta, temp = self.delta, np.zeros(len(deltas_t) + 1, dtype=float)
+        derivative = self.compile()
+        temp = np.zeros(len(deltas_t) + 1, dtype=float)
         t = temp[0] = initial_temperature
 
-        for i, a in enumerate(zip(*((deltas_t,) + args)), start=1):
-            t += delta(*a, prev_temperature=t, max_temp=max_temp)
+        it = zip(*(np.asarray(v).tolist() for v in (deltas_t,) + args))
+        for i, (dt, *a) in enumerate(it, start=1):
+            t += min(derivative([t] + a) * dt, max_temp - t)
             temp[i] = t
 
         return temp
 
     def delta(self, dt, *args, prev_temperature=23, max_temp=100.0):
-        if prev_temperature < self.min_temp:
-            model, mask = self.cold, self.mask_cold
-        else:
-            model, mask = self.model, self.mask
-
-        delta_temp = self._derivative(model, mask, prev_temperature, *args) * dt
+        delta_temp = self.compile()((prev_temperature,) + args) * dt
         return min(delta_temp, max_temp - prev_temperature)
 
-    @staticmethod
-    def _derivative(model, mask, *args):
-        return model.predict(np.array([args])[:, mask])[0]
-
 
 def calibrate_engine_temperature_regression_model(
         idle_engine_speed, on_engine, engine_temperature_derivatives,
@@ -26,6 +26,12 @@ import numpy as np
 
 
 class CorrectGear(object):
+    _vectorized = {
+        'basic_correct_gear': 'basic_correct_gears',
+        'correct_gear_mvl': 'correct_gears_mvl',
+        'correct_gear_full_load': 'correct_gears_full_load'
+    }
+
     def __init__(self, velocity_speed_ratios=None, idle_engine_speed=None):
         velocity_speed_ratios = velocity_speed_ratios or {}
         self.gears = sorted(k for k in velocity_speed_ratios if k > 0)
@@ -164,6 +170,122 @@ class CorrectGear(object):
             gear = f(velocity, acceleration, gear)
         return gear
 
+    def _gear_index(self, gears):
+        gs = np.asarray(self.gears)
+        i = np.minimum(np.searchsorted(gs, gears), len(gs) - 1)
+        if not (gs[i] == gears).all():
+            return None  # Gears out of the gear box.
+        return i
+
+    def basic_correct_gears(self, velocities, accelerations, gears):
+        """
+        Corrects the gears predicted according to basic drive-ability rules.
+
+        It is the vectorized version of :meth:`basic_correct_gear`.
+
+        :param velocities:
+            Vehicle velocity [km/h].
+        :type velocities: numpy.array
+
+        :param accelerations:
+            Vehicle acceleration [m/s2].
+        :type accelerations: numpy.array
+
+        :param gears:
+            Predicted vehicle gears [-].
+        :type gears: numpy.array
+
+        :return:
+            Gears corrected according to basic drive-ability rules.
+        :rtype: numpy.array
+        """
+        b = gears > 1
+        i = self._gear_index(gears[b])
+        if i is None:
+            f = np.vectorize(self.basic_correct_gear, otypes=[int])
+            return f(velocities, accelerations, gears)
+
+        gears = gears.copy()
+        gears[(gears == 0) & (accelerations > 0)] = self.min_gear
+
+        vel, g = velocities[b], np.tile(self.min_gear, i.shape)
+        for j, (k, v) in enumerate(self.idle_vel[1:], 1):
+            g[(j <= i) & (vel >= v)] = k
+        gears[b] = g
+        return gears
+
+    def correct_gears_mvl(self, velocities, accelerations, gears):
+        return self.mvl.predict_gears(velocities, accelerations, gears)
+
+    def correct_gears_full_load(self, velocities, accelerations, gears):
+        """
+        Corrects the gears predicted according to full load curve.
+
+        It is the vectorized version of :meth:`correct_gear_full_load`.
+
+        :param velocities:
+            Vehicle velocity [km/h].
+        :type velocities: numpy.array
+
+        :param accelerations:
+            Vehicle acceleration [m/s2].
+        :type accelerations: numpy.array
+
+        :param gears:
+            Predicted vehicle gears [-].
+        :type gears: numpy.array
+
+        :return:
+            Gears corrected according to full load curve.
+        :rtype: numpy.array
+        """
+        b = (velocities <= self.max_velocity_full_load_corr) & (gears != 0)
+        i = self._gear_index(gears[b])
+        if i is None:
+            f = np.vectorize(self.correct_gear_full_load, otypes=[int])
+            return f(velocities, accelerations, gears)
+
+        vel, gears = velocities[b], gears.copy()
+        p_norm = self.p_norm(vel, accelerations[b])
+        g = np.tile(self.min_gear, i.shape)
+        for j, k in enumerate(self.gears[1:], 1):
+            g[(j <= i) & (p_norm <= self.flc(vel, k))] = k
+        gears[b] = g
+        return gears
+
+    def correct_gears(self, velocities, accelerations, gears):
+        """
+        Corrects a batch of predicted gears.
+
+        It is the vectorized version of :meth:`__call__`.
+
+        :param velocities:
+            Vehicle velocity [km/h].
+        :type velocities: numpy.array
+
+        :param accelerations:
+            Vehicle acceleration [m/s2].
+        :type accelerations: numpy.array
+
+        :param gears:
+            Predicted vehicle gears [-].
+        :type gears: numpy.array
+
+        :return:
+            Corrected gears.
+        :rtype: numpy.array
+        """
+        gears = np.asarray(gears)
+        for f in self.pipe:
+            name = self._vectorized.get(getattr(f, '__name__', None))
+            if name:
+                gears = getattr(self, name)(velocities, accelerations, gears)
+            else:
+                gears = np.vectorize(f, otypes=[int])(
+                    velocities, accelerations, gears
+                )
+        return gears
+
 
 def _upgrade_gsm(gsm, velocity_speed_ratios, cycle_type):
     gsm = copy.deepcopy(gsm).convert(velocity_speed_ratios)
@@ -473,6 +595,40 @@ def define_gear_filter(
     return gear_filter
 
 
+def _predict_gear_sequence(gear, transitions, n):
+    """
+    Resolves the sequential dependence of the predicted gears.
+
+    The transitions are evaluated in batch just once per gear reached.
+
+    :param gear:
+        Initial gear [-].
+    :type gear: int
+
+    :param transitions:
+        A function that returns, given the previous gear, the next gear of
+        each sample [-].
+    :type transitions: function
+
+    :param n:
+        Number of samples.
+    :type n: int
+
+    :return:
+        Predicted gears [-].
+    :rtype: list
+    """
+    table, gears = {}, []
+    for i in range(n):
+        try:
+            gear = table[gear][i]
+        except KeyError:
+            row = np.asarray(transitions(gear)).tolist()
+            gear = table.setdefault(gear, row)[i]
+        gears.append(gear)
+    return gears
+
+
 class CMV(collections.OrderedDict):
     def __init__(self, *args, velocity_speed_ratios=None):
         super(CMV, self).__init__(*args)
@@ -510,15 +666,20 @@ class CMV(collections.OrderedDict):
 
         X = np.column_stack((velocities, accelerations))
 
+        # The gear corrections and the errors of each gear do not depend on
+        # the velocity limits, hence they are computed just once.
+        corrections, keys = self._corrections(X, correct_gear), sorted(self)
+        errors = np.array([np.abs(calculate_gear_box_speeds_in(
+            np.tile(k, X.shape[0]), velocities, velocity_speed_ratios,
+            stop_velocity) - engine_speeds_out) for k in keys])
+        samples = np.arange(X.shape[0])
+
         def _error_fun(vel_limits):
             _update_gvs(vel_limits)
 
-            g_pre = self.predict(X, correct_gear=correct_gear)
-
-            speed_pred = calculate_gear_box_speeds_in(
-                g_pre, velocities, velocity_speed_ratios, stop_velocity)
+            g_pre = self._predict(X, correct_gear, None, corrections)
 
-            return np.mean(np.abs(speed_pred - engine_speeds_out))
+            return np.mean(errors[np.searchsorted(keys, g_pre), samples])
 
         x0 = [self[0][1]].__add__(list(itertools.chain(*velocity_limits))[:-1])
 
@@ -602,9 +763,62 @@ class CMV(collections.OrderedDict):
             p[X[:, 0] >= up] = keys[min(i + 1, c)]
         return X, pg
 
-    def _predict(self, X, correct_gear, previous_gear):
+    def _corrections(self, X, correct_gear):
+        """
+        Returns a function to correct a gear of the matrix in all samples.
+
+        The corrections do not depend on the velocity limits, hence they are
+        computed once per gear and reused when the limits change.
+
+        :param X:
+            Vehicle velocity [km/h] and acceleration [m/s2] per sample.
+        :type X: numpy.array
+
+        :param correct_gear:
+            A function to correct the predicted gear.
+        :type correct_gear: function
+
+        :return:
+            A function that returns, given a gear, the corrected gear of each
+            sample [-].
+        :rtype: function
+        """
+        keys, vel, acc, n = list(self), X[:, 0], X[:, 1], X.shape[0]
+        try:
+            f = correct_gear.correct_gears
+        except AttributeError:
+            f = np.vectorize(correct_gear, otypes=[float])
+
+        @functools.lru_cache(None)
+        def _correct(gear):
+            p = np.tile(gear, n)
+            c = f(vel, acc, p)
+            return np.where(np.in1d(c, keys), c, p)
+
+        return _correct
+
+    def _predict(self, X, correct_gear, previous_gear, corrections=None):
         gear = previous_gear or min(self)
+        if corrections is None and hasattr(correct_gear, 'correct_gears'):
+            corrections = self._corrections(X, correct_gear)
+
         X, pg = self._prediction_matrix(X)
+
+        if corrections is not None:
+            keys = list(self)
+
+            def _transitions(g):
+                p = pg[g]
+                c = np.array(p, dtype=float)
+                for k in keys:
+                    b = p == k
+                    if b.any():
+                        c[b] = corrections(k)[b]
+                return c
+
+            gears = _predict_gear_sequence(gear, _transitions, X.shape[0])
+            return np.array(gears, dtype=float)
+
         gears = np.zeros(X.shape[0])
         for i, (velocity, acceleration) in enumerate(X):
             gear = pg[gear][i]
@@ -1130,16 +1344,30 @@ def prediction_gears_decision_tree(
     :rtype: numpy.array
     """
 
-    gears = [0]
-
     predict = decision_tree.predict
 
-    def predict_gear(*args):
-        g = predict([gears + list(args)])[0]
-        gears[0] = correct_gear(args[0], args[1], g)
-        return gears[0]
+    if hasattr(correct_gear, 'correct_gears') and len(params[0]):
+        X = np.column_stack((np.zeros_like(params[0]),) + params)
 
-    gears = np.vectorize(predict_gear)(*params)
+        def _transitions(g):
+            X[:, 0] = g
+            c = correct_gear.correct_gears(X[:, 1], X[:, 2], predict(X))
+            return np.asarray(c, dtype=int)
+
+        # The first sample is evaluated twice as done by `np.vectorize`.
+        gears = _predict_gear_sequence(
+            _transitions(0)[0], _transitions, X.shape[0]
+        )
+        gears = np.array(gears, dtype=int)
+    else:
+        gears = [0]
+
+        def predict_gear(*args):
+            g = predict([gears + list(args)])[0]
+            gears[0] = correct_gear(args[0], args[1], g)
+            return gears[0]
+
+        gears = np.vectorize(predict_gear)(*params)
 
     gears = gear_filter(times, gears)
 
@@ -1479,6 +1707,58 @@ class MVL(CMV):
 
         return gear
 
+    def predict_gears(self, velocities, accelerations, gears):
+        """
+        Corrects the gears predicted according to upper and lower bound
+        velocity limits.
+
+        It is the vectorized version of :meth:`predict`.
+
+        :param velocities:
+            Vehicle velocity [km/h].
+        :type velocities: numpy.array
+
+        :param accelerations:
+            Vehicle acceleration [m/s2].
+        :type accelerations: numpy.array
+
+        :param gears:
+            Predicted vehicle gears [-].
+        :type gears: numpy.array
+
+        :return:
+            Corrected gears.
+        :rtype: numpy.array
+        """
+        gears, predicted = np.array(gears), gears
+        done = np.abs(accelerations) >= self.plateau_acceleration
+        shifted = np.zeros_like(done)
+        for k, v in self.items():
+            done |= k <= gears
+            b = ~done & (velocities > v[0])
+            gears[b], done[b], shifted[b] = k, True, True
+
+        up = np.tile(np.nan, int(max(self)) + 1)
+        for k, v in self.items():
+            up[int(k)] = v[1]
+
+        i = np.flatnonzero(~shifted & (gears != 0))
+        while i.size:
+            g = gears[i]
+            j = g.astype(int)
+            if ((j == g) & (0 <= j) & (j < len(up))).all():
+                u = up[j]
+                if not np.isnan(u).any():
+                    i = i[velocities[i] > u]
+                    gears[i] += 1
+                    continue
+
+            # Gears out of the matrix.
+            f = np.vectorize(self.predict, otypes=[gears.dtype])
+            return f(velocities, accelerations, predicted)
+
+        return gears
+
 
 # noinspection PyUnusedLocal
 def domain_fuel_saving_at_strategy(fuel_saving_at_strategy, *args):
@@ -1499,9 +1779,16 @@ def default_specific_gear_shifting():
     return d.SPECIFIC_GEAR_SHIFTING
 
 
+def _calibrate_all(method, kwargs):
+    # When the A/T models are selected in a worker pool, the selector fits them.
+    jobs = defaults.dfl.functions.at_models_selector.jobs
+    return method in kwargs or jobs == 1
+
+
 def at_domain(method):
     def domain(kwargs):
-        return kwargs['specific_gear_shifting'] in ('ALL', method)
+        s = kwargs['specific_gear_shifting']
+        return s == method or (s == 'ALL' and _calibrate_all(method, kwargs))
 
     return domain
 
@@ -1510,7 +1797,9 @@ def dt_domain(method):
     def domain(kwargs):
         s = 'specific_gear_shifting'
         dt = 'use_dt_gear_shifting'
-        return kwargs[s] == method or (kwargs[dt] and kwargs[s] == 'ALL')
+        return kwargs[s] == method or (
+            kwargs[dt] and kwargs[s] == 'ALL' and _calibrate_all(method, kwargs)
+        )
 
     return domain
 
@@ -25,6 +25,8 @@ import sklearn.metrics as sk_met
 import co2mpas.dispatcher.utils as dsp_utl
 import logging
 import collections
+import contextlib
+import multiprocessing
 import pprint
 import functools
 import numpy as np
@@ -452,17 +454,174 @@ def tyre_models_selector(models_ids, data):
     return models
 
 
+def _at_model_error(d, inputs, model_id, model, ref):
+    from ..physical.gear_box.at_gear import calculate_error_coefficients
+    from ..physical.gear_box.mechanical import calculate_gear_box_speeds_in
+    sgs = 'specific_gear_shifting'
+    gears = d.dispatch(
+        inputs=dsp_utl.combine_dicts(inputs, {sgs: model_id, model_id: model}),
+        outputs=['gears']
+    )['gears']
+
+    vel, vsr, sv = ref['velocities'], ref['velocity_speed_ratios'], \
+        ref['stop_velocity']
+    eng = calculate_gear_box_speeds_in(gears, vel, vsr, sv)
+    return calculate_error_coefficients(
+        ref['gears'], gears, ref['engine_speeds_out'], eng, vel, sv
+    )
+
+
+def _min_at_model_error(ref):
+    """
+    Returns the least mean absolute error [RPM] that a gear prediction can
+    achieve, choosing the best gear in each sample.
+    """
+    vel, sv = ref['velocities'], ref['stop_velocity']
+    b = vel > sv
+    x, v = ref['engine_speeds_out'][b], vel[b]
+    speeds = [v / r for r in ref['velocity_speed_ratios'].values() if r]
+    speeds = np.array(speeds + [np.zeros_like(v), v])
+    best = speeds[np.abs(speeds - x).argmin(axis=0), np.arange(v.shape[0])]
+    return sk_met.mean_absolute_error(x, best)
+
+
+def _is_best_at_model(error, min_err):
+    """
+    Checks if an A/T gear shifting model predicts the identified gears with the
+    least attainable error, so that no other model can rank before it.
+    """
+    return error['accuracy_score'] == 1 and \
+        error['mean_absolute_error'] <= min_err
+
+
+def _fit_at_model(d, inputs, model_id, model, ref):
+    """
+    Calibrates an A/T gear shifting model, if not given, and calculates its
+    error.
+
+    :param d:
+        A/T gear shifting model.
+    :type d: co2mpas.dispatcher.Dispatcher
+
+    :param inputs:
+        Inputs to predict the gears.
+    :type inputs: dict
+
+    :param model_id:
+        A/T gear shifting model id (e.g., 'CMV').
+    :type model_id: str
+
+    :param model:
+        Calibrated A/T gear shifting model. If `None`, it is calibrated on the
+        identified gears of the reference data.
+    :type model: object
+
+    :param ref:
+        Reference data (i.e., velocities, velocity_speed_ratios,
+        engine_speeds_out, gears, and stop_velocity).
+    :type ref: dict
+
+    :return:
+        Error and calibrated model, or `None` if the model cannot be
+        calibrated.
+    :rtype: tuple | None
+    """
+    if model is None:
+        sgs = 'specific_gear_shifting'
+        i = dsp_utl.combine_dicts(inputs, {sgs: model_id, 'gears': ref['gears']})
+        o = d.dispatch(inputs=i, outputs=[model_id], shrink=True)
+        if model_id not in o:
+            return None
+        model = o[model_id]
+    return _at_model_error(d, inputs, model_id, model, ref), model
+
+
+#: The A/T gear shifting model of a selector worker process.
+_at_worker = None
+
+
+def _init_at_worker(constants=None):
+    """
+    Builds the A/T gear shifting model once per worker process.
+
+    :param constants:
+        Model constants of the parent process.
+    :type constants: dict
+    """
+    global _at_worker
+    from ..physical.defaults import dfl
+    from ..physical.gear_box.at_gear import at_gear
+    if constants:
+        dfl.from_dict(constants)
+    _at_worker = at_gear()
+
+
+def _fit_at_model_in_worker(args):
+    return _fit_at_model(_at_worker, *args)
+
+
+def _fit_at_models(d, args, jobs=None):
+    """
+    Calibrates and scores the A/T gear shifting models in a pool of worker
+    processes.
+
+    The results are collected in the models order. When a model predicts the
+    identified gears with the least attainable error, the remaining models are
+    cancelled, because they cannot rank before it. From a worker process, the
+    models are calibrated serially with the same cut-off.
+
+    :param d:
+        A/T gear shifting model.
+    :type d: co2mpas.dispatcher.Dispatcher
+
+    :param args:
+        Inputs, model id, model (or `None`), and reference data of each model
+        to assess.
+    :type args: list[tuple]
+
+    :param jobs:
+        Number of worker processes. If `None` or 0, it uses all cpus.
+    :type jobs: int
+
+    :return:
+        Error and calibrated model (or `None`) of the assessed models.
+    :rtype: list[tuple | None]
+    """
+    from ..physical.defaults import dfl
+    min_err, res = _min_at_model_error(args[0][-1]), []
+    with contextlib.ExitStack() as stack:
+        if len(args) > 1 and not multiprocessing.current_process().daemon:
+            init = _init_at_worker, (dfl.to_dict(),)
+            pool = stack.enter_context(multiprocessing.Pool(jobs or None, *init))
+            it = [pool.apply_async(_fit_at_model_in_worker, (a,)) for a in args]
+            it = (r.get() for r in it)
+        else:
+            if len(args) > 1:
+                log.warning('A/T gear shifting models cannot be calibrated in '
+                            'parallel from a worker process, calibrating them '
+                            'serially.')
+            it = (_fit_at_model(d, *a) for a in args)
+
+        for r in it:
+            res.append(r)
+            if r and _is_best_at_model(r[0], min_err):
+                break  # Leaving the pool terminates the running workers.
+    return res
+
+
 def at_models_selector(d, at_pred_inputs, models_ids, data):
     sgs = 'specific_gear_shifting'
     # Namespace shortcuts.
     try:
-        vel, vsr = data['velocities'], data['velocity_speed_ratios']
-        t_eng, t_gears = data['engine_speeds_out'], data['gears']
-        sv, at_m = data['stop_velocity'], data[sgs]
+        at_m = data[sgs]
+        ref = dsp_utl.selector((
+            'velocities', 'velocity_speed_ratios', 'engine_speeds_out', 'gears',
+            'stop_velocity'
+        ), data)
     except KeyError:
         return {}
 
-    c_dicts, select, _g = dsp_utl.combine_dicts, dsp_utl.selector, d.dispatch
+    select = dsp_utl.selector
     t_e = ('mean_absolute_error', 'accuracy_score', 'correlation_coefficient')
 
     # at_models to be assessed.
@@ -475,36 +634,41 @@ def at_models_selector(d, at_pred_inputs, models_ids, data):
     # Inputs to predict the gears.
     inputs = select(at_pred_inputs, data, allow_miss=True)
 
-    from ..physical.gear_box.at_gear import calculate_error_coefficients
-    from ..physical.gear_box.mechanical import calculate_gear_box_speeds_in
-
-    def _err(model_id, model):
-        gears = d.dispatch(
-                inputs=c_dicts(inputs, {sgs: model_id, model_id: model}),
-                outputs=['gears']
-        )['gears']
-
-        eng = calculate_gear_box_speeds_in(gears, vel, vsr, sv)
-        err = calculate_error_coefficients(
-            t_gears, gears, t_eng, eng, vel, sv
-        )
-        return err
-
     def _sort(v):
         e = select(t_e, v[0], output_type='list')
         return (e[0], -e[1], -e[2]), v[1]
 
-    # Sort by error.
-    at_m = select(at_m, data, allow_miss=True)
-    rank = sorted(((_err(k, m), k, m) for k, m in at_m.items()), key=_sort)
+    from ..physical.defaults import dfl
+    jobs, skipped = dfl.functions.at_models_selector.jobs, ()
+    if jobs == 1:
+        # Sort by error.
+        at_m = select(at_m, data, allow_miss=True)
+        rank = sorted(((_at_model_error(d, inputs, k, m, ref), k, m)
+                       for k, m in at_m.items()), key=_sort)
+    else:
+        if len(at_m) > 1 and not data.get('use_dt_gear_shifting'):
+            # Decision trees are calibrated only on demand, as in `at_gear`.
+            at_m = {k for k in at_m if not k.startswith('DT_')}
+        # The models not given are calibrated with their errors.
+        args = [(inputs, k, data.get(k), ref) for k in sorted(at_m)]
+        res = _fit_at_models(d, args, jobs) if args else []
+        rank = sorted(((r[0], a[1], r[1]) for a, r in zip(args, res) if r),
+                      key=_sort)
+        skipped = [a[1] for a in args[len(res):]]
 
     if rank:
-        data['at_scores'] = collections.OrderedDict((k, e) for e, k, m in rank)
+        scores = collections.OrderedDict((k, e) for e, k, m in rank)
+        # Models not scored, because the first cannot be outranked.
+        scores.update((k, dict.fromkeys(t_e, np.nan)) for k in skipped)
+        data['at_scores'] = scores
         e, k, m = rank[0]
         models[sgs], models[k] = k, m
         log.debug('at_gear_shifting_model: %s with mean_absolute_error %.3f '
                   '[RPM], accuracy_score %.3f, and correlation_coefficient '
                   '%.3f.', k, *select(t_e, e, output_type='list'))
+        if skipped:
+            log.debug('A/T gear shifting models %s are not scored, because %s '
+                      'has the least attainable error.', skipped, k)
 
     return models
 
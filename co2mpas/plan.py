@@ -12,26 +12,54 @@ import tqdm
 import co2mpas.dispatcher.utils as dsp_utl
 import co2mpas.utils as co2_utl
 import co2mpas.io as co2_io
+import co2mpas.io.cache as co2_cache
 import co2mpas.batch as batch
-import functools
+from co2mpas.io.constants import con_vals
+import collections
 import logging
 import json
+import multiprocessing
+import os.path as osp
 
 log = logging.getLogger(__name__)
 
 
-@functools.lru_cache(256)
+def get_solution_store(fpath, cache_folder=None):
+    """
+    Returns the on-disk store of the base solutions.
+
+    :param fpath:
+        Input file path.
+    :type fpath: str
+
+    :param cache_folder:
+        Cache folder. If None, it is the `.co2mpas_cache` next to the input.
+    :type cache_folder: str, optional
+
+    :return:
+        Store of the base solutions.
+    :rtype: co2mpas.io.cache.SolutionStore
+    """
+    folder = co2_io.get_cache_folder(fpath, cache_folder)
+    folder = osp.join(folder, 'solutions')
+    return co2_cache.SolutionStore(folder, con_vals.MAX_SOLUTION_CACHE_SIZE)
+
+
 def get_results(model, overwrite_cache, fpath, timestamp, run=True,
-                json_var='{}', output_folder=None, modelconf=None):
+                json_var='{}', output_folder=None, modelconf=None,
+                cache_folder=None):
 
     if run:
-        ext = ('base', '_v%sv_' % dsp_utl.drw._encode_file_name(json_var))
-        cache_fpath = co2_io.get_cache_fpath(fpath, ext=ext + ('dill',))
-        if co2_io.check_cache_fpath_exists(overwrite_cache, fpath, cache_fpath):
-            return co2_io.dill.load_from_dill(cache_fpath)
+        store = get_solution_store(fpath, cache_folder)
+        key = store.key(co2_cache.file_hash(fpath), json_var,
+                        modelconf and co2_cache.file_hash(modelconf))
+        if not overwrite_cache:
+            r = store.load(key)
+            if r is not None:
+                return r
         variation = json.loads(json_var)
     else:
-        variation, cache_fpath = {'flag.plot_workflow': False}, None
+        variation, store = {'flag.plot_workflow': False}, None
 
     variation['flag.run_base'] = run
     variation['flag.run_plan'] = False
@@ -41,6 +69,7 @@ def get_results(model, overwrite_cache, fpath, timestamp, run=True,
         inputs={
             'input_file_name': fpath,
             'overwrite_cache': overwrite_cache,
+            'cache_folder': cache_folder,
             'variation': variation,
             'output_folder': output_folder,
             'modelconf': modelconf
@@ -48,8 +77,8 @@ def get_results(model, overwrite_cache, fpath, timestamp, run=True,
         select_output_kw={'keys': ('solution',), 'output_type': 'values'}
     )
 
-    if cache_fpath:
-        co2_io.dill.save_dill(r, cache_fpath)
+    if store:
+        store.save(key, r)
 
     return r
 
@@ -102,51 +131,206 @@ def define_new_inputs(data, base):
 plan_listener = None
 
 
+def _get_run_modes(run_base):
+    return tuple(run_base.get_sub_dsp_from_workflow(
+        ('data', 'vehicle_name'), check_inputs=False, graph=run_base.dmap
+    ).data_nodes) + ('start_time', 'vehicle_name')
+
+
+def _run_variation(run_base, run_modes, base, plan_row, timestamp, flag):
+    (i, base_fpath, run), p = plan_row
+    o_cache, o_folder = flag['overwrite_cache'], flag['output_folder']
+    modelconf = flag.get('modelconf', None)
+    cache_folder = flag.get('cache_folder', None)
+
+    name = '{}-{}'.format(base['vehicle_name'], i)
+
+    new_base, o = define_new_inputs(p, base)
+    inputs = batch.prepare_data(new_base, {}, base_fpath, o_cache, o_folder,
+                                timestamp, False, modelconf, cache_folder)[0]
+    inputs.update(dsp_utl.selector(set(base).difference(run_modes), base))
+    inputs['vehicle_name'] = name
+    inputs.update(dsp_utl.combine_dicts(flag, {'run_base': True}))
+    res = run_base.dispatch(inputs)
+
+    s = filter_summary(p, o, res.get('summary', {}))
+    base_keys = {
+        'vehicle_name': (base_fpath, name, run),
+    }
+    return res, s, base_keys
+
+
 def make_simulation_plan(plan, timestamp, variation, flag, model=None):
+    jobs = flag.get('plan_jobs', 1)
+    if jobs != 1 and len(plan) > 1:
+        if not multiprocessing.current_process().daemon:
+            return _make_parallel_simulation_plan(
+                plan, timestamp, variation, flag, model=model, jobs=jobs
+            )
+        log.warning('Simulation plan cannot run in parallel from a worker '
+                    'process, running it serially.')
+
     model, summary = model or batch.vehicle_processing_model(), {}
     run_base = model.get_node('run_base')[0].dsp
-    run_modes = tuple(run_base.get_sub_dsp_from_workflow(
-        ('data', 'vehicle_name'), check_inputs=False, graph=run_base.dmap
-    ).data_nodes) + ('start_time', 'vehicle_name')
+    run_modes = _get_run_modes(run_base)
 
     var = json.dumps(variation, sort_keys=True)
     o_cache, o_folder = flag['overwrite_cache'], flag['output_folder']
     modelconf = flag.get('modelconf', None)
-    kw, bases = dsp_utl.combine_dicts(flag, {'run_base': True}), set()
-    for (i, base_fpath, run), p in tqdm.tqdm(plan, disable=False):
-        try:
-            base = get_results(model, o_cache, base_fpath, timestamp, run, var,
-                               o_folder, modelconf)
-        except KeyError:
-            log.warn('Base model "%s" of variation "%s" cannot be parsed!',
-                     base_fpath, i)
+    cache_folder = flag.get('cache_folder', None)
+    bases, names = {}, set()
+    for plan_row in tqdm.tqdm(plan, disable=False):
+        (i, base_fpath, run), p = plan_row
+        if (base_fpath, run) not in bases:
+            try:
+                bases[(base_fpath, run)] = get_results(
+                    model, o_cache, base_fpath, timestamp, run, var, o_folder,
+                    modelconf, cache_folder
+                )
+            except KeyError:
+                bases[(base_fpath, run)] = None
+
+        base = bases[(base_fpath, run)]
+        if base is None:
+            log.warning('Base model "%s" of variation "%s" cannot be parsed!',
+                        base_fpath, i)
             continue
 
         name = base['vehicle_name']
-        if 'summary' in base and name not in bases:
+        if 'summary' in base and name not in names:
             batch._add2summary(summary, base['summary'])
-            bases.add(name)
-
-        name = '{}-{}'.format(name, i)
+            names.add(name)
 
-        new_base, o = define_new_inputs(p, base)
-        inputs = batch.prepare_data(new_base, {}, base_fpath, o_cache, o_folder,
-                                    timestamp, False, modelconf)[0]
-        inputs.update(dsp_utl.selector(set(base).difference(run_modes), base))
-        inputs['vehicle_name'] = name
-        inputs.update(kw)
-        res = run_base.dispatch(inputs)
+        res, s, base_keys = _run_variation(
+            run_base, run_modes, base, plan_row, timestamp, flag
+        )
         batch.notify_result_listener(plan_listener, res)
-
-        s = filter_summary(p, o, res.get('summary', {}))
-        base_keys = {
-            'vehicle_name': (base_fpath, name, run),
-        }
         batch._add2summary(summary, s, base_keys)
 
     return summary
 
 
+#: The model, `run_base`, run modes and base solutions of a plan worker process.
+_worker = None
+
+
+def _init_plan_worker(modelconf=None):
+    global _worker
+    if modelconf:
+        from co2mpas.conf import defaults
+        defaults.load(modelconf)
+    model = batch.vehicle_processing_model()
+    run_base = model.get_node('run_base')[0].dsp
+    _worker = model, run_base, _get_run_modes(run_base), {}
+
+
+def _run_variation_in_worker(args):
+    plan_row, timestamp, var, flag = args
+    (i, base_fpath, run), p = plan_row
+    model, run_base, run_modes, bases = _worker
+
+    if (base_fpath, run) not in bases:
+        # The `run` bases are loaded from the store filled by the parent, while
+        # the others (i.e., the parsed inputs) are computed once per worker.
+        bases[(base_fpath, run)] = get_results(
+            model, False, base_fpath, timestamp, run, var,
+            flag['output_folder'], flag.get('modelconf', None),
+            flag.get('cache_folder', None)
+        )
+    base = bases[(base_fpath, run)]
+
+    res, s, base_keys = _run_variation(
+        run_base, run_modes, base, plan_row, timestamp, flag
+    )
+
+    # Solutions are not picklable, just send back what the listener needs.
+    res = dsp_utl.selector(('summary', 'output_file_name'), res, allow_miss=True)
+    return res, s, base_keys
+
+
+def _make_parallel_simulation_plan(plan, timestamp, variation, flag,
+                                   model=None, jobs=None):
+    """
+    Runs the simulation plan in a pool of worker processes.
+
+    The `run` base solutions are computed and stored once before fanning out
+    the variations to the workers, while the not `run` ones (i.e., the parsed
+    inputs) are computed by each worker. The results are merged in the plan
+    order, so the summary is the same of a serial run.
+
+    :param plan:
+        Validated simulation plan.
+    :type plan: list
+
+    :param timestamp:
+        Run timestamp.
+    :type timestamp: str
+
+    :param variation:
+        Variations to be applied.
+    :type variation: dict
+
+    :param flag:
+        Run flags.
+    :type flag: dict
+
+    :param model:
+        Vehicle-processing model used to compute the base solutions.
+    :type model: co2mpas.dispatcher.Dispatcher, optional
+
+    :param jobs:
+        Number of worker processes. If `None` or 0, it uses all cpus.
+    :type jobs: int, optional
+
+    :return:
+        Summary of the simulation plan.
+    :rtype: dict
+    """
+    model, summary = model or batch.vehicle_processing_model(), {}
+
+    var = json.dumps(variation, sort_keys=True)
+    o_cache, o_folder = flag['overwrite_cache'], flag['output_folder']
+    modelconf = flag.get('modelconf', None)
+    cache_folder = flag.get('cache_folder', None)
+
+    bases = collections.OrderedDict()
+    for (i, base_fpath, run), p in plan:
+        if (base_fpath, run) not in bases:
+            try:
+                bases[(base_fpath, run)] = get_results(
+                    model, o_cache, base_fpath, timestamp, run, var, o_folder,
+                    modelconf, cache_folder
+                )
+            except KeyError:
+                bases[(base_fpath, run)] = None
+
+    def _args():
+        for row in plan:
+            if bases[row[0][1:]] is not None:
+                yield row, timestamp, var, flag
+
+    processes, names = jobs or None, set()
+    with multiprocessing.Pool(processes, _init_plan_worker, (modelconf,)) as pool:
+        results = pool.imap(_run_variation_in_worker, _args())
+        for (i, base_fpath, run), p in tqdm.tqdm(plan, disable=False):
+            base = bases[(base_fpath, run)]
+            if base is None:
+                log.warning('Base model "%s" of variation "%s" cannot be '
+                            'parsed!', base_fpath, i)
+                continue
+
+            name = base['vehicle_name']
+            if 'summary' in base and name not in names:
+                batch._add2summary(summary, base['summary'])
+                names.add(name)
+
+            res, s, base_keys = next(results)
+            batch.notify_result_listener(plan_listener, res)
+            batch._add2summary(summary, s, base_keys)
+
+    return summary
+
+
 def filter_summary(changes, new_outputs, summary):
     l, variations = {tuple(k.split('.')[:0:-1]) for k in new_outputs}, {}
     for k, v in changes.items():
@@ -13,6 +13,7 @@ numerical operations.
 """
 
 
+import bisect
 import collections
 from contextlib import contextmanager
 import inspect
@@ -440,6 +441,42 @@ def clear_fluctuations(times, gears, dt_window):
     return np.array([y[1] for y in xy])
 
 
+def intervals_mask(size, starts, ends):
+    """
+    Returns the boolean mask of the union of index intervals [start, end).
+
+    Empty intervals (i.e., end <= start) are ignored.
+
+    :param size:
+        Size of the mask.
+    :type size: int
+
+    :param starts:
+        Start indices of the intervals (included).
+    :type starts: numpy.array
+
+    :param ends:
+        End indices of the intervals (excluded).
+    :type ends: numpy.array
+
+    :return:
+        Boolean mask of the intervals.
+    :rtype: numpy.array
+
+    Example::
+
+        >>> intervals_mask(8, [1, 2, 6], [3, 4, 5])
+        array([False,  True,  True,  True, False, False, False, False], dtype=bool)
+    """
+
+    starts = np.clip(np.asarray(starts, dtype=int), 0, size)
+    ends = np.clip(np.asarray(ends, dtype=int), 0, size)
+    b = starts < ends
+    n = size + 1
+    d = np.bincount(starts[b], minlength=n) - np.bincount(ends[b], minlength=n)
+    return np.cumsum(d[:-1]) > 0
+
+
 def _err(v, y1, y2, r, l):
     return sk_met.mean_absolute_error(_ys(y1, v) + _ys(y2, l - v), r)
 
@@ -496,6 +533,207 @@ class _SafeRANSACRegressor(RANSACRegressor):
                 raise ex
 
 
+def _float32_thresholds(thresholds):
+    """
+    Returns the float64 thresholds `t` that make `x <= t` equivalent to the
+    sklearn tree test `numpy.float32(x) <= thresholds`.
+
+    :param thresholds:
+        Thresholds of the tree nodes.
+    :type thresholds: numpy.array
+
+    :return:
+        Equivalent float64 thresholds.
+    :rtype: numpy.array
+    """
+    thr = np.asarray(thresholds, dtype=float)
+    with np.errstate(over='ignore', invalid='ignore'):
+        f = thr.astype(np.float32)
+        b = f > thr
+        f[b] = np.nextafter(f[b], np.float32(-np.inf))  # Largest f <= thr.
+        g = np.nextafter(f, np.float32(np.inf))
+        m = (f.astype(float) + g.astype(float)) / 2  # Rounding boundary.
+    odd = (f.view(np.int32) & 1).astype(bool)  # The tie goes to the even.
+    m[odd] = np.nextafter(m[odd], -np.inf)
+    return m
+
+
+def _selected_columns(model, columns=None):
+    from sklearn.pipeline import Pipeline
+    if not isinstance(model, Pipeline):
+        return model, columns
+    if columns is None:
+        try:
+            columns = range(len(model.steps[0][-1]._get_support_mask()))
+        except AttributeError:
+            return None, None
+    x = np.array([columns], dtype=float)
+    for _, step in model.steps[:-1]:
+        x = step.transform(x)
+    cols = x[0].astype(int)
+    if not (cols == x[0]).all() or not np.in1d(cols, columns).all():
+        return None, None  # Not a feature selection.
+    return model.steps[-1][-1], cols
+
+
+def _tree_predictor(tree, columns, leaves):
+    t = tree.tree_
+    left, right = t.children_left.tolist(), t.children_right.tolist()
+    feature = [columns[i] if i >= 0 else 0 for i in t.feature]
+    threshold = _float32_thresholds(t.threshold).tolist()
+
+    def predict(x):
+        i = 0
+        while left[i] != -1:
+            i = left[i] if x[feature[i]] <= threshold[i] else right[i]
+        return leaves[i]
+
+    return predict
+
+
+def _ensemble_predictor(trees, columns, scale, init):
+    # All nodes in flat arrays, leaves point to themselves and the first node
+    # is a leaf with the initial prediction.
+    trees = [tree.tree_ for tree in trees]
+    counts = [1] + [t.node_count for t in trees]
+    offset = np.repeat(np.cumsum(counts) - counts, counts)
+    left = np.concatenate([[-1]] + [t.children_left for t in trees])
+    right = np.concatenate([[-1]] + [t.children_right for t in trees])
+    feature = np.concatenate([[0]] + [t.feature for t in trees])
+    threshold = np.concatenate([[np.inf]] + [t.threshold for t in trees])
+    values = np.concatenate([[0]] + [t.value[:, 0, 0] for t in trees])
+
+    leaf, nodes = left == -1, np.arange(len(left))
+    left = np.where(leaf, nodes, left + offset)
+    right = np.where(leaf, nodes, right + offset)
+    children = np.column_stack((right, left)).ravel()
+    feature = np.take(columns, np.where(leaf, 0, feature))
+    threshold = _float32_thresholds(threshold)
+    values = scale * values
+    values[0] = init
+    roots = np.cumsum(counts) - counts
+    depth = range(max([t.max_depth for t in trees] or [0]))
+
+    def predict(x):
+        c = np.array(x, dtype=float).take(feature) <= threshold
+        i = roots
+        for _ in depth:
+            i = children.take(2 * i + c.take(i))
+        # Sequential sum as sklearn, to have the same rounding.
+        return np.cumsum(values.take(i))[-1]
+
+    return predict
+
+
+def _lookup_predictor(model, trees, columns, max_cells):
+    # Table of the predictions on the grid of the cells delimited by the node
+    # thresholds, filled by the model itself on one point of each cell.
+    trees = [tree.tree_ for tree in trees]
+    feature = np.concatenate([t.feature for t in trees])
+    threshold = np.concatenate([t.threshold for t in trees])
+    b = np.concatenate([t.children_left for t in trees]) != -1
+    feature, threshold = feature[b], _float32_thresholds(threshold[b])
+    features = np.unique(feature).tolist()
+    edges = [np.unique(threshold[feature == i]) for i in features]
+    shape = [len(e) + 1 for e in edges]
+    if not features or np.prod(shape, dtype=float) > max_cells:
+        return None
+
+    X = np.zeros((int(np.prod(shape)), trees[0].n_features))
+    points = [np.append(e, np.nextafter(e[-1], np.inf)) for e in edges]
+    for i, x in zip(features, np.meshgrid(*points, indexing='ij')):
+        X[:, i] = x.ravel()
+    table = model.predict(X)
+
+    strides = (np.cumprod(shape[::-1])[::-1] // shape).tolist()
+    cells = list(zip([columns[i] for i in features],
+                     [e.tolist() for e in edges], strides))
+
+    def predict(x):
+        i = 0
+        for j, e, s in cells:
+            i += s * bisect.bisect_left(e, x[j])
+        return table[i]
+
+    return predict
+
+
+def compile_predictor(model, columns=None, max_cells=0):
+    """
+    Lowers a fitted sklearn tree model to a function that predicts a single
+    sample without the sklearn overhead.
+
+    The compiled function returns exactly `model.predict(X[:, columns])[0]`,
+    where `X` is the sample as a one-row matrix.
+
+    :param model:
+        Fitted model (`DecisionTreeClassifier`, `DecisionTreeRegressor`,
+        `GradientBoostingRegressor`, `RANSACRegressor` of those, or a
+        `Pipeline` of feature selections and one of those). Bound `predict`
+        methods are accepted as well.
+    :type model: object
+
+    :param columns:
+        Indices of the sample values that are the model features.
+    :type columns: list[int], optional
+
+    :param max_cells:
+        Max number of cells of the lookup table of a gradient boosting model.
+        If the node thresholds split the features in fewer cells, the
+        predictions are pre-computed in a table (memory: 8 bytes per cell),
+        otherwise the trees are evaluated on flat arrays.
+    :type max_cells: int, optional
+
+    :return:
+        Function that predicts a single sample (`f(x)`), or None if the model
+        cannot be compiled.
+    :rtype: callable | None
+    """
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+    if inspect.ismethod(model) and model.__name__ == 'predict':
+        model = model.__self__
+
+    model, columns = _selected_columns(model, columns)
+
+    if isinstance(model, RANSACRegressor):
+        model = model.estimator_
+
+    if isinstance(model, (DecisionTreeClassifier, DecisionTreeRegressor)):
+        if model.n_outputs_ != 1:
+            return None
+    elif not isinstance(model, GradientBoostingRegressor):
+        return None
+
+    if isinstance(model, GradientBoostingRegressor):
+        n_features = model.estimators_[0, 0].n_features_
+    else:
+        n_features = model.n_features_
+
+    if columns is None:
+        columns = range(n_features)
+    columns = [int(i) for i in columns]
+
+    if isinstance(model, DecisionTreeClassifier):
+        value = model.tree_.value[:, 0]
+        return _tree_predictor(
+            model, columns, model.classes_.take(value.argmax(axis=1)).tolist()
+        )
+    elif isinstance(model, DecisionTreeRegressor):
+        return _tree_predictor(model, columns, model.tree_.value[:, 0, 0])
+
+    func = _lookup_predictor(model, model.estimators_[:, 0], columns,
+                             max_cells)
+    if func is not None:
+        return func
+
+    init = model.init_.predict(np.zeros((1, n_features)))
+    return _ensemble_predictor(
+        model.estimators_[:, 0], columns, model.learning_rate,
+        np.asarray(init, dtype=float).ravel()[0]
+    )
+
+
 _value_parsers = {
     '+': int,
     '*': float,
@@ -197,6 +197,10 @@ setup(
             'keyring',
             'transitions',
         ],
+        'columnar': [
+            'pyarrow',
+            'tables',
+        ],
     },
     packages=find_packages(exclude=['tests', 'doc']),
     package_data={'co2mpas': [
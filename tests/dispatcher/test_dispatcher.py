@@ -1108,6 +1108,140 @@ class TestDispatch(unittest.TestCase):
         self.assertEqual({'b': 5, 'c': 0, 'd': 0}, o)
         self.assertEqual(o.workflow.edge, w)
 
+    def test_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from co2mpas.dispatcher.utils.dsp import SubDispatch
+
+        sub_dsp = self.dsp_of_dsp_2.copy()
+        dsp = Dispatcher()
+        dsp.add_function('sub', SubDispatch(sub_dsp), ['i'], ['o'])
+        dsp.add_function('max', max, ['a', 'b'], ['c'])
+        dsp.add_function('min', min, ['a', 'b'], ['d'])
+
+        cases = [
+            (self.dsp, ({'a': 5, 'b': 6, 'd': 0}, ['a', 'b', 'd']),
+             {'wildcard': True}),
+            (self.dsp, ({'a': 5, 'b': 6},), {}),
+            (self.dsp_of_dsp_2, ({'a': 3, 'b': 5},), {}),
+            (self.dsp_of_dsp_3, ({'a': 6, 'b': 5},), {}),
+            (self.dsp_of_dsp_4, ({'a': 6, 'b': 5},), {}),
+            (dsp, ({'i': {'a': 3, 'b': 5}, 'a': 1, 'b': 2},), {}),
+        ]
+
+        with ThreadPoolExecutor(4) as executor:
+            for d, args, kw in cases:
+                r = d.dispatch(*args, **kw)
+                o = d.dispatch(*args, executor=executor, **kw)
+                self.assertEqual(o, r)
+                self.assertEqual(o.workflow.edge, r.workflow.edge)
+                self.assertEqual(list(o.dist.items()), list(r.dist.items()))
+                self.assertIsNone(o.executor)
+
+    def test_executor_sub_dispatch(self):
+        import time
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from co2mpas.dispatcher.utils.dsp import SubDispatch
+
+        threads = set()
+
+        def calibrate(a, b):
+            time.sleep(0.05)
+            threads.add(threading.current_thread().name)
+            return a * b
+
+        def select(a, b):
+            threads.add(threading.current_thread().name)
+            return a + b
+
+        def cycle_inputs(a, b):
+            return {'a': a, 'b': b}
+
+        def model(o, a):
+            return o[0] * 10 + a
+
+        cycle = Dispatcher()
+        cycle.add_function('calibrate', calibrate, ['a', 'b'], ['c'],
+                           no_side_effects=True)
+        cycle.add_function('predict', select, ['a', 'c'], ['d'],
+                           no_side_effects=True)
+
+        # Two independent cycles, as the calibrations of the CO2MPAS model.
+        dsp, subs = Dispatcher(), {}
+        for k in ('h', 'l'):
+            subs[k] = SubDispatch(cycle, outputs=['d'], output_type='list')
+            dsp.add_function('select_' + k, cycle_inputs, ['a', k],
+                             ['i_' + k], no_side_effects=True)
+            dsp.add_function('cycle_' + k, subs[k], ['i_' + k], ['o_' + k],
+                             no_side_effects=True)
+            dsp.add_function('model_' + k, model, ['o_' + k, 'a'], ['m_' + k])
+        dsp.add_function('select', select, ['m_h', 'm_l'], ['m'],
+                         no_side_effects=True)
+
+        class Executor(ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super(Executor, self).__init__(*args, **kwargs)
+                self.submitted = []
+
+            def submit(self, fun, *args, **kwargs):
+                self.submitted.append(fun)
+                return super(Executor, self).submit(fun, *args, **kwargs)
+
+        inputs = {'a': 1, 'h': 3, 'l': 4}
+        r = dsp.dispatch(inputs)
+        sols = {k: s.solution for k, s in subs.items()}
+        threads.clear()
+        with Executor(4) as executor:
+            o = dsp.dispatch(inputs, executor=executor)
+
+        self.assertEqual(r['m'], 92)
+        self.assertEqual(o, r)
+        self.assertEqual(o.workflow.edge, r.workflow.edge)
+        self.assertEqual(list(o.dist.items()), list(r.dist.items()))
+        # Work has been submitted and run by the pool.
+        self.assertTrue(executor.submitted)
+        self.assertTrue(threads - {threading.main_thread().name})
+        for k, s in subs.items():
+            sol = o.workflow.node['cycle_' + k]['solution']
+            self.assertIsNot(sol, sols[k])
+            self.assertEqual(sol, sols[k])
+            self.assertIs(s.solution, sol)
+        self.assertIsNot(o.workflow.node['cycle_h']['solution'],
+                         o.workflow.node['cycle_l']['solution'])
+
+    def test_executor_no_side_effects(self):
+        from concurrent.futures import Future
+
+        class Executor(object):
+            def __init__(self):
+                self.submitted = []
+
+            def submit(self, fun, *args):
+                self.submitted.append(fun)
+                future = Future()
+                future.set_result(fun(*args))
+                return future
+
+        def add(a, b):
+            return a + b
+
+        def sub(a, b):
+            return a - b
+
+        def mul(a, b):
+            return a * b
+
+        dsp = Dispatcher()
+        dsp.add_function('add', add, ['a', 'b'], ['c'])
+        dsp.add_function('sub', sub, ['a', 'b'], ['d'], no_side_effects=True)
+        dsp.add_function('mul', mul, ['a', 'b'], ['e'])
+
+        executor = Executor()
+        o = dsp.dispatch({'a': 5, 'b': 2}, executor=executor)
+        self.assertEqual(o, {'a': 5, 'b': 2, 'c': 7, 'd': 3, 'e': 10})
+        # Just the ready function nodes without side effects are submitted.
+        self.assertEqual(executor.submitted, [sub])
+
 
 class TestBoundaryDispatch(unittest.TestCase):
     def setUp(self):
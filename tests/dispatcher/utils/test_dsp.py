@@ -12,6 +12,7 @@ import unittest
 from co2mpas.dispatcher.utils.dsp import *
 from co2mpas.dispatcher import Dispatcher
 from co2mpas.dispatcher.utils.cst import SINK
+from co2mpas.dispatcher.utils.exc import DispatcherError
 
 
 class TestDoctest(unittest.TestCase):
@@ -215,3 +216,52 @@ class TestSubDispatchPipe(unittest.TestCase):
         fun = SubDispatchPipe(self.dsp_4, 'F', ['b', 'a'], ['c', 'd'])
         # noinspection PyCallingNonCallable
         self.assertEqual(fun(5, 20), [25, 20])
+
+    def test_execution_plan(self):
+        calls = []
+
+        def f(a):
+            calls.append('f')
+            if a == 0:
+                raise ZeroDivisionError
+            return a
+
+        def callback(v):
+            calls.append('callback')
+            if v == 3:
+                raise ValueError
+
+        dsp = Dispatcher()
+        dsp.add_data('b', callback=callback)
+        dsp.add_function(function=f, inputs=['a'], outputs=['b'])
+        dsp.add_function(function=abs, inputs=['b'], outputs=['c'],
+                         input_domain=lambda b: b > 0)
+
+        fun = SubDispatchPipe(dsp, 'F', ['a'], ['c'])
+        self.assertIsNotNone(fun._plan)
+        # noinspection PyCallingNonCallable
+        self.assertEqual(fun(2), 2)
+        self.assertEqual(calls, ['f', 'callback'])
+
+        # The domain rejects the plan, hence the pipe is resumed from `abs`.
+        del calls[:]
+        # noinspection PyCallingNonCallable
+        self.assertRaises(DispatcherError, fun, -2)
+        self.assertEqual(calls, ['f', 'callback'])
+
+        # Failures are handled as in the dispatch pipe.
+        pipe = SubDispatchPipe(dsp, 'F', ['a'], ['c'])
+        pipe._plan = None
+        for func in (fun, pipe):
+            del calls[:]
+            # noinspection PyCallingNonCallable
+            self.assertRaises(DispatcherError, func, 0)
+            self.assertEqual(calls, ['f'])
+
+            del calls[:]
+            # noinspection PyCallingNonCallable
+            self.assertEqual(func(3), 3)
+            self.assertEqual(calls, ['f', 'callback'])
+
+        fun = SubDispatchPipe(self.dsp_3, 'F', ['b', 'a'], ['c', 'd'])
+        self.assertIsNone(fun._plan)  # It contains a sub-dispatcher.
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from co2mpas.model.physical.clutch_tc import clutch
+from co2mpas.model.physical.cycle import cycle_times
+from co2mpas.model.physical.cycle.NEDC import nedc_gears
+from co2mpas.model.physical.gear_box import calculate_gear_shifts
+
+
+class TestClutch(unittest.TestCase):
+    def setUp(self):
+        self.times = cycle_times(1, 1181)
+        gears = nedc_gears(self.times, 5).astype(int)
+        self.gear_shifts = calculate_gear_shifts(gears)
+
+    def test_calculate_clutch_phases(self):
+        times, gear_shifts = self.times, self.gear_shifts
+        for dn, up in ((-1.5, 2.0), (0.0, 0.0), (-3.0, 0.5)):
+            res = np.zeros(times.shape[0], dtype=bool)
+            for t in times[gear_shifts]:
+                res |= (t + dn <= times) & (times <= t + up)
+            npt.assert_array_equal(
+                clutch.calculate_clutch_phases(times, gear_shifts, (dn, up)),
+                res
+            )
+
+    def test_identify_clutch_window(self):
+        import scipy.optimize as sci_opt
+        import sklearn.linear_model as sk_lim
+        import co2mpas.utils as co2_utl
+        times, gear_shifts = self.times, self.gear_shifts
+        rng, n = np.random.RandomState(0), times.shape[0]
+        acc = rng.randn(n)
+        speeds = 1500 + rng.randn(n) * 50
+        speeds += 300 * np.convolve(gear_shifts, [1, 1, 1], 'same') * acc
+        hot, cold = np.tile(1500.0, n), np.zeros(n)
+        res = clutch.identify_clutch_window(
+            times, acc, gear_shifts, speeds, hot, cold, 6.0
+        )
+
+        delta = speeds - hot
+        b = np.abs(delta) > np.std(delta) * 2
+
+        def _error(v):
+            phases = clutch.calculate_clutch_phases(times, gear_shifts, v) & b
+            X, y = acc[phases, None], delta[phases]
+            model = co2_utl._SafeRANSACRegressor(
+                base_estimator=sk_lim.LinearRegression(fit_intercept=False),
+                random_state=0
+            )
+            return -model.fit(X, y).score(X, y)
+
+        ref = sci_opt.brute(_error, ((0, -3), (0, 3)), Ns=4, finish=None)
+        self.assertEqual(res, tuple(ref))
+        self.assertNotEqual(res, (0, 0))
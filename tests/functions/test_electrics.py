@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+import sklearn.ensemble as sk_ens
+
+from co2mpas.model.physical import electrics as elc
+from co2mpas.model.physical.cycle import cycle_times
+from co2mpas.model.physical.cycle.NEDC import nedc_velocities
+from co2mpas.model.physical.engine.start_stop import identify_engine_starts
+from co2mpas.model.physical.vehicle import calculate_accelerations
+
+
+class TestElectrics(unittest.TestCase):
+    def test_compile(self):
+        times = cycle_times(1, 1181)
+        vel = nedc_velocities(times, 'manual')
+        acc = calculate_accelerations(times, vel)
+        rng, n = np.random.RandomState(0), times.shape[0]
+        speeds, powers = vel * 30 + 500, vel * acc + rng.randn(n)
+        on_engine = (vel > 1) | (times < 200)
+
+        X = np.column_stack((np.linspace(20, 90, n), powers, speeds, acc))
+        y = (90 - X[:, 0]) / 200 + np.maximum(X[:, 1], 0) / 100
+        opt = {'random_state': 0, 'max_depth': 2, 'n_estimators': 50}
+        status_model = elc.define_alternator_status_model(70, 10)
+        current_model = elc.AlternatorCurrentModel()
+        current_model.model = sk_ens.GradientBoostingRegressor(**opt).fit(
+            X, -np.abs(y) * 50).predict
+        current_model.mask = np.array([1, 3, 4, 2])
+        current_model.init_model = lambda x: [-10.0]
+        electrics_model = elc.define_electrics_model(
+            50, status_model, 80, current_model, 30, 14, 5, (0.3, 0.5), True,
+            60, times
+        )
+
+        args = (68, times, powers, on_engine, identify_engine_starts(on_engine),
+                acc)
+        res = elc.predict_vehicle_electrics(electrics_model, *args)
+        # Not compiled.
+        ref = elc.predict_vehicle_electrics(electrics_model.predict, *args)
+        for r, e in zip(res, ref):
+            self.assertEqual(r.dtype, e.dtype)
+            npt.assert_array_equal(r, e)
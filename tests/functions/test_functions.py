@@ -15,6 +15,59 @@ import numpy.testing as npt
 from co2mpas.model.physical.engine import co2_emission
 
 
+def _fmep_reference(model, params, *args):
+    # Combinations compared one after the other.
+    s = None
+    for p, d, n in model.combination(params, *args):
+        d['fmep'], d['v'] = co2_emission._calculate_fc(
+            *co2_emission._fuel_ABC(**p)
+        )
+        if s is None:
+            s = d
+        else:
+            b = d['fmep'] < s['fmep']
+            if n is True and b is True:
+                s = d
+            elif b is not False:
+                n &= b
+                if n.all():
+                    s = d
+                elif n.any():
+                    for k, v in d.items():
+                        s[k] = np.where(n, v, s[k])
+    return s['fmep'], s['v']
+
+
+def _co2_error_function(rng):
+    # CO2 error function of a synthetic cold cycle.
+    from scipy.interpolate import InterpolatedUnivariateSpline as Spline
+    from co2mpas.model.physical.engine import calculate_mean_piston_speeds
+    speeds = rng.uniform(700, 3500, 300)
+    powers = rng.uniform(-10, 60, 300)
+    temps = np.linspace(20, 95, 300)
+    stroke, capacity, lhv = 80.0, 1500.0, 43200.0
+    fmep = co2_emission.FMEP(
+        Spline([0, 10, 20, 30], [10, 20, 18, 12], k=1),
+        active_cylinder_ratios=(1.0, 0.5), has_cylinder_deactivation=True,
+        has_lean_burn=True, has_exhausted_gas_recirculation=True,
+        engine_type='compression'
+    )
+    model = co2_emission.define_co2_emissions_model(
+        speeds, powers, calculate_mean_piston_speeds(speeds, stroke),
+        co2_emission.calculate_brake_mean_effective_pressures(
+            speeds, powers, capacity, 100),
+        temps, speeds > 100, lhv, (800, 50), stroke, capacity,
+        co2_emission.define_idle_fuel_consumption_model(
+            (800, 50), capacity, stroke, lhv, fmep),
+        3.1, 100, co2_emission.define_tau_function((60, 80)), fmep
+    )
+    params = co2_emission.define_initial_co2_emission_model_params_guess(
+        {}, 'compression', 85, (80, 95))[0]
+    err = co2_emission.define_co2_error_function_on_emissions(
+        model, model(params)[0] * 1.05)
+    return temps, params, err
+
+
 @ddt.ddt
 class TCO2(unittest.TestCase):
 
@@ -40,3 +93,113 @@ class TCO2(unittest.TestCase):
         self.assertTrue((norm_theta <= 1).all(), 'Not <= 1! %s' % norm_theta)
         self.assertTrue((norm_theta >= 0).all(), 'Not >= 0! %s' % norm_theta)
         npt.assert_almost_equal(norm_theta, exp_norm_theta, decimal=3)
+
+    def test_fmep(self):
+        from scipy.interpolate import InterpolatedUnivariateSpline as Spline
+        fbc = Spline([0, 10, 20, 30], [10, 20, 18, 12], k=1)
+        rng = np.random.RandomState(0)
+        n_speeds = rng.uniform(1, 20, 100)
+        n_powers = rng.uniform(-5, 25, 100)
+        n_temp = np.clip(rng.uniform(0.8, 1.2, 100), 0, 1)
+        params = {'a2': -0.0012, 'b2': 0, 'a': 0.3, 'b': 0.02, 'c': -0.0002,
+                  'l': -2.1, 'l2': -0.02, 't': 2.0}
+
+        for engine_type in ('positive turbo', 'compression'):
+            model = co2_emission.FMEP(
+                fbc, active_cylinder_ratios=(1.0, 0.5),
+                has_cylinder_deactivation=True,
+                has_variable_valve_actuation=True, has_lean_burn=True,
+                has_exhausted_gas_recirculation=True, engine_type=engine_type
+            )
+            for args in ((n_speeds, n_powers, n_temp), (n_speeds, 0, 1),
+                         (3.0, 0, 1)):
+                res = model(params, *args)[:2]
+                for r, e in zip(res, _fmep_reference(model, params, *args)):
+                    npt.assert_array_equal(r, e)
+
+    def test_fmep_cold(self):
+        from scipy.interpolate import InterpolatedUnivariateSpline as Spline
+        fbc = Spline([0, 10, 20, 30], [10, 20, 18, 12], k=1)
+        rng = np.random.RandomState(0)
+        n_speeds = rng.uniform(1, 20, 100)
+        n_powers = rng.uniform(-5, 25, 100)
+        n_temp = np.clip(rng.uniform(0.8, 1.2, 100), 0, 1)
+        params = {'a2': -0.0012, 'b2': 0, 'a': 0.3, 'b': 0.02, 'c': -0.0002,
+                  'l': -2.1, 'l2': -0.02, 't': 2.0}
+        cold = dict(params, t=rng.uniform(1, 3, 100))  # Tau of a cold cycle.
+
+        for engine_type in ('positive turbo', 'compression'):
+            model = co2_emission.FMEP(
+                fbc, active_cylinder_ratios=(1.0, 0.5),
+                has_cylinder_deactivation=True,
+                has_variable_valve_actuation=True, has_lean_burn=True,
+                has_exhausted_gas_recirculation=True, engine_type=engine_type
+            )
+            args = n_speeds, n_powers, n_temp
+            res = model(cold, *args)[:2]
+            for r, e in zip(res, _fmep_reference(model, cold, *args)):
+                npt.assert_array_equal(r, e)
+
+            # Tau is not used at idle, i.e. with normalized temperatures = 1.
+            exp = model(params, 3.0, 0, 1)
+            self.assertEqual(model(cold, 3.0, 0, 1), exp)
+            for r, e in zip(model(cold, 3.0, 0, np.ones(100)), exp):
+                npt.assert_array_equal(r, e)
+
+    def test_array_parameters(self):
+        import lmfit
+        params = lmfit.Parameters()
+        params.add('a', value=1, min=0, max=2)
+        params.add('b', value=2, vary=False)
+        params.add('c', value=3)
+        p = co2_emission.ArrayParameters.from_parameters(params)
+        self.assertEqual(p.vary_names(), ['a', 'c'])
+        self.assertEqual(dict(p.valuesdict()), params.valuesdict())
+
+        q = p.copy()
+        co2_emission._set_attr(q, {'c': 4.0}, attr='value')
+        co2_emission._set_attr(q, {'a': 0.0}, attr='max')  # Collapsed.
+        self.assertEqual(p.value('c'), 3)
+        res = q.to_parameters(params)
+        self.assertEqual(res.valuesdict(), {'a': 0.0, 'b': 2, 'c': 4.0})
+        self.assertEqual((res['a'].vary, res['c'].vary), (False, True))
+        self.assertEqual(params['c'].value, 3)
+
+    def test_co2_population(self):
+        import copy
+        rng = np.random.RandomState(0)
+        temps, params, err = _co2_error_function(rng)
+
+        keys = [k for k, v in params.items() if v.vary]
+        x0 = np.array([params[k].value for k in keys])
+        population = x0 * rng.uniform(0.8, 1.2, (8, len(keys)))
+        population[1, keys.index('t0')] = population[1, keys.index('t1')] = 0
+        res = err(params, population=population)
+        for e, x in zip(res, population):
+            p = copy.deepcopy(params)
+            for k, v in zip(keys, x):
+                p[k].value = v
+            self.assertAlmostEqual(e, err(p), places=10)
+
+        hot, p = temps > 90, copy.deepcopy(params)
+        co2_emission._set_attr(p, set(keys) - {'a', 'l'}, default=False)
+        p, s = co2_emission.calibrate_model_params(
+            err, p, method='multistart', sub_values=hot
+        )
+        self.assertLess(err(p, sub_values=hot), err(params, sub_values=hot))
+
+    def test_calibrate_model_params(self):
+        import copy
+        import lmfit
+        temps, params, err = _co2_error_function(np.random.RandomState(0))
+        hot = temps > 90
+        co2_emission._set_attr(params, {'a', 'b', 'c', 'l', 'l2', 't0', 't1',
+                                        'trg'}, default=False)
+
+        p, s = co2_emission.calibrate_model_params(
+            err, copy.deepcopy(params), sub_values=hot
+        )
+        res = lmfit.minimize(err, copy.deepcopy(params), method='nelder',
+                             kws={'sub_values': hot})
+        self.assertEqual(s, res.success)
+        self.assertEqual(p.valuesdict(), res.params.valuesdict())
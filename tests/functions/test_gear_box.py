@@ -8,9 +8,15 @@
 
 import doctest
 import unittest
+from unittest import mock
+
+import numpy.testing as npt
 
 from co2mpas.model.physical.gear_box import *
 from co2mpas.model.physical.gear_box import _gear_box_torques_in
+from co2mpas.model.physical.cycle import cycle_times
+from co2mpas.model.physical.cycle.NEDC import nedc_velocities, nedc_gears
+from co2mpas.model.physical.vehicle import calculate_accelerations
 
 
 class TestDoctest(unittest.TestCase):
@@ -198,3 +204,158 @@ class TestGearBox_v1(unittest.TestCase):
         self.assertTrue(np.allclose(res[0], v + 1, 0, 0.001))
         self.assertTrue(np.allclose(res[1], self.tgb, 0, 0.001))
         self.assertTrue(np.allclose(res[2], v + self.st, 0, 0.001))
+
+
+class TestCorrectGear(unittest.TestCase):
+    def test_correct_gears(self):
+        import functools
+        from co2mpas.model.physical.gear_box import at_gear, mechanical
+        times = cycle_times(1, 1181)
+        vel = nedc_velocities(times, 'manual')
+        gears = nedc_gears(times, 5).astype(int)
+        rng, n = np.random.RandomState(0), times.shape[0]
+        acc = calculate_accelerations(times, vel) + rng.randn(n) * 0.1
+        vsr = {0: 0.0, 1: 0.008, 2: 0.013, 3: 0.019, 4: 0.026, 5: 0.034}
+        idle = (800.0, 50.0)
+        mvl = at_gear.calibrate_mvl(gears, vel, vsr, idle, 1)
+        mvl.plateau_acceleration = 0.1
+        flc = functools.partial(np.interp, xp=[0, 1], fp=[0.3, 1])
+        correct_gear = at_gear.CorrectGear(vsr, idle)
+        correct_gear.fit_correct_gear_mvl(mvl)
+        correct_gear.fit_correct_gear_full_load(
+            60, 4000, flc, (120, 0.5, 0.04), 1500, 100
+        )
+        correct_gear.fit_basic_correct_gear()
+
+        g = rng.randint(0, 6, n)
+        res = correct_gear.correct_gears(vel, acc, g)
+        npt.assert_array_equal(res, list(map(correct_gear, vel, acc, g)))
+        self.assertTrue((res != g).any())
+
+        cmv = at_gear.CMV(
+            [(0, (0, 1)), (1, (0.5, 20)), (2, (15, 38)), (3, (30, 60)),
+             (4, (50, 80)), (5, (70, float('inf')))], velocity_speed_ratios=vsr
+        )
+        X = np.column_stack((vel, acc))
+        res = cmv.predict(X, correct_gear=correct_gear)
+        # Not vectorized.
+        ref = cmv.predict(X, correct_gear=lambda *a: correct_gear(*a))
+        self.assertEqual(res.dtype, ref.dtype)
+        npt.assert_array_equal(res, ref)
+
+        speeds = mechanical.calculate_gear_box_speeds_in(gears, vel, vsr, 1)
+        speeds += rng.randn(n) * 50
+        args = gears, speeds, vel, acc, vsr, 1
+        res = at_gear.CMV().fit(correct_gear, *args)
+        ref = at_gear.CMV().fit(lambda *a: correct_gear(*a), *args)
+        self.assertEqual(list(res.items()), list(ref.items()))
+
+
+def _fake_fit_at_model(d, inputs, model_id, model, ref):
+    # The models of the tests are their own errors.
+    return dict(model), model
+
+
+def _nedc_at_data():
+    from co2mpas.model.physical.gear_box import mechanical
+    times = cycle_times(1, 1181)
+    vel = nedc_velocities(times, 'manual')
+    gears = nedc_gears(times, 5).astype(int)
+    rng, n = np.random.RandomState(0), times.shape[0]
+    acc = calculate_accelerations(times, vel)
+    vsr = {0: 0.0, 1: 0.008, 2: 0.013, 3: 0.019, 4: 0.026, 5: 0.034}
+    speeds = mechanical.calculate_gear_box_speeds_in(gears, vel, vsr, 1)
+    speeds = np.where(vel > 1, speeds, 800) + rng.randn(n) * 50
+    return rng, {
+        'times': times, 'velocities': vel, 'accelerations': acc,
+        'gears': gears, 'velocity_speed_ratios': vsr, 'stop_velocity': 1.0,
+        'engine_speeds_out': speeds, 'idle_engine_speed': (800.0, 50.0),
+        'motive_powers': acc * vel * 1.5, 'cycle_type': 'NEDC',
+        'engine_coolant_temperatures': np.minimum(20 + times / 4, 90),
+        'time_cold_hot_transition': 300.0, 'use_dt_gear_shifting': True,
+        'specific_gear_shifting': 'ALL'
+    }
+
+
+class TestATModelsSelector(unittest.TestCase):
+    def setUp(self):
+        t_e = 'mean_absolute_error', 'accuracy_score', 'correlation_coefficient'
+        self.errors = {
+            'CMV': dict(zip(t_e, (20.0, 0.9, 0.8))),
+            'DT_VA': dict(zip(t_e, (10.0, 0.9, 0.9))),
+            'DT_VAT': dict(zip(t_e, (5.0, 1.0, 1.0))),  # Cannot be outranked.
+            'GSPV': dict(zip(t_e, (1.0, 0.8, 1.0)))
+        }
+        self.nan = dict.fromkeys(t_e, np.nan)
+
+    def test_min_at_model_error(self):
+        from co2mpas.model.selector import _min_at_model_error
+        from co2mpas.model.physical.gear_box import at_gear, mechanical
+        rng, ref = _nedc_at_data()
+        vel, vsr, gears = ref['velocities'], ref['velocity_speed_ratios'], \
+            ref['gears']
+        speeds, n = ref['engine_speeds_out'], vel.shape[0]
+        res = _min_at_model_error(ref)
+
+        def _err(g):
+            eng = mechanical.calculate_gear_box_speeds_in(g, vel, vsr, 1)
+            e = at_gear.calculate_error_coefficients(
+                gears, g, speeds, eng, vel, 1
+            )
+            return e['mean_absolute_error']
+
+        errors = [_err(rng.randint(0, 6, n)) for _ in range(10)]
+        errors.append(_err(gears))
+        self.assertTrue(all(res <= e for e in errors))
+
+        eng = np.array([mechanical.calculate_gear_box_speeds_in(
+            np.tile(k, n), vel, vsr, 1) for k in range(7)])
+        best = np.abs(eng - speeds).argmin(axis=0)
+        self.assertEqual(res, _err(best))
+
+    def test_fit_at_models(self):
+        import co2mpas.model.selector as sel
+        args = [({}, k, m, {}) for k, m in sorted(self.errors.items())]
+        with mock.patch.object(sel, '_fit_at_model', _fake_fit_at_model), \
+                mock.patch.object(sel, '_min_at_model_error', lambda r: 5.0):
+            res = sel._fit_at_models(None, args, 2)
+            # The models after `DT_VAT` are cancelled.
+            self.assertEqual([r[0] for r in res], [
+                self.errors[k] for k in ('CMV', 'DT_VA', 'DT_VAT')
+            ])
+
+            args = [a for a in args if a[1] != 'DT_VAT']
+            res = sel._fit_at_models(None, args, 2)
+            self.assertEqual([r[0] for r in res], [a[2] for a in args])
+
+    def test_at_models_selector(self):
+        import co2mpas.model.selector as sel
+        from co2mpas.model.physical.defaults import dfl
+        from co2mpas.model.physical.gear_box.at_gear import at_gear
+        func = sel.sub_models()['at_model']['select_models']
+        ids = ['CMV', 'CMV_Cold_Hot', 'DT_VA', 'DT_VAP', 'GSPV',
+               'GSPV_Cold_Hot']
+        data, res = _nedc_at_data()[1], {}
+        d, jobs = dfl.functions.at_models_selector, None
+        try:
+            jobs = d.jobs
+            for d.jobs in (1, 2):
+                out = at_gear().dispatch(data)
+                # With a pool, the selector calibrates the models.
+                self.assertEqual(
+                    sorted(k for k in ids if k in out), ids if d.jobs == 1 else []
+                )
+                models = func(ids + ['specific_gear_shifting'], out)
+                res[d.jobs] = models, out['at_scores']
+        finally:
+            d.jobs = jobs
+
+        (models, scores), (p_models, p_scores) = res[1], res[2]
+        self.assertEqual(sorted(scores), ids)
+        self.assertEqual(list(scores), list(p_scores))
+        for k, e in p_scores.items():
+            if not np.isnan(e['mean_absolute_error']):
+                self.assertEqual(scores[k], e)
+        k = models['specific_gear_shifting']
+        self.assertEqual(k, p_models['specific_gear_shifting'])
+        self.assertEqual(set(models), set(p_models))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+import sklearn.ensemble as sk_ens
+
+import co2mpas.model.physical as phy
+from co2mpas.model.physical import electrics as elc
+from co2mpas.model.physical.cycle import cycle_times
+from co2mpas.model.physical.cycle.NEDC import nedc_velocities
+from co2mpas.model.physical.defaults import dfl
+from co2mpas.model.physical.engine import thermal, start_stop
+from co2mpas.model.physical.vehicle import calculate_accelerations
+
+
+class TestPhysical(unittest.TestCase):
+    def test_compiled_kernel(self):
+        times = cycle_times(1, 1181)
+        vel = nedc_velocities(times, 'manual')
+        acc = calculate_accelerations(times, vel)
+        rng, n = np.random.RandomState(0), times.shape[0]
+        speeds, powers = vel * 30 + 500, vel * acc + rng.randn(n)
+
+        def gbr(X, y):
+            opt = {'random_state': 0, 'max_depth': 2, 'n_estimators': 50}
+            return sk_ens.GradientBoostingRegressor(**opt).fit(X, y)
+
+        X = np.column_stack((np.linspace(20, 90, n), powers, speeds, acc))
+        y = (90 - X[:, 0]) / 200 + np.maximum(X[:, 1], 0) / 100
+        thermal_model = thermal.ThermalModel()
+        thermal_model.model, thermal_model.mask = gbr(X[:, :3], y), [0, 1, 2]
+        thermal_model.cold, thermal_model.mask_cold = gbr(X[:, 2:], y), [2, 3]
+        thermal_model.min_temp = 30
+
+        ss_model = start_stop.StartStopModel().fit(
+            (vel > 1) | (X[:, 0] < 40), vel, acc, X[:, 0], X[:, 0]
+        )
+
+        status_model = elc.define_alternator_status_model(70, 10)
+        current_model = elc.AlternatorCurrentModel()
+        current_model.model = gbr(X, -np.abs(y) * 50).predict
+        current_model.mask = np.array([1, 3, 4, 2])
+        current_model.init_model = lambda x: [-10.0]
+        electrics_model = elc.define_electrics_model(
+            50, status_model, 80, current_model, 30, 14, 5, (0.3, 0.5), True,
+            60, times
+        )
+        args = (electrics_model, ss_model, thermal_model, 22.0, 68, (800, 50),
+                times, powers, speeds, powers, vel, acc, np.ones(n), 0, False,
+                3, True, False, 95)
+        d = dfl.functions.predict_vehicle_electrics_and_engine_behavior
+        try:
+            d.enable_compiled_kernel = False
+            ref = phy.predict_vehicle_electrics_and_engine_behavior(*args)
+            d.enable_compiled_kernel = True
+            res = phy.predict_vehicle_electrics_and_engine_behavior(*args)
+        finally:
+            d.enable_compiled_kernel = True
+        self.assertTrue(0 < ref[3].sum() and 0 < (~ref[4]).sum())
+        for r, e in zip(res, ref):
+            self.assertEqual(r.dtype, e.dtype)
+            npt.assert_array_equal(r, e)
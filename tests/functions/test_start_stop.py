@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from co2mpas.model.physical.cycle import cycle_times
+from co2mpas.model.physical.cycle.NEDC import nedc_velocities
+from co2mpas.model.physical.engine import start_stop
+from co2mpas.model.physical.vehicle import calculate_accelerations
+
+
+class TestStartStop(unittest.TestCase):
+    def test_start_stop_compile(self):
+        times = cycle_times(1, 1181)
+        vel = nedc_velocities(times, 'manual')
+        acc = calculate_accelerations(times, vel)
+        temp, soc = np.minimum(20 + times / 4, 90), 70 + 5 * np.sin(times / 50)
+        on = (vel > 1) | (temp < 40) | (soc < 68)
+        model = start_stop.StartStopModel().fit(on, vel, acc, temp, soc)
+        base = start_stop.DefaultStartStopModel.predict
+        X = np.column_stack((vel, acc, temp, soc))
+        for basic, m in ((True, model.base), (False, model.model)):
+            kw = dict(start_stop_activation_time=20, use_basic_start_stop=basic,
+                      min_time_engine_on_after_start=3)
+            res = model.predict(times, vel, acc, temp, soc, **kw)
+            gen = model.yield_on_start(times, vel, acc, temp, soc, **kw)
+            ref = model._on_start(
+                times, times > 20, X, lambda x: base([x])[0],
+                lambda x: m.predict([x])[0], 3
+            )
+            ref = np.array(list(ref), dtype=bool).T
+            self.assertTrue((~ref[0]).any())
+            npt.assert_array_equal(res, ref)
+            npt.assert_array_equal(np.array(list(gen), dtype=bool).T, ref)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2014-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+import sklearn.ensemble as sk_ens
+
+from co2mpas.model.physical.defaults import dfl
+from co2mpas.model.physical.engine import thermal
+
+
+class TestThermal(unittest.TestCase):
+    def test_thermal_compile(self):
+        rng = np.random.RandomState(0)
+        X = rng.uniform((20, -10, 700, -1), (100, 40, 3500, 1), (500, 4))
+        y = (100 - X[:, 0]) * X[:, 2] / 1e5 + np.sin(X[:, 1])
+        opt = {'random_state': 0, 'max_depth': 2, 'n_estimators': 100}
+        model = thermal.ThermalModel()
+        model.model, model.mask = sk_ens.GradientBoostingRegressor(
+            **opt).fit(X[:, [0, 1]], y), [0, 1]
+        model.cold, model.mask_cold = sk_ens.GradientBoostingRegressor(
+            **opt).fit(X[:, 1:], y), [1, 2, 3]
+        model.min_temp = 40
+        X = np.concatenate((X, X.astype(np.float32) + 1e-6))
+        hot = X[:, 0] >= 40
+        res = np.where(hot, model.model.predict(X[:, [0, 1]]),
+                       model.cold.predict(X[:, 1:]))
+        d = dfl.functions.ThermalModel
+        n = d.max_lookup_cells
+        try:
+            for d.max_lookup_cells in (0, n):  # Flat arrays and lookup table.
+                model._compiled = None
+                npt.assert_array_equal([model.compile()(x) for x in X], res)
+        finally:
+            d.max_lookup_cells = n
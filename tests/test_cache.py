@@ -0,0 +1,156 @@
+#! python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import doctest
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import co2mpas.io.cache as co2_cache
+import co2mpas.io.npy as co2_npy
+
+
+class TestDoctest(unittest.TestCase):
+    def runTest(self):
+        failure_count, test_count = doctest.testmod(
+            co2_cache, optionflags=doctest.NORMALIZE_WHITESPACE
+        )
+        self.assertGreater(test_count, 0, (failure_count, test_count))
+        self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+
+class TestSolutionStore(unittest.TestCase):
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory() as folder:
+            store = co2_cache.SolutionStore(folder, max_size=2500)
+            keys = [store.key(i) for i in range(3)]
+            for i, k in enumerate(keys[:2]):
+                store.save(k, b'x' * 1000)
+                os.utime(store.get_fpath(k), (i, i))
+
+            store.load(keys[0])  # Recently used.
+            store.save(keys[2], b'x' * 1000)
+
+            self.assertIsNotNone(store.load(keys[0]))
+            self.assertIsNone(store.load(keys[1]))
+            self.assertIsNotNone(store.load(keys[2]))
+
+    def test_corrupted(self):
+        with tempfile.TemporaryDirectory() as folder:
+            store = co2_cache.SolutionStore(folder)
+            key = store.key('a')
+            with open(store.get_fpath(key), 'wb') as f:
+                f.write(b'')
+            self.assertEqual(store.load(key, default=1), 1)
+
+    def test_file_hash(self):
+        with tempfile.TemporaryDirectory() as folder:
+            fpaths = [os.path.join(folder, f) for f in 'ab']
+            for fpath in fpaths:
+                with open(fpath, 'w') as f:
+                    f.write('same content')
+            h = [co2_cache.file_hash(fpath) for fpath in fpaths]
+            self.assertEqual(h[0], h[1])
+
+
+class TestInputCache(unittest.TestCase):
+    def test_content_key(self):
+        import co2mpas.io as co2_io
+        import co2mpas.io.dill as co2_dill
+        dsp = co2_io.load_inputs()
+
+        def load(fpath, cache_folder):
+            inputs = {'input_file_name': fpath, 'cache_folder': cache_folder}
+            return dsp.dispatch(inputs)['raw_data']
+
+        with tempfile.TemporaryDirectory() as folder:
+            cache_folder = os.path.join(folder, 'cache')
+            fpaths = [os.path.join(folder, f, 'inp.dill') for f in 'ab']
+            for fpath in fpaths:
+                os.mkdir(os.path.dirname(fpath))
+                co2_dill.save_dill({'value': 1}, fpath)
+
+            self.assertEqual(load(fpaths[0], cache_folder), {'value': 1})
+            cache_fpath = co2_io.get_cache_fpath(fpaths[0], cache_folder)
+            self.assertTrue(os.path.isfile(cache_fpath))
+            self.assertEqual(os.listdir(cache_folder),
+                             [os.path.basename(cache_fpath)])
+            # Marks the cached data, to see when it is used.
+            co2_io.save_cache_file({'value': 'cached'}, cache_fpath)
+
+            # A copy in another folder and an mtime-only change hit the cache.
+            os.utime(fpaths[1], (0, 0))
+            self.assertEqual(load(fpaths[1], cache_folder), {'value': 'cached'})
+            self.assertFalse(os.path.exists(
+                os.path.join(folder, 'b', '.co2mpas_cache')
+            ))
+
+            # A content change misses it.
+            co2_dill.save_dill({'value': 2}, fpaths[1])
+            os.utime(fpaths[1], (1, 1))
+            self.assertEqual(load(fpaths[1], cache_folder), {'value': 2})
+            self.assertEqual(len(os.listdir(cache_folder)), 2)
+
+            # Without a central folder, the cache is next to the input.
+            self.assertEqual(load(fpaths[0], None), {'value': 1})
+            self.assertTrue(os.path.isdir(
+                os.path.join(folder, 'a', '.co2mpas_cache')
+            ))
+
+
+class TestNpy(unittest.TestCase):
+    def test_roundtrip(self):
+        data = {
+            'a': {'times': pd.Series(np.arange(10.), name='times'),
+                  'gears': pd.Series([1, 2], index=[3, 4]),
+                  'ratios': [1.0, 2.0]},
+            'b': np.arange(5),
+            'plan': pd.DataFrame(),
+            'name': 'vehicle'
+        }
+        with tempfile.TemporaryDirectory() as folder:
+            fpath = os.path.join(folder, 'data.npy')
+            co2_npy.save_npy(data, fpath)
+            co2_npy.save_npy(data, fpath)  # Overwrite.
+            res = co2_npy.load_from_npy(fpath)
+
+            pd.util.testing.assert_series_equal(res['a']['times'],
+                                                data['a']['times'])
+            pd.util.testing.assert_series_equal(res['a']['gears'],
+                                                data['a']['gears'])
+            np.testing.assert_array_equal(res['b'], data['b'])
+            self.assertEqual(res['a']['ratios'], data['a']['ratios'])
+            self.assertEqual(res['name'], data['name'])
+            self.assertTrue(res['plan'].empty)
+
+            res['b'][0] = 10  # Copy-on-write.
+            self.assertEqual(co2_npy.load_from_npy(fpath)['b'][0], 0)
+
+    def test_overwrite_in_use(self):
+        from unittest import mock
+        rename = os.rename
+
+        def locked_rename(src, dst):
+            if src == fpath:
+                raise PermissionError(src)
+            return rename(src, dst)
+
+        with tempfile.TemporaryDirectory() as folder:
+            fpath = os.path.join(folder, 'data.npy')
+            co2_npy.save_npy({'b': np.arange(5)}, fpath)
+            with mock.patch.object(co2_npy.os, 'rename', locked_rename):
+                co2_npy.save_npy({'b': np.arange(3)}, fpath)
+
+            self.assertEqual(os.listdir(folder), ['data.npy'])
+            np.testing.assert_array_equal(
+                co2_npy.load_from_npy(fpath)['b'], np.arange(5)
+            )
+
@@ -190,6 +190,80 @@ class HighSync(unittest.TestCase):
             _check_synced(self, osp.join(d, _synced_fname), 'Sheet1', prefix_columns)
 
 
+    @ddt.data((False, 1), (True, 7), (False, 1000))
+    def test_chunksize(self, case):
+        prefix_columns, chunksize = case
+        with tempfile.TemporaryDirectory(prefix='co2mpas_%s_'%__name__) as d:
+            datasync.do_datasync('x', 'y1',
+                    '%s#Sheet1!' % _sync_fname,
+                    out_path=osp.join(d, _synced_fname),
+                    prefix_cols=prefix_columns,
+                    chunksize=chunksize,
+                    )
+            _check_synced(self, osp.join(d, _synced_fname), 'Sheet1', prefix_columns)
+
+    @ddt.data(1, 2)
+    def test_batch(self, jobs):
+        with tempfile.TemporaryDirectory(prefix='co2mpas_%s_'%__name__) as d:
+            manifest = osp.join(d, 'jobs.txt')
+            with open(manifest, 'w') as f:
+                f.write('# <ref-table> [<sync-table> ...]\n'
+                        '%s#Sheet1!\n'
+                        '"%s#Sheet1!" Sheet2 Sheet3 Sheet4\n' % (
+                            _sync_fname, _abspath(_sync_fname)))
+            summary = datasync.do_datasync_batch('x', 'y1', manifest,
+                                                 out_path=d, jobs=jobs)
+            df = pd.read_csv(summary)
+            self.assertEqual(list(df['job']), [0, 0, 1, 1])
+            self.assertEqual(list(df['sheet']), ['Sheet2', 'Sheet3'] * 2)
+            self.assertTrue(df['error'].isnull().all())
+            npt.assert_array_equal(df['shift'][:2], df['shift'][2:])
+            for i in range(2):
+                fpath = osp.join(d, 'datasync.%i.sync.xlsx' % i)
+                self.assertEqual(set(df['output_file'][df['job'] == i]), {fpath})
+                _check_synced(self, fpath, 'Sheet1')
+
+    def test_batch_errors(self):
+        from tests import _tutils as tutils # XXX import chaos if outside!
+        with tempfile.TemporaryDirectory(prefix='co2mpas_%s_'%__name__) as d:
+            manifest = osp.join(d, 'jobs.txt')
+            with open(manifest, 'w') as f:
+                f.write('%s#Sheet1! BadSheet\n%s\n' % (_sync_fname,
+                                                         _sync_fname))
+            with tutils.assertRaisesRegex(self, cmain.CmdException,
+                                          'Failed 1 of 2 datasync jobs'):
+                datasync.main('batch', '-O', d, 'x', 'y1', manifest)
+            summary, = [f for f in os.listdir(d) if f.endswith('summary.csv')]
+            df = pd.read_csv(osp.join(d, summary))
+            self.assertTrue(df['error'][df['job'] == 0].notnull().all())
+            self.assertTrue(df['error'][df['job'] == 1].isnull().all())
+            _check_synced(self, osp.join(d, 'datasync.1.sync.xlsx'), 'Sheet1')
+
+    def test_shifts(self):
+        tables = datasync.Tables(('x', 'y1'), _shfact)
+        tables.collect_tables('%s#Sheet1!' % _sync_fname)
+        exp = [s for s, _ in datasync._yield_synched_tables(
+            *tables.tables, x_label='x', y_label='y1')][1:]
+        for chunksize in (5, 2 ** 16):
+            res = datasync._yield_shifts(*tables.tables, x_label='x',
+                                         y_label='y1', chunksize=chunksize)
+            npt.assert_array_almost_equal(list(res), exp)
+
+    @ddt.data(5.05, 1.3, -3.37, 12.34)
+    def test_shifts_synthetic(self, shift):
+        x = np.arange(0, 300, 0.1)
+
+        def y(t):
+            return np.abs(np.sin(t / 15)) * 50 + 10 * np.sin(t / 3.7)
+
+        tables = {'x': x, 'y': y(x)}, {'x': x[:2000], 'y': y(x[:2000] + shift)}
+        exp = [s for s, _ in datasync._yield_synched_tables(
+            *tables, x_label='x', y_label='y')][1:]
+        for chunksize in (100, 2 ** 16):
+            res = datasync._yield_shifts(*tables, x_label='x', y_label='y',
+                                         chunksize=chunksize)
+            npt.assert_array_almost_equal(list(res), exp)
+
     @ddt.data(
             ('bad_x', 'y1'),
             ('x', 'bad_y1'),
@@ -206,6 +280,25 @@ class HighSync(unittest.TestCase):
                         out_path=osp.join(d, _synced_fname),
                         )
 
+class TestBatchSheetsFactory(unittest.TestCase):
+    def test_release(self):
+        from unittest import mock
+        sheets = [mock.MagicMock(**{'get_sheet_ids.return_value': (
+            'wb%d' % (i // 2), ['sh%d' % i, i])}) for i in range(4)]
+        factory = datasync._BatchSheetsFactory(max_sheets=1)
+        for sheet in sheets:
+            factory.add_sheet(sheet)
+        factory.release()
+
+        self.assertEqual(list(factory._cached_sheets), ['wb1'])
+        self.assertEqual(set(factory._cached_sheets['wb1'].values()),
+                         {sheets[3]})
+        self.assertEqual([sh._close.call_count for sh in sheets], [1, 1, 1, 0])
+        # The 1st workbook is closed when both its sheets are dropped.
+        self.assertEqual([sh._close_all.call_count for sh in sheets],
+                         [0, 1, 0, 0])
+
+
 class TestReSampling(unittest.TestCase):
     def test_integral(self):
         x = np.linspace(0, 1, num=100)
@@ -235,3 +328,14 @@ class TestReSampling(unittest.TestCase):
         self.assertAlmostEquals(
             i, I, msg='Nonuniform Up-sampling integral mismatch!'
         )
+
+    def test_integral_blocks(self):
+        x = np.cumsum(np.random.uniform(0.05, 0.15, 3000))
+        y = np.sin(x)
+        X = np.sort(np.random.uniform(x[0], x[-1], 2000))
+        X[0], X[-1] = x[0], x[-1]
+        Y = datasync.integral_interpolation(X, x, y)
+        npt.assert_allclose(
+            datasync.integral_interpolation(X, x, y, block=100), Y, atol=1e-9
+        )
+        self.assertAlmostEqual(np.trapz(y, x), np.trapz(Y, X))
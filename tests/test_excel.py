@@ -0,0 +1,140 @@
+#! python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import co2mpas.io.excel as co2_excel
+
+
+class TestStreamWriter(unittest.TestCase):
+    def test_write_to_excel(self):
+        import xlrd
+        import co2mpas.io.columnar as co2_columnar
+        from co2mpas.batch import _get_co2mpas_output_template_fpath
+        ts = pd.DataFrame(np.arange(30.).reshape(10, 3), columns=pd.MultiIndex
+                          .from_tuples([('Times', 'times'), ('V', 'velocities'),
+                                        ('G', 'gears')]))
+        pa = pd.DataFrame({'Value': [1.0, (1, 2), 'id']}, index=pd.MultiIndex
+                          .from_tuples([('A', 'a'), ('A', 'b'), ('B', 'c')]))
+        info = pd.DataFrame({'a': [1, 2]}), pd.DataFrame({'b': [b'x', 'y']})
+        data = {'output.prediction.nedc_h.ts': ts, 'output.nedc_h.pa': pa,
+                'proc_info': list(info)}
+        tpl = _get_co2mpas_output_template_fpath()
+
+        with tempfile.TemporaryDirectory() as folder:
+            books = []
+            for fast in (False, True):
+                fpath = os.path.join(folder, '%s.xlsx' % fast)
+                co2_excel.write_to_excel(data, fpath, tpl, fast=fast)
+                books.append(xlrd.open_workbook(fpath))
+            ref, book = books
+
+            self.assertEqual(book.sheet_names(), ref.sheet_names())
+            for name in ref.sheet_names():
+                sh, sh_ref = book.sheet_by_name(name), ref.sheet_by_name(name)
+                self.assertEqual(
+                    [sh.row_values(i) for i in range(sh.nrows)],
+                    [sh_ref.row_values(i) for i in range(sh_ref.nrows)]
+                )
+            names = {(n.name, n.scope): n.formula_text for n in ref.name_obj_list}
+            self.assertEqual(
+                {(n.name, n.scope): n.formula_text for n in book.name_obj_list},
+                names
+            )
+
+            tables = dict(co2_columnar._output_tables(data))
+            self.assertEqual(sorted(tables), sorted(data)[:2])
+            self.assertEqual(list(tables['output.prediction.nedc_h.ts']),
+                             ['times', 'velocities', 'gears'])
+            self.assertEqual(tables['output.nedc_h.pa'].values.tolist(), [
+                ['A', 'a', '1.0'], ['A', 'b', '(1, 2)'], ['B', 'c', 'id']
+            ])
+
+    def test_write_order(self):
+        import xlrd
+        df = pd.DataFrame({'a': [1, 2]})
+        with tempfile.TemporaryDirectory() as folder:
+            fpath = os.path.join(folder, 'out.xlsx')
+            writer = co2_excel.StreamWriter(fpath)
+            writer.add_sheet('memory', constant_memory=False)
+            for sheet in ('stream', 'memory'):
+                df.to_excel(writer, sheet, index=False, startrow=3)
+                df.to_excel(writer, sheet, index=False, header=False,
+                            startrow=6)
+            self.assertRaises(ValueError, df.to_excel, writer, 'stream',
+                              index=False)
+            df.to_excel(writer, 'memory', index=False)
+            writer.save()
+
+            book = xlrd.open_workbook(fpath)
+            sh = book.sheet_by_name('stream')
+            self.assertEqual(sh.col_values(0), ['', '', '', 'a', 1, 2, 1, 2])
+            sh = book.sheet_by_name('memory')
+            self.assertEqual(sh.col_values(0), ['a', 1, 2, 'a', 1, 2, 1, 2])
+
+    def test_add_template(self):
+        import openpyxl
+        import openpyxl.formatting.rule
+        import xlrd
+        import openpyxl.workbook.defined_name as xl_name
+        with tempfile.TemporaryDirectory() as folder:
+            tpl = os.path.join(folder, 'tpl.xlsx')
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = 'report'
+            ws['A1'], ws['B2'] = 'title', '=1+1'
+            ws.merge_cells('A1:C1')
+            ws.conditional_formatting.add('A2:A3', openpyxl.formatting.rule
+                                          .CellIsRule('greaterThan', ['0']))
+            wb.defined_names.append(xl_name.DefinedName(
+                'title', attr_text='report!$A$1'
+            ))
+            wb.save(tpl)
+
+            cache = os.path.join(folder, 'cache')
+            snapshot = co2_excel._template_snapshot(tpl, cache)
+            self.assertEqual(snapshot[1], [('title', None, 'report!$A$1')])
+            co2_excel._cached_template_snapshot.cache_clear()
+            self.assertEqual(co2_excel._template_snapshot(tpl, cache),
+                             snapshot)
+            self.assertTrue(os.listdir(cache))
+
+            fpath = os.path.join(folder, 'out.xlsx')
+            writer = co2_excel.StreamWriter(fpath)
+            writer.add_template(tpl, cache)
+            pd.DataFrame({'a': [1]}).to_excel(writer, 'report', index=False,
+                                              header=False, startrow=2)
+            pd.DataFrame({'a': [0]}).to_excel(writer, 'report', index=False,
+                                              header=False, startrow=1)
+            writer.save()
+
+            book = xlrd.open_workbook(fpath)
+            sh = book.sheet_by_name('report')
+            self.assertEqual(sh.col_values(0), ['title', 0, 1])
+            self.assertEqual(sh.merged_cells, [(0, 1, 0, 3)])
+            ws = openpyxl.load_workbook(fpath)['report']
+            self.assertEqual(
+                {k: [(r.type, r.operator, r.formula) for r in v]
+                 for k, v in ws.conditional_formatting.cf_rules.items()},
+                {'A2:A3': [('cellIs', 'greaterThan', ['0'])]}
+            )
+            self.assertEqual(
+                [(n.name, n.formula_text) for n in book.name_obj_list],
+                [('title', 'report!$A$1')]
+            )
+
+    def test_xl_value(self):
+        values = np.int64(1), np.float32(0.5), np.bool_(True), (1, 2), 'id'
+        res = [co2_excel._xl_value(v) for v in values]
+        self.assertEqual(res, [1, 0.5, True, '(1, 2)', 'id'])
+        self.assertEqual(list(map(type, res)), [int, float, bool, str, str])
@@ -91,6 +91,23 @@ class Main(unittest.TestCase):
             cmd = "batch %s -O %s" % (inp, out)
             cmain._main(*cmd.split())
 
+    def test_run_empty_jobs(self):
+        with tempfile.TemporaryDirectory() as inp, \
+                tempfile.TemporaryDirectory() as out:
+            cmd = "template %s/tt1 %s/tt2" % (inp, inp)
+            cmain._main(*cmd.split())
+            cmd = "batch --jobs=2 %s -O %s" % (inp, out)
+            cmain._main(*cmd.split())
+
+    def test_run_bad_jobs(self):
+        with tempfile.TemporaryDirectory() as inp, \
+                tempfile.TemporaryDirectory() as out:
+            cmd = "template %s/tt" % inp
+            cmain._main(*cmd.split())
+            cmd = "batch --jobs=-1 %s -O %s" % (inp, out)
+            with self.assertRaises(cmain.CmdException):
+                cmain._main(*cmd.split())
+
     #@unittest.skip('Takes too long.')  # DO NOT COMIT AS SKIPPED!!
     def test_run_demos(self):
         with tempfile.TemporaryDirectory() as inp, \
@@ -0,0 +1,86 @@
+#! python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import co2mpas.dispatcher.utils as dsp_utl
+from co2mpas.batch import vehicle_processing_model
+from co2mpas.model import predict_cycles
+
+mydir = os.path.dirname(__file__)
+
+
+class PredictCycles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        fpath = os.path.join(mydir, '..', 'co2mpas', 'demos',
+                             'co2mpas_demo-1.xlsx')
+        with tempfile.TemporaryDirectory() as folder:
+            kw = {
+                'output_folder': folder, 'cache_folder': folder,
+                'overwrite_cache': True, 'timestamp': 'test',
+                'variation': {'flag.only_summary': True}
+            }
+            model = dsp_utl.SubDispatch(vehicle_processing_model())
+            sol = model({'input_file_name': fpath}, kw)['solution']
+        cls.sol = sol['dsp_solution']
+
+    def test_predict_cycles(self):
+        sol, o = self.sol, ['co2_emission_value']
+        models = sol['data.prediction.models_nedc_h']
+        base = sol['input.prediction.nedc_h']
+        cycles = [{}] + [{'velocities': base['velocities'] * f}
+                         for f in (0.9, 1.1)]
+
+        res = predict_cycles(models, cycles, base=base, outputs=o)
+        self.assertEqual(len(res), 3)
+        self.assertEqual(
+            res[0], dsp_utl.selector(o, sol['output.prediction.nedc_h'])
+        )
+        self.assertNotEqual(res[1], res[2])
+
+        par = predict_cycles(models, cycles, base=base, outputs=o, jobs=2)
+        self.assertEqual(res, par)
+
+        res = predict_cycles(models, cycles[1:2], base=base)[0]
+        np.testing.assert_array_equal(res['velocities'], cycles[1]['velocities'])
+        self.assertEqual(res['co2_emission_value'], par[1][o[0]])
+
+    def test_model_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from co2mpas.model import model
+
+        class Executor(ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super(Executor, self).__init__(*args, **kwargs)
+                self.submitted = []
+
+            def submit(self, fun, *args, **kwargs):
+                self.submitted.append(fun)
+                return super(Executor, self).submit(fun, *args, **kwargs)
+
+        with Executor(4) as executor:
+            sol = model().dispatch(self.sol.inputs, executor=executor)
+
+        # The calibrations and predictions of the cycles are submitted.
+        self.assertGreaterEqual(len(executor.submitted), 11)
+        for k in ('wltp_h', 'wltp_l'):
+            n = sol.workflow.node['calibrate_with_%s' % k]
+            self.assertIsNot(n['solution'], self.sol.workflow.node[
+                'calibrate_with_%s' % k]['solution'])
+
+        for k in ('nedc_h', 'nedc_l', 'wltp_h', 'wltp_l'):
+            k = 'output.prediction.%s' % k
+            self.assertEqual(sorted(sol[k]), sorted(self.sol[k]))
+            for i, v in self.sol[k].items():
+                if isinstance(v, (np.ndarray, float, int, str)):  # No models.
+                    np.testing.assert_array_equal(sol[k][i], v, err_msg=i)
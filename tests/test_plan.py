@@ -0,0 +1,50 @@
+#! python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import co2mpas.dispatcher.utils as dsp_utl
+from co2mpas.io import excel, schema
+from co2mpas.plan import make_simulation_plan
+
+mydir = os.path.dirname(__file__)
+
+
+class SimulationPlan(unittest.TestCase):
+    def test_plan_jobs(self):
+        fpath = os.path.join(mydir, '..', 'co2mpas', 'demos',
+                             'co2mpas_demo-0.xlsx')
+        plan = pd.DataFrame({
+            'prediction.wltp.initial_temperature': [70.0, 80.0],
+            'run_base': [False, False]
+        })
+        plan = excel._add_index_plan(plan, os.path.abspath(fpath))
+        plan = schema.validate_plan(plan, True, False, False)
+
+        res = []
+        with tempfile.TemporaryDirectory() as folder:
+            for jobs in (1, 2):
+                flag = {
+                    'overwrite_cache': False, 'output_folder': folder,
+                    'cache_folder': folder, 'plan_jobs': jobs
+                }
+                summary = make_simulation_plan(
+                    plan, 'test', {'flag.only_summary': True}, flag
+                )
+                res.append(dict(dsp_utl.stack_nested_keys(summary)))
+
+        serial, parallel = res
+        self.assertTrue(serial)
+        self.assertEqual(set(serial), set(parallel))
+        for k, v in serial.items():
+            np.testing.assert_equal(parallel[k], v, err_msg=str(k))
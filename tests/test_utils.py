@@ -0,0 +1,24 @@
+#! python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from co2mpas.utils import intervals_mask
+
+
+class TestIntervalsMask(unittest.TestCase):
+    def test_intervals_mask(self):
+        rng, n = np.random.RandomState(0), 500
+        i, j = rng.randint(-5, n + 5, (2, 50))
+        res = np.zeros(n, dtype=bool)
+        for s, e in zip(i, j):
+            res[max(s, 0):max(e, 0)] = True
+        npt.assert_array_equal(intervals_mask(n, i, j), res)
@@ -0,0 +1,66 @@
+#! python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2016 European Commission (JRC);
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import openpyxl
+import xlrd
+
+import co2mpas.io.xlsx as co2_xlsx
+
+
+class TestXlsx(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.fpath = os.path.join(self.folder.name, 'book.xlsx')
+        wb = openpyxl.Workbook()
+        ts = wb.active
+        ts.title = 'ts'
+        ts.append(['times', 'velocities', 'gears'])
+        for i in range(100):
+            ts.append([i * 0.1, i ** 0.5, i % 6])
+        ts.merge_cells('E1:F2')
+        pa = wb.create_sheet('pa')
+        pa.append(['a', True, datetime.datetime(2016, 1, 1), '=1+1', None, 3])
+        wb.save(self.fpath)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _check_sheets(self, book):
+        ref = xlrd.open_workbook(self.fpath)
+        self.assertEqual(book.sheet_names(), ref.sheet_names())
+        for name in ref.sheet_names():
+            sh, sh_ref = book.sheet_by_name(name), ref.sheet_by_name(name)
+            self.assertEqual(sh._cell_types, sh_ref._cell_types)
+            self.assertEqual(sh._cell_values, sh_ref._cell_values)
+            self.assertEqual(sh.merged_cells, sh_ref.merged_cells)
+
+    def test_open_workbook(self):
+        with co2_xlsx.open_workbook(self.fpath) as book:
+            self.assertFalse(book.sheet_loaded('ts'))
+            self._check_sheets(book)
+            self.assertTrue(book.sheet_loaded('ts'))
+            zf = book._zf
+        self.assertIsNone(zf.fp)
+
+    def test_open_workbook_without_xlsx(self):
+        with mock.patch.object(co2_xlsx, 'xl_xlsx', None):
+            book = co2_xlsx.open_workbook(self.fpath)
+        self.assertNotIsInstance(book, co2_xlsx._Book)
+        self._check_sheets(book)
+
+    def test_column_index(self):
+        self.assertEqual(
+            [co2_xlsx._column_index(c) for c in (b'A', b'Z', b'AA', b'XFD')],
+            [0, 25, 26, 16383]
+        )